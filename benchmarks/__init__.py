@@ -0,0 +1 @@
+"""Micro-benchmarks for aria's core data paths (not shipped with the package)"""
@@ -0,0 +1,87 @@
+import math
+import random
+from typing import Dict, List, Any
+
+PRIORITIES = ["high", "medium", "low"]
+PRIORITY_WEIGHTS = [0.25, 0.5, 0.25]
+SKILLS = [[], ["backend"], ["frontend"], ["devops"], ["backend", "database"]]
+VERBS = ["Implement", "Design", "Add", "Refactor", "Test", "Document", "Integrate", "Configure"]
+NOUNS = ["authentication", "checkout flow", "user profile", "search index", "payment webhook",
+         "admin dashboard", "email notifications", "API gateway", "caching layer", "audit log"]
+
+def make_plan(
+    tasks: int,
+    seed: int = 0,
+    module_size: int = 20,
+    dependency_density: float = 1.5,
+    completed_ratio: float = 0.1
+) -> Dict[str, Any]:
+    """Seeded synthetic plan shaped like a decomposer result
+
+    Modules hold about ``module_size`` tasks. Each task depends on
+    ``dependency_density`` earlier tasks on average; most dependencies
+    point inside the same module and the rest at recent modules, as in
+    AI-generated plans.
+    """
+
+    rng = random.Random(seed)
+    modules: List[Dict[str, Any]] = []
+    all_ids: List[str] = []
+
+    while len(all_ids) < tasks:
+        m = len(modules)
+        size = min(tasks - len(all_ids), max(1, int(rng.gauss(module_size, module_size / 4))))
+        module_start = len(all_ids)
+        module_tasks = []
+
+        for _ in range(size):
+            i = len(all_ids)
+            task_id = f"task-{i:06d}"
+            noun = rng.choice(NOUNS)
+
+            dependencies = set()
+            for _ in range(_poisson(rng, dependency_density)):
+                if i == 0:
+                    break
+                if i > module_start and rng.random() < 0.7:
+                    j = rng.randrange(module_start, i)
+                else:
+                    j = rng.randrange(max(0, module_start - 3 * module_size), i)
+                dependencies.add(all_ids[j])
+
+            module_tasks.append({
+                "id": task_id,
+                "title": f"{rng.choice(VERBS)} {noun} {i}",
+                "description": f"{rng.choice(VERBS)} the {noun} for module {m} with tests and error handling.",
+                "estimated_hours": rng.choice([1, 2, 3, 4, 6, 8, 12, 16]),
+                "priority": rng.choices(PRIORITIES, PRIORITY_WEIGHTS)[0],
+                "status": "completed" if rng.random() < completed_ratio else "pending",
+                "dependencies": sorted(dependencies),
+                "skills": rng.choice(SKILLS),
+                "acceptance_criteria": [f"{noun.capitalize()} criterion {k + 1}" for k in range(rng.randint(1, 3))],
+            })
+            all_ids.append(task_id)
+
+        modules.append({
+            "id": f"module-{m:05d}",
+            "name": f"Module {m}: {rng.choice(NOUNS).title()}",
+            "description": f"Everything related to {rng.choice(NOUNS)}.",
+            "estimated_hours": sum(t["estimated_hours"] for t in module_tasks),
+            "tasks": module_tasks,
+        })
+
+    return {
+        "goal": f"Synthetic benchmark plan with {tasks} tasks",
+        "architecture_overview": "Layered web application with an API, workers and a single-page frontend.",
+        "tech_stack": "Next.js, TypeScript, PostgreSQL",
+        "top_modules": modules,
+    }
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    """Small Poisson sampler (Knuth); fine for the means used here"""
+    threshold = math.exp(-mean)
+    k, p = 0, rng.random()
+    while p > threshold:
+        k += 1
+        p *= rng.random()
+    return k
@@ -0,0 +1,334 @@
+"""Run aria's micro-benchmarks and write machine-readable results
+
+    python -m benchmarks.run --sizes 10,1000,100000 --output bench.json
+    python -m benchmarks.run --compare bench.json   # exit 1 on regressions
+"""
+import argparse
+import asyncio
+import copy
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+from .plans import make_plan
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+
+# Files list_plans scans per size
+CATALOG_FILES = 10
+
+class Benchmark:
+    """A named operation timed against a plan of a given size
+
+    ``prepare(plan, workdir)`` returns ``(setup, run)``: ``setup()`` builds
+    fresh input outside the timed region and ``run(input)`` is timed.
+    """
+
+    def __init__(self, name: str, prepare: Callable, max_tasks: Optional[int] = None):
+        self.name = name
+        self.prepare = prepare
+        self.max_tasks = max_tasks
+
+def _fresh(plan: Dict[str, Any]) -> Callable[[], Dict[str, Any]]:
+    return lambda: copy.deepcopy(plan)
+
+def _same(value: Any) -> Callable[[], Any]:
+    return lambda: value
+
+def prepare_enhance(plan, workdir):
+    from aria.core.decomposer import TaskDecomposer
+    decomposer = TaskDecomposer(plan["goal"], plan["tech_stack"])
+    return _fresh(plan), decomposer._enhance_plan
+
+def prepare_validate(plan, workdir):
+    from aria.core.decomposer import TaskDecomposer
+    decomposer = TaskDecomposer(plan["goal"], plan["tech_stack"])
+    return _same(decomposer._enhance_plan(copy.deepcopy(plan))), decomposer._validate_plan
+
+def prepare_save(plan, workdir):
+    from aria.core.plans_manager import PlansManager
+    manager = PlansManager(workdir / "plans")
+    return _same(plan), lambda p: manager.save_plan(p, workdir / "save.json")
+
+def prepare_load(plan, workdir):
+    from aria.core.plans_manager import PlansManager
+    manager = PlansManager(workdir / "plans")
+    path = manager.save_plan(plan, workdir / "load.json")
+    return _same(path), manager.load_plan
+
+def _catalog(plan, workdir):
+    from aria.core.plans_manager import PlansManager
+    manager = PlansManager(workdir / "catalog")
+    for i in range(CATALOG_FILES):
+        manager.save_plan(plan, manager.plans_dir / f"plan_{i}.json")
+    return manager
+
+def prepare_list_cold(plan, workdir):
+    from aria.core import plans_manager
+    manager = _catalog(plan, workdir)
+    return plans_manager._catalog_cache.clear, lambda _: manager.list_plans()
+
+def prepare_list_warm(plan, workdir):
+    manager = _catalog(plan, workdir)
+    manager.list_plans()
+    return _same(None), lambda _: manager.list_plans()
+
+def prepare_export(format: str):
+    def prepare(plan, workdir):
+        from aria.core.plans_manager import PlansManager
+        manager = PlansManager(workdir / "plans")
+        return _same(plan), lambda p: manager.export_plan(p, format)
+    return prepare
+
+def prepare_summary(plan, workdir):
+    from aria.utils.formatting import format_plan_summary
+    return _same(plan), format_plan_summary
+
+def prepare_project_tree(plan, workdir):
+    from rich.console import Console
+    from aria.utils.formatting import create_project_tree
+
+    def run(p):
+        Console(file=io.StringIO(), width=120).print(create_project_tree(p))
+    return _same(plan), run
+
+def prepare_plan_table(plan, workdir):
+    from rich.console import Console
+    from aria.utils import formatting
+
+    def run(p):
+        original = formatting.console
+        formatting.console = Console(file=io.StringIO(), width=120)
+        try:
+            formatting.display_plan_table(p)
+        finally:
+            formatting.console = original
+    return _same(plan), run
+
+def prepare_plan_table_page(plan, workdir):
+    """The last 50-task page, rendered with a warm render cache"""
+    from rich.console import Console
+    from aria.utils import formatting
+
+    pages = max(1, -(-formatting.count_tasks(plan) // 50))
+
+    def run(p):
+        original = formatting.console
+        formatting.console = Console(file=io.StringIO(), width=120)
+        try:
+            formatting.display_plan_table(p, pages, 50)
+        finally:
+            formatting.console = original
+    return _same(plan), run
+
+def prepare_stream_rows(plan, workdir):
+    from aria.utils.formatting import stream_task_rows
+    return _same(plan), lambda p: stream_task_rows(p, io.StringIO())
+
+def prepare_task_tree_compose(plan, workdir):
+    from aria.tui.components.task_tree import TaskTree
+    return _same(plan), lambda p: list(TaskTree(p).compose())
+
+def prepare_task_viewer_compose(plan, workdir):
+    from aria.tui.task_viewer import TaskViewer
+    return _same(plan), lambda p: list(TaskViewer(p).compose())
+
+def prepare_task_index(plan, workdir):
+    from aria.tui.search import TaskIndex
+    return _same(plan), TaskIndex
+
+def prepare_task_search(plan, workdir):
+    """A two-term query, one term with a typo, against a prebuilt index"""
+    from aria.tui.search import TaskIndex
+    return _same(TaskIndex(plan)), lambda index: index.search("high authentcation")
+
+def prepare_task_tree_mount(plan, workdir):
+    """Time to first frame of a headless app showing the TaskTree"""
+    from textual.app import App
+    from aria.tui.components.task_tree import TaskTree
+
+    class TreeApp(App):
+        def compose(self):
+            yield TaskTree(plan)
+
+    async def mount():
+        async with TreeApp().run_test(size=(120, 40)) as pilot:
+            await pilot.pause()
+
+    return _same(None), lambda _: asyncio.run(mount())
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("enhance_plan", prepare_enhance),
+    Benchmark("validate_plan", prepare_validate),
+    Benchmark("save_plan", prepare_save),
+    Benchmark("load_plan", prepare_load),
+    Benchmark("list_plans_cold", prepare_list_cold),
+    Benchmark("list_plans_warm", prepare_list_warm),
+    Benchmark("export_markdown", prepare_export("markdown")),
+    Benchmark("export_yaml", prepare_export("yaml"), max_tasks=10000),
+    Benchmark("format_plan_summary", prepare_summary),
+    Benchmark("create_project_tree", prepare_project_tree, max_tasks=10000),
+    Benchmark("display_plan_table", prepare_plan_table, max_tasks=10000),
+    Benchmark("plan_table_page", prepare_plan_table_page),
+    Benchmark("stream_task_rows", prepare_stream_rows),
+    Benchmark("task_tree_compose", prepare_task_tree_compose),
+    Benchmark("task_viewer_compose", prepare_task_viewer_compose),
+    Benchmark("task_tree_mount", prepare_task_tree_mount),
+    Benchmark("task_index_build", prepare_task_index),
+    Benchmark("task_search", prepare_task_search),
+]
+
+def time_benchmark(benchmark: Benchmark, plan: Dict[str, Any], workdir: Path, repeat: int, budget: float) -> Dict[str, Any]:
+    """Run a benchmark up to ``repeat`` times, stopping early once ``budget`` seconds are spent"""
+
+    setup, run = benchmark.prepare(plan, workdir)
+    timings: List[float] = []
+    spent = 0.0
+    while len(timings) < repeat and (not timings or spent < budget):
+        value = setup()
+        start = time.perf_counter()
+        run(value)
+        elapsed = time.perf_counter() - start
+        timings.append(elapsed)
+        spent += elapsed
+
+    return {
+        "runs": len(timings),
+        "min_s": min(timings),
+        "median_s": statistics.median(timings),
+        "mean_s": statistics.fmean(timings),
+    }
+
+def run_benchmarks(
+    sizes: List[int],
+    seed: int = 0,
+    repeat: int = 5,
+    budget: float = 2.0,
+    only: Optional[List[str]] = None,
+    no_limits: bool = False,
+    progress: Callable[[str], None] = lambda message: None
+) -> Dict[str, Any]:
+    """Run every selected benchmark at every size and return the results document"""
+
+    selected = [b for b in BENCHMARKS if not only or any(pattern in b.name for pattern in only)]
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="aria-bench-") as tmp:
+        for size in sizes:
+            plan = make_plan(size, seed=seed)
+            for benchmark in selected:
+                if benchmark.max_tasks and size > benchmark.max_tasks and not no_limits:
+                    continue
+                workdir = Path(tmp) / f"{benchmark.name}-{size}"
+                workdir.mkdir()
+                progress(f"{benchmark.name} [{size} tasks]")
+                timing = time_benchmark(benchmark, plan, workdir, repeat, budget)
+                results.append({"benchmark": benchmark.name, "tasks": size, **timing})
+
+    return {"meta": _metadata(seed), "results": results}
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """Median ratios against a baseline results document"""
+
+    before = {(r["benchmark"], r["tasks"]): r for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        old = before.get((result["benchmark"], result["tasks"]))
+        if old is None or old["median_s"] <= 0:
+            continue
+        ratio = result["median_s"] / old["median_s"]
+        rows.append({
+            "benchmark": result["benchmark"],
+            "tasks": result["tasks"],
+            "baseline_s": old["median_s"],
+            "current_s": result["median_s"],
+            "ratio": ratio,
+            "regression": ratio > threshold,
+        })
+    return rows
+
+def _metadata(seed: int) -> Dict[str, Any]:
+    import aria
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=Path(__file__).resolve().parent, timeout=5
+        ).stdout.strip() or None
+    except Exception:
+        commit = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "aria_version": aria.__version__,
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": seed,
+    }
+
+def _quiet_aria(workdir: Path):
+    """Keep benchmark runs from logging to the console or the working directory"""
+    from aria.config import config
+    config.LOGS_DIR = str(workdir / "logs")
+    config.PLANS_DIR = str(workdir / "plans")
+    config.LOG_LEVEL = "WARNING"
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated task counts")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5, help="Maximum runs per benchmark and size")
+    parser.add_argument("--budget", type=float, default=2.0, help="Seconds after which to stop repeating")
+    parser.add_argument("--only", action="append", help="Run benchmarks whose name contains this (repeatable)")
+    parser.add_argument("--no-limits", action="store_true", help="Run slow benchmarks above their size cap too")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Median ratio counted as a regression")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="aria-bench-env-") as env_dir:
+        _quiet_aria(Path(env_dir))
+        report = run_benchmarks(
+            [int(size) for size in args.sizes.split(",") if size.strip()],
+            seed=args.seed,
+            repeat=args.repeat,
+            budget=args.budget,
+            only=args.only,
+            no_limits=args.no_limits,
+            progress=lambda message: print(f"  {message}", file=sys.stderr),
+        )
+
+    print(f"{'benchmark':<22} {'tasks':>7} {'median':>11} {'min':>11} {'runs':>5}")
+    for r in report["results"]:
+        print(f"{r['benchmark']:<22} {r['tasks']:>7} {r['median_s'] * 1000:>9.2f}ms {r['min_s'] * 1000:>9.2f}ms {r['runs']:>5}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        rows = compare(report, json.loads(args.compare.read_text()), args.threshold)
+        regressions = [row for row in rows if row["regression"]]
+        print(f"\nCompared with {args.compare}: {len(regressions)} regression(s) above {args.threshold:.2f}x")
+        for row in sorted(rows, key=lambda row: -row["ratio"]):
+            marker = "  <-- regression" if row["regression"] else ""
+            print(f"{row['benchmark']:<22} {row['tasks']:>7} {row['ratio']:>6.2f}x{marker}")
+        if regressions:
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
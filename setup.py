@@ -16,6 +16,7 @@ setup(
     long_description_content_type="text/markdown",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    package_data={"aria": ["templates/**/*"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -31,6 +32,9 @@ setup(
     python_requires=">=3.8",
     install_requires=requirements,
     extras_require={
+        "risk": [
+            "numpy>=1.22.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "black>=23.0.0",
@@ -40,7 +44,7 @@ setup(
     },
     entry_points={
         "console_scripts": [
-            "aria=aria.cli:app",
+            "aria=aria.server.client:main",
         ],
     },
     include_package_data=True,
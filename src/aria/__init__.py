@@ -4,6 +4,11 @@ __version__ = "0.1.0"
 __author__ = "Achref Riahi"
 __email__ = "achref.riahi@example.com"
 
-from .cli import app
+__all__ = ["app"]
 
-__all__ = ["app"]
\ No newline at end of file
+def __getattr__(name):
+    # Import the CLI lazily so importing any aria submodule stays cheap
+    if name == "app":
+        from .cli import app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
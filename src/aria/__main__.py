@@ -0,0 +1,4 @@
+"""Entry point for ``python -m aria``"""
+from .server.client import main
+
+main()
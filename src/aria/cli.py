@@ -1,24 +1,64 @@
 import json
 import typer
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from rich.console import Console
-from rich.panel import Panel
-from rich.markdown import Markdown
 
-from .config import config
-from .core.decomposer import TaskDecomposer
-from .core.plans_manager import PlansManager
-from .tui.dashboard import run_tui
-from .utils.logger import setup_logger
+# Heavy modules (AI engine, TUI, plans, config/.env loading) are imported
+# inside the commands that need them so `aria --help` and `aria version`
+# start fast; tests/test_startup.py enforces this.
 
 app = typer.Typer(
     name="aria",
     help="🌀 Achref Riahi AI Assistant - Open-source AI coding architect",
     rich_markup_mode="rich"
 )
+plan_app = typer.Typer(help="Inspect and analyze saved project plans")
+app.add_typer(plan_app, name="plan")
 console = Console()
-logger = setup_logger()
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    profile: bool = typer.Option(False, "--profile", help="Profile the command (cProfile, stack samples, network vs CPU time)"),
+    profile_output: Path = typer.Option(Path("aria-profile"), "--profile-output", help="Prefix for the .pstats and .collapsed files"),
+    profile_memory: bool = typer.Option(False, "--profile-memory", help="Also trace memory allocations with tracemalloc"),
+    profile_top: int = typer.Option(25, "--profile-top", help="Functions listed in the profile summary"),
+    trace: bool = typer.Option(False, "--trace", help="Print a span waterfall of the command's stages"),
+    trace_output: Optional[Path] = typer.Option(None, "--trace-output", help="Write spans as an OTLP/JSON file"),
+):
+    """Global options"""
+    if trace or trace_output:
+        from .utils.tracing import enable_tracing, export_otlp, format_waterfall, stop_tracing
+        
+        def report_trace():
+            spans = stop_tracing()
+            if trace_output:
+                export_otlp(spans, trace_output)
+            if trace:
+                err_console = Console(stderr=True)
+                err_console.print("\n🧭 [bold]Trace[/bold]")
+                err_console.print(format_waterfall(spans), markup=False, highlight=False, soft_wrap=True)
+            if trace_output:
+                Console(stderr=True).print(f"Trace: {trace_output} ({len(spans)} spans)", markup=False, highlight=False, soft_wrap=True)
+        
+        enable_tracing()
+        ctx.call_on_close(report_trace)
+    
+    if profile or profile_memory:
+        from .utils.profiling import Profiler, format_report
+        
+        profiler = Profiler(profile_output, top=profile_top, memory=profile_memory)
+        
+        def report_profile():
+            # Summary goes to stderr so command output can still be piped
+            summary = format_report(profiler.stop())
+            err_console = Console(stderr=True)
+            err_console.print("\n⏱️  [bold]Profile[/bold]")
+            err_console.print(summary, markup=False, highlight=False, soft_wrap=True)
+        
+        ctx.call_on_close(report_profile)
+        profiler.start()
 
 @app.command()
 def version():
@@ -32,6 +72,8 @@ def decompose(
     output: Path = typer.Option(None, help="Output plan file path"),
     tech_stack: str = typer.Option("", help="Technology stack (e.g., 'Next.js, TypeScript, Tailwind')"),
     constraints: str = typer.Option("", help="Project constraints separated by commas"),
+    similar: bool = typer.Option(False, "--similar", help="Look for a near-duplicate saved plan to reuse, or to seed the AI with"),
+    reuse: Optional[bool] = typer.Option(None, "--reuse/--no-reuse", help="Reuse a near-duplicate saved plan without asking (implies --similar), or never (default: ask)"),
 ):
     """
     Decompose a project goal into structured development plan
@@ -39,6 +81,11 @@ def decompose(
     Example:
     [bold]aria decompose[/bold] "Build an AI-powered ecommerce platform with Next.js and Stripe"
     """
+    from rich.panel import Panel
+    from .config import config
+    from .core.decomposer import TaskDecomposer
+    from .core.plans_manager import PlansManager
+    
     try:
         config.validate()
         
@@ -56,8 +103,18 @@ def decompose(
         # Initialize decomposer
         decomposer = TaskDecomposer(goal, tech_stack, constraint_list)
         
+        # Ask before the spinner starts, then hand run() the plan that was offered;
+        # saved plans are only consulted with --similar or --reuse
+        similar_plan = None
+        use_similar = False
+        if reuse is True or (similar and reuse is not False):
+            similar_plan = decomposer.find_similar_plan(exclude=output)
+            if similar_plan is not None:
+                console.print(f"♻️  [bold]Similar saved plan ({similar_plan['similarity']:.0%}):[/bold] {similar_plan['goal']} [dim]({similar_plan['file']})[/dim]")
+                use_similar = reuse or typer.confirm("Reuse it instead of a new AI decomposition", default=True)
+        
         with console.status("[bold green]AI is analyzing your project...", spinner="dots"):
-            plan = decomposer.run()
+            plan = decomposer.run(reuse=use_similar, similar=similar_plan or False)
         
         # Save plan
         plans_manager = PlansManager()
@@ -78,7 +135,8 @@ def decompose(
         # Ask if user wants to view in TUI
         console.print(f"\n🎨 [bold]Open in TUI dashboard?[/bold]")
         if typer.confirm("Launch interactive view"):
-            run_tui(plan)
+            from .tui.dashboard import run_tui
+            run_tui(plan, saved_path)
             
     except Exception as e:
         console.print(f"❌ [bold red]Error:[/bold red] {e}")
@@ -96,9 +154,12 @@ def view(
         raise typer.Exit(1)
     
     try:
+        from .core.plans_manager import PlansManager
+        from .tui.dashboard import run_tui
+        
         plans_manager = PlansManager()
         plan = plans_manager.load_plan(plan_file)
-        run_tui(plan)
+        run_tui(plan, plan_file)
     except Exception as e:
         console.print(f"❌ [bold red]Error loading plan: {e}[/bold red]")
         raise typer.Exit(1)
@@ -111,12 +172,12 @@ def analyze(
     """
     Analyze existing project structure and generate insights
     """
-    from .plugins.base import PluginManager
+    from .plugins.base import get_plugin_manager
     
     try:
         console.print(f"🔍 [bold cyan]Analyzing project: {path}[/bold cyan]")
         
-        plugin_manager = PluginManager()
+        plugin_manager = get_plugin_manager()
         analysis = plugin_manager.analyze_project(path)
         
         if output:
@@ -135,6 +196,72 @@ def analyze(
         console.print(f"❌ [bold red]Analysis failed: {e}[/bold red]")
         raise typer.Exit(1)
 
+@app.command()
+def review(
+    path: Path = typer.Argument(..., help="File or directory to review"),
+    output: Path = typer.Option(None, help="Write the full report as JSON"),
+    workers: Optional[int] = typer.Option(None, help="Concurrent AI requests (default: REVIEW_WORKERS)"),
+    chunk_tokens: Optional[int] = typer.Option(None, help="Source tokens per AI request (default: REVIEW_CHUNK_TOKENS)"),
+    limit: int = typer.Option(20, help="Findings to list, most severe first"),
+):
+    """
+    AI code review of a file or a whole project
+    
+    Example:
+    [bold]aria review[/bold] src/
+    """
+    from rich.progress import Progress, BarColumn, MofNCompleteColumn, TextColumn
+    from rich.table import Table
+    from .config import config
+    from .core.reviewer import ProjectReviewer, SEVERITIES
+    
+    if not path.exists():
+        console.print(f"❌ [bold red]Path not found: {path}[/bold red]")
+        raise typer.Exit(1)
+    
+    try:
+        config.validate()
+        reviewer = ProjectReviewer(workers=workers, chunk_tokens=chunk_tokens)
+        
+        with Progress(TextColumn("[bold green]Reviewing"), BarColumn(), MofNCompleteColumn(), console=console, transient=True) as progress:
+            bar = progress.add_task("review", total=None)
+            report = reviewer.review(path, on_progress=lambda done, total: progress.update(bar, completed=done, total=total))
+        
+        if output:
+            with open(output, 'w') as f:
+                json.dump(report, f, indent=2)
+            console.print(f"✅ [bold green]Report saved to: {output}[/bold green]")
+        
+        summary = report["summary"]
+        console.print(f"\n📊 [bold]Review Summary:[/bold]")
+        console.print(f"   • Files Reviewed: [cyan]{report['files_reviewed']}[/cyan] in [cyan]{report['chunks']}[/cyan] requests")
+        severities = ", ".join(f"{count} {severity}" for severity, count in summary["by_severity"].items() if count)
+        console.print(f"   • Findings: [cyan]{summary['findings']}[/cyan]" + (f" ({severities})" if severities else ""))
+        if report["failed_chunks"]:
+            failed_files = sum(len(chunk["files"]) for chunk in report["failed_chunks"])
+            console.print(f"   • [yellow]{len(report['failed_chunks'])} requests failed ({failed_files} files not reviewed)[/yellow]")
+        
+        findings = [finding for file_report in report["files"].values() for finding in file_report["findings"]]
+        findings.sort(key=lambda f: SEVERITIES.index(f["severity"]))
+        if findings and limit > 0:
+            table = Table(title=f"Top findings ({min(limit, len(findings))} of {len(findings)})")
+            table.add_column("Severity", style="bold")
+            table.add_column("Location", style="cyan")
+            table.add_column("Finding")
+            for finding in findings[:limit]:
+                location = f"{finding['file']}:{finding['line']}" if finding["line"] else finding["file"]
+                table.add_row(finding["severity"], location, finding["message"])
+            console.print(table)
+        
+        if report["failed_chunks"] and not report["chunks"] - len(report["failed_chunks"]):
+            raise typer.Exit(1)
+            
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"❌ [bold red]Review failed: {e}[/bold red]")
+        raise typer.Exit(1)
+
 @app.command()
 def new(
     template: str = typer.Argument(..., help="Project template (nextjs, flask, etc.)"),
@@ -144,12 +271,12 @@ def new(
     """
     Scaffold new project from template
     """
-    from .plugins.base import PluginManager
+    from .plugins.base import get_plugin_manager
     
     try:
         console.print(f"🏗️  [bold cyan]Creating new {template} project: {name}[/bold cyan]")
         
-        plugin_manager = PluginManager()
+        plugin_manager = get_plugin_manager()
         result = plugin_manager.scaffold_project(template, name, path)
         
         if result.get("success"):
@@ -171,6 +298,8 @@ def new(
 def run(
     plan_file: Path = typer.Argument(..., help="Plan file to execute"),
     interactive: bool = typer.Option(True, help="Run in interactive mode"),
+    workers: Optional[int] = typer.Option(None, help="Worker processes for code generation (default: GENERATION_WORKERS)"),
+    force: bool = typer.Option(False, help="Regenerate every file, ignoring the build manifest"),
 ):
     """
     Execute project plan step-by-step
@@ -180,6 +309,8 @@ def run(
         raise typer.Exit(1)
     
     try:
+        from rich.panel import Panel
+        from .core.plans_manager import PlansManager
         from .core.runner import PlanRunner
         
         plans_manager = PlansManager()
@@ -192,16 +323,288 @@ def run(
             border_style="green"
         ))
         
-        runner = PlanRunner(plan)
+        runner = PlanRunner(plan, workers=workers)
         
         if interactive:
             runner.run_interactive()
         else:
-            runner.run_automated()
+            runner.run_automated(force=force)
             
     except Exception as e:
         console.print(f"❌ [bold red]Execution failed: {e}[/bold red]")
         raise typer.Exit(1)
 
+@app.command()
+def serve(
+    socket_path: Optional[Path] = typer.Option(None, "--socket", help="Unix socket path (default: ARIA_SOCKET or a per-user runtime path)"),
+    cache_size: int = typer.Option(256, help="AI responses kept in memory (0 disables the cache)"),
+    stop: bool = typer.Option(False, help="Stop the running daemon"),
+):
+    """
+    Run a long-lived daemon that keeps aria warm for fast repeated commands
+    
+    While it runs, `aria version`, `analyze`, `new` and `plan` are forwarded to it.
+    Forwarded commands use the daemon's environment and configuration.
+    Set ARIA_NO_DAEMON=1 to always run locally.
+    """
+    from .server.client import request, socket_path as default_path
+    from .server.daemon import AriaDaemon
+    
+    if stop:
+        path = str(socket_path or default_path())
+        if request({"op": "shutdown"}, path) is None:
+            console.print(f"❌ [bold red]No aria daemon is listening on {path}[/bold red]")
+            raise typer.Exit(1)
+        console.print(f"✅ [bold green]aria daemon on {path} stopped[/bold green]")
+        return
+    
+    daemon = AriaDaemon(str(socket_path) if socket_path else None, cache_size=cache_size)
+    try:
+        daemon.bind()
+        with console.status("[bold green]Warming up...", spinner="dots"):
+            daemon.warm_up()
+        console.print(f"🌀 [bold cyan]aria daemon listening on {daemon.path}[/bold cyan] (Ctrl+C to stop)")
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n👋 [bold]aria daemon stopped[/bold]")
+    except Exception as e:
+        console.print(f"❌ [bold red]Daemon failed: {e}[/bold red]")
+        raise typer.Exit(1)
+
+@app.command()
+def api(
+    host: str = typer.Option("127.0.0.1", help="Interface to bind"),
+    port: int = typer.Option(8765, help="Port to listen on"),
+    workers: Optional[int] = typer.Option(None, help="Concurrent jobs (default: API_WORKERS)"),
+    db: Optional[Path] = typer.Option(None, help="Job queue database (default: JOBS_DB)"),
+):
+    """
+    Serve a local HTTP/JSON job API for decomposition, generation and analysis
+    
+    Example:
+    [bold]curl -X POST localhost:8765/jobs -H 'Content-Type: application/json' -d '{"type": "decompose", "params": {"goal": "Build a blog"}}'[/bold]
+    """
+    from .config import config
+    from .server.api import ApiServer
+    
+    if host not in ("127.0.0.1", "localhost", "::1") and not config.API_TOKEN:
+        console.print("⚠️  [bold yellow]Listening beyond localhost without ARIA_API_TOKEN set[/bold yellow]")
+    
+    try:
+        server = ApiServer(host, port, workers, db)
+    except Exception as e:
+        console.print(f"❌ [bold red]Could not start API: {e}[/bold red]")
+        raise typer.Exit(1)
+    
+    bound_host, bound_port = server.address
+    console.print(f"🌀 [bold cyan]aria API on http://{bound_host}:{bound_port}[/bold cyan] "
+                  f"({server.pool.workers} worker(s), queue: {server.queue.db_path})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n👋 [bold]aria API stopped[/bold]")
+
+@plan_app.command("show")
+def plan_show(
+    plan_file: Path = typer.Argument(..., help="Plan file to show"),
+    view: str = typer.Option("table", help="How to show the plan (table, tree)"),
+    module: Optional[str] = typer.Option(None, help="Show the details of one module (ID or name)"),
+    page: int = typer.Option(1, min=1, help="Page of tasks to show"),
+    limit: Optional[int] = typer.Option(None, min=1, help="Tasks per page (default: 50 in a terminal, all when piped)"),
+    output_format: str = typer.Option("auto", "--format", help="Output format (auto, rich, tsv); auto writes TSV when stdout is not a terminal"),
+):
+    """
+    Show a saved plan a page at a time
+    """
+    import os
+    import sys
+    from .core.plans_manager import PlansManager
+    from .utils import formatting
+    
+    if not plan_file.exists():
+        console.print(f"❌ [bold red]Plan file not found: {plan_file}[/bold red]")
+        raise typer.Exit(1)
+    
+    try:
+        plan = PlansManager().load_plan(plan_file)
+        
+        if module is not None:
+            matches = [m for m in plan.get("top_modules", []) if module in (m.get("id"), m.get("name"))]
+            if not matches:
+                raise ValueError(f"No module with ID or name '{module}'")
+            plan = {**plan, "top_modules": matches}
+        
+        tsv = output_format == "tsv" or (output_format == "auto" and not console.is_terminal)
+        if tsv:
+            # Rows go out as they are produced instead of as one rendered block
+            formatting.stream_task_rows(plan, sys.stdout, page, limit)
+            return
+        
+        limit = limit or 50
+        if module is not None:
+            formatting.display_module_details(plan["top_modules"][0], page, limit)
+        elif view == "tree":
+            console.print(formatting.create_project_tree(plan, page, limit))
+        elif view == "table":
+            formatting.display_plan_table(plan, page, limit)
+        else:
+            raise ValueError(f"Unknown view: {view}")
+    except BrokenPipeError:
+        # Reader such as `head` went away; drop whatever is still buffered. Only
+        # for this process's own stdout: under the daemon it is a capture buffer
+        if sys.stdout is sys.__stdout__:
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            os.close(devnull)
+    except Exception as e:
+        console.print(f"❌ [bold red]Could not show plan: {e}[/bold red]")
+        raise typer.Exit(1)
+
+@plan_app.command("simulate")
+def plan_simulate(
+    plan_file: Path = typer.Argument(..., help="Plan file to simulate"),
+    workers: int = typer.Option(1, "--workers", "-w", min=1, help="Number of parallel workers"),
+    worker_skills: Optional[List[str]] = typer.Option(
+        None, "--skills", help="Comma-separated skill tags of one worker (repeatable); other workers are generalists"
+    ),
+    sweep: bool = typer.Option(False, help="Simulate every worker count from 1 to --workers"),
+    gaps: int = typer.Option(5, help="Number of largest idle gaps to show"),
+    output: Path = typer.Option(None, help="Write full simulation result as JSON"),
+):
+    """
+    Predict completion time of a plan for N parallel workers
+    """
+    from rich.table import Table
+    from .core.plans_manager import PlansManager
+    from .core.scheduler import ScheduleSimulator
+    
+    if not plan_file.exists():
+        console.print(f"❌ [bold red]Plan file not found: {plan_file}[/bold red]")
+        raise typer.Exit(1)
+    
+    try:
+        plan = PlansManager().load_plan(plan_file)
+        simulator = ScheduleSimulator(plan)
+        skills = [s.split(",") for s in worker_skills or []]
+        
+        if sweep:
+            table = Table(title="Worker Sweep", header_style="bold magenta")
+            table.add_column("Workers", justify="right", style="cyan")
+            table.add_column("Makespan (h)", justify="right", style="green")
+            table.add_column("Utilization", justify="right", style="yellow")
+            table.add_column("Idle (h)", justify="right", style="blue")
+            for row in simulator.sweep(workers, skills):
+                table.add_row(
+                    str(row["workers"]),
+                    f"{row['makespan']:.1f}",
+                    f"{row['utilization']:.0%}",
+                    f"{row['idle_hours']:.1f}",
+                )
+            console.print(table)
+            return
+        
+        result = simulator.simulate(workers, skills)
+        
+        console.print(f"\n📊 [bold]Schedule Simulation ({result['workers']} workers, {result['tasks']} tasks):[/bold]")
+        console.print(f"   • Makespan: [cyan]{result['makespan']:.1f}h[/cyan]")
+        console.print(f"   • Critical Path: [cyan]{result['critical_path_hours']:.1f}h[/cyan]")
+        console.print(f"   • Total Effort: [cyan]{result['total_hours']:.1f}h[/cyan]")
+        console.print(f"   • Utilization: [cyan]{result['utilization']:.0%}[/cyan]")
+        console.print(f"   • Idle Time: [cyan]{result['idle_hours']:.1f}h[/cyan]")
+        
+        table = Table(title="Workers", header_style="bold magenta")
+        table.add_column("Worker", justify="right", style="cyan")
+        table.add_column("Skills", style="white")
+        table.add_column("Tasks", justify="right", style="green")
+        table.add_column("Busy (h)", justify="right", style="green")
+        table.add_column("Utilization", justify="right", style="yellow")
+        for stats in result["worker_stats"]:
+            table.add_row(
+                str(stats["worker"]),
+                ", ".join(stats["skills"]) or "any",
+                str(stats["tasks"]),
+                f"{stats['busy_hours']:.1f}",
+                f"{stats['utilization']:.0%}",
+            )
+        console.print(table)
+        
+        largest_gaps = sorted(result["idle_gaps"], key=lambda g: g["end"] - g["start"], reverse=True)[:gaps]
+        if largest_gaps:
+            console.print(f"\n⏸️  [bold]Largest Idle Gaps:[/bold]")
+            for gap in largest_gaps:
+                console.print(
+                    f"   • Worker {gap['worker']}: {gap['start']:.1f}h → {gap['end']:.1f}h "
+                    f"([yellow]{gap['end'] - gap['start']:.1f}h[/yellow])"
+                )
+        
+        if output:
+            with open(output, 'w') as f:
+                json.dump(result, f, indent=2)
+            console.print(f"\n✅ [bold green]Simulation saved to: {output}[/bold green]")
+            
+    except Exception as e:
+        console.print(f"❌ [bold red]Simulation failed: {e}[/bold red]")
+        raise typer.Exit(1)
+
+@plan_app.command("risk")
+def plan_risk(
+    plan_file: Path = typer.Argument(..., help="Plan file to analyze"),
+    samples: int = typer.Option(20000, min=1, help="Number of simulated schedules"),
+    distribution: str = typer.Option("pert", help="Task duration distribution (pert, triangular)"),
+    spread: Optional[List[str]] = typer.Option(
+        None, help="Spread per priority as PRIORITY=LOW:HIGH fractions of the estimate, e.g. high=0.2:0.8 (repeatable)"
+    ),
+    seed: Optional[int] = typer.Option(None, help="Random seed for reproducible results"),
+    top: int = typer.Option(10, help="Number of most critical tasks to show"),
+    output: Path = typer.Option(None, help="Write full risk report as JSON"),
+):
+    """
+    Estimate schedule risk with Monte Carlo simulation of task durations
+    """
+    from rich.table import Table
+    from .core.plans_manager import PlansManager
+    from .core.risk import ScheduleRiskEstimator
+    
+    if not plan_file.exists():
+        console.print(f"❌ [bold red]Plan file not found: {plan_file}[/bold red]")
+        raise typer.Exit(1)
+    
+    try:
+        spreads = {}
+        for item in spread or []:
+            priority, _, bounds = item.partition("=")
+            low, _, high = bounds.partition(":")
+            spreads[priority.strip().lower()] = (float(low), float(high))
+        
+        plan = PlansManager().load_plan(plan_file)
+        estimator = ScheduleRiskEstimator(plan, spreads, distribution)
+        
+        with console.status(f"[bold green]Simulating {samples} schedules...", spinner="dots"):
+            report = estimator.run(samples, seed)
+        
+        console.print(f"\n🎲 [bold]Schedule Risk ({report['samples']} samples, {report['distribution']}):[/bold]")
+        console.print(f"   • Estimated Critical Path: [cyan]{report['estimated_critical_path_hours']:.1f}h[/cyan]")
+        console.print(f"   • Mean: [cyan]{report['mean']:.1f}h[/cyan]")
+        console.print(f"   • P50: [green]{report['p50']:.1f}h[/green]")
+        console.print(f"   • P80: [yellow]{report['p80']:.1f}h[/yellow]")
+        console.print(f"   • P95: [red]{report['p95']:.1f}h[/red]")
+        
+        table = Table(title="Most Critical Tasks", header_style="bold magenta")
+        table.add_column("Task", style="cyan")
+        table.add_column("Title", style="white")
+        table.add_column("On Critical Path", justify="right", style="yellow")
+        for task in report["critical_tasks"][:top]:
+            table.add_row(task["task_id"], task["title"], f"{task['criticality']:.0%}")
+        console.print(table)
+        
+        if output:
+            with open(output, 'w') as f:
+                json.dump(report, f, indent=2)
+            console.print(f"\n✅ [bold green]Risk report saved to: {output}[/bold green]")
+            
+    except Exception as e:
+        console.print(f"❌ [bold red]Risk estimation failed: {e}[/bold red]")
+        raise typer.Exit(1)
+
 if __name__ == "__main__":
     app()
\ No newline at end of file
@@ -17,13 +17,52 @@ class Config:
     # Default AI provider
     AI_PROVIDER: str = os.getenv("AI_PROVIDER", "deepseek")  # deepseek or openai
     
+    # Model routing: each request kind goes to its provider's fast or large model (see core/routing.py)
+    DEEPSEEK_FAST_MODEL: str = os.getenv("DEEPSEEK_FAST_MODEL", "deepseek-chat")
+    DEEPSEEK_LARGE_MODEL: str = os.getenv("DEEPSEEK_LARGE_MODEL", "deepseek-chat")
+    OPENAI_FAST_MODEL: str = os.getenv("OPENAI_FAST_MODEL", "gpt-4o-mini")
+    OPENAI_LARGE_MODEL: str = os.getenv("OPENAI_LARGE_MODEL", "gpt-4o")
+    MODEL_ROUTES: str = os.getenv("MODEL_ROUTES", "outline=large,review=fast,chat=fast")  # kind=fast|large; unlisted kinds use large
+    ROUTE_LARGE_TOKENS: int = int(os.getenv("ROUTE_LARGE_TOKENS", "12000"))  # fast-tier calls needing more (prompt + max_tokens) use large
+    ROUTE_LATENCY_TARGET: float = float(os.getenv("ROUTE_LATENCY_TARGET", "0"))  # seconds; large-tier calls expected slower use fast, 0 = off
+    
     # Project settings
     PLANS_DIR: str = os.getenv("PLANS_DIR", "./aria/plans")
     LOGS_DIR: str = os.getenv("LOGS_DIR", "./aria/logs")
     
+    # Logging
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVELS: str = os.getenv("LOG_LEVELS", "")  # per-module, e.g. "aria.core.ai_engine=DEBUG,aria.server=WARNING"
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")  # text or json (one object per line)
+    LOG_ROTATION: str = os.getenv("LOG_ROTATION", "size")  # size, time or none
+    LOG_MAX_BYTES: int = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+    LOG_BACKUP_COUNT: int = int(os.getenv("LOG_BACKUP_COUNT", "5"))
+    LOG_ROTATE_WHEN: str = os.getenv("LOG_ROTATE_WHEN", "midnight")
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))  # records beyond this are dropped
+    
+    # Plan reuse: saved plans at least this similar to a new goal (TF-IDF cosine, 0-1) are offered instead of a new decomposition
+    PLAN_REUSE_THRESHOLD: float = float(os.getenv("PLAN_REUSE_THRESHOLD", "0.75"))
+    
+    # Code generation
+    GENERATION_WORKERS: int = int(os.getenv("GENERATION_WORKERS", "0"))  # 0 = in-process
+    
+    # Code review (aria review)
+    REVIEW_WORKERS: int = int(os.getenv("REVIEW_WORKERS", "8"))  # concurrent AI requests
+    REVIEW_CHUNK_TOKENS: int = int(os.getenv("REVIEW_CHUNK_TOKENS", "3000"))  # source tokens per request
+    
+    # Daemon (aria serve); the client reads ARIA_SOCKET from the environment directly
+    DAEMON_SOCKET: str = os.getenv("ARIA_SOCKET", "")
+    
+    # Job API (aria api)
+    JOBS_DB: str = os.getenv("JOBS_DB", "./aria/jobs.db")
+    API_WORKERS: int = int(os.getenv("API_WORKERS", "2"))
+    API_TOKEN: str = os.getenv("ARIA_API_TOKEN", "")  # empty = no auth, for local use only
+    
     # AI Behavior
     DEFAULT_TEMPERATURE: float = 0.2
     DEFAULT_MAX_TOKENS: int = 4000
+    MAX_OUTPUT_TOKENS: int = int(os.getenv("MAX_OUTPUT_TOKENS", "8000"))  # cap on estimated completion budgets
+    MAX_CONTINUATIONS: int = int(os.getenv("MAX_CONTINUATIONS", "2"))  # follow-up requests when a reply stops at max_tokens
     
     @classmethod
     def validate(cls) -> bool:
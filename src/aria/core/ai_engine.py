@@ -1,10 +1,155 @@
+import hashlib
 import json
+import threading
+import time
 import httpx
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple
 from ..config import config
+from .json_repair import parse_plan
+from .prompts import CONTINUE_PROMPT, DECOMPOSE_SYSTEM_PROMPT, decompose_user_prompt
+from .routing import ModelRouter, route_stats
+from .tokens import estimate_message_tokens, fit_max_tokens, plan_output_tokens
 from ..utils.logger import setup_logger
+from ..utils.tracing import span
 
-logger = setup_logger()
+logger = setup_logger(__name__)
+
+# Models that accept response_format={"type": "json_object"}; others get the prompt alone
+JSON_MODE_MODELS = {"deepseek-chat", "gpt-4o", "gpt-4o-mini", "gpt-4-turbo"}
+
+JSON_OBJECT = {"type": "json_object"}
+
+# Keep-alive clients shared by every AIEngine in the process, one per API base URL
+_clients: Dict[str, httpx.Client] = {}
+_clients_lock = threading.Lock()
+
+def get_client(base_url: str) -> httpx.Client:
+    """Pooled HTTP client so repeated calls reuse connections and TLS sessions"""
+    with _clients_lock:
+        client = _clients.get(base_url)
+        if client is None:
+            client = httpx.Client()
+            _clients[base_url] = client
+        return client
+
+def iter_sse_content(
+    lines: Iterable[str],
+    usage: Optional[Dict[str, Any]] = None,
+    finish_reasons: Optional[List[str]] = None
+) -> Iterator[str]:
+    """Content deltas from an OpenAI-style server-sent event stream
+    
+    A usage block, sent in the final chunk when requested, is copied into
+    ``usage``; each choice's finish_reason is appended to ``finish_reasons``.
+    """
+    
+    for line in lines:
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return
+        chunk = json.loads(data)
+        if usage is not None and chunk.get("usage"):
+            usage.update(chunk["usage"])
+        for choice in chunk.get("choices") or []:
+            if finish_reasons is not None and choice.get("finish_reason"):
+                finish_reasons.append(choice["finish_reason"])
+            content = (choice.get("delta") or {}).get("content")
+            if content:
+                yield content
+
+def prompt_cache_tokens(usage: Dict[str, Any]) -> Tuple[int, int]:
+    """(hit, miss) prompt tokens served from the provider's prompt cache
+    
+    DeepSeek reports ``prompt_cache_hit_tokens``/``prompt_cache_miss_tokens``;
+    OpenAI reports ``prompt_tokens_details.cached_tokens``.
+    """
+    
+    prompt_tokens = usage.get("prompt_tokens", 0) or 0
+    if "prompt_cache_hit_tokens" in usage:
+        hit = usage.get("prompt_cache_hit_tokens") or 0
+        return hit, usage.get("prompt_cache_miss_tokens", prompt_tokens - hit) or 0
+    hit = (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+    return hit, max(prompt_tokens - hit, 0)
+
+class UsageStats:
+    """Token totals of the AI calls made by this process"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cache_hit_tokens = 0
+        self.cache_miss_tokens = 0
+    
+    def record(self, usage: Dict[str, Any]) -> Tuple[int, int]:
+        """Add one response's usage; returns its (cache hit, cache miss) prompt tokens"""
+        
+        hit, miss = prompt_cache_tokens(usage)
+        with self._lock:
+            self.requests += 1
+            self.prompt_tokens += usage.get("prompt_tokens", 0) or 0
+            self.completion_tokens += usage.get("completion_tokens", 0) or 0
+            self.cache_hit_tokens += hit
+            self.cache_miss_tokens += miss
+        return hit, miss
+    
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            cached = self.cache_hit_tokens + self.cache_miss_tokens
+            return {
+                "requests": self.requests,
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "cache_hit_tokens": self.cache_hit_tokens,
+                "cache_miss_tokens": self.cache_miss_tokens,
+                "cache_hit_rate": self.cache_hit_tokens / cached if cached else 0.0,
+            }
+
+usage_stats = UsageStats()
+
+class ResponseCache:
+    """In-memory LRU of chat completion responses keyed by request payload"""
+    
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def key(payload: Dict[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+    
+    def put(self, key: str, response: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+# Disabled by default; long-lived processes such as `aria serve` turn it on
+response_cache: Optional[ResponseCache] = None
+
+def enable_response_cache(max_entries: int = 256) -> ResponseCache:
+    """Cache identical chat completion requests for the rest of the process"""
+    global response_cache
+    response_cache = ResponseCache(max_entries)
+    return response_cache
 
 class AIEngine:
     """Unified AI engine for DeepSeek and OpenAI"""
@@ -13,29 +158,178 @@ class AIEngine:
         self.provider = config.AI_PROVIDER
         self.base_url = getattr(config, f"{self.provider.upper()}_BASE_URL")
         self.api_key = getattr(config, f"{self.provider.upper()}_API_KEY")
+        self.router = ModelRouter(self.provider)
+    
+    def _route(self, kind: str, messages: List[Dict[str, str]], max_tokens: int) -> Tuple[str, str, int]:
+        """(route, model, max_tokens) for a request, with ``max_tokens`` trimmed to the model's context window"""
+        
+        prompt_tokens = estimate_message_tokens(messages)
+        route, model = self.router.route(kind, prompt_tokens, max_tokens)
+        return route, model, fit_max_tokens(prompt_tokens, max_tokens, model)
         
     def chat_completion(
         self,
         messages: List[Dict[str, str]],
         temperature: float = config.DEFAULT_TEMPERATURE,
         max_tokens: int = config.DEFAULT_MAX_TOKENS,
-        stream: bool = False
+        stream: bool = False,
+        response_format: Optional[Dict[str, Any]] = None,
+        kind: str = "chat"
     ) -> Dict[str, Any]:
-        """Make AI API call"""
+        """Make AI API call on the model routed for ``kind`` (see core/routing.py)"""
+        
+        route, model, max_tokens = self._route(kind, messages, max_tokens)
+        with span("ai.chat_completion", provider=self.provider, route=route, model=model, messages=len(messages), max_tokens=max_tokens) as trace:
+            cache_key = None
+            if response_cache is not None and not stream:
+                cache_key = ResponseCache.key({
+                    "provider": self.provider,
+                    "base_url": self.base_url,
+                    "model": model,
+                    "messages": messages,
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                    "response_format": response_format,
+                })
+                cached = response_cache.get(cache_key)
+                if cached is not None:
+                    trace.set(cached=True)
+                    return cached
+            
+            started = time.perf_counter()
+            try:
+                if self.provider == "deepseek":
+                    response = self._deepseek_call(messages, model, temperature, max_tokens, stream, response_format)
+                elif self.provider == "openai":
+                    response = self._openai_call(messages, model, temperature, max_tokens, stream, response_format)
+                else:
+                    raise ValueError(f"Unsupported AI provider: {self.provider}")
+            except Exception:
+                route_stats.record(route, model, time.perf_counter() - started, {}, error=True)
+                raise
+            
+            usage = response.get("usage") or {}
+            route_stats.record(route, model, time.perf_counter() - started, usage)
+            self._record_usage(usage, trace)
+            
+            if cache_key is not None:
+                response_cache.put(cache_key, response)
+            return response
+    
+    def stream_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = config.DEFAULT_TEMPERATURE,
+        max_tokens: int = config.DEFAULT_MAX_TOKENS,
+        response_format: Optional[Dict[str, Any]] = None,
+        finish_reasons: Optional[List[str]] = None,
+        kind: str = "chat"
+    ) -> Iterator[str]:
+        """Make a streaming AI API call, yielding content as it arrives
+        
+        The stream's finish_reason is appended to ``finish_reasons`` if given.
+        """
+        
+        route, model, max_tokens = self._route(kind, messages, max_tokens)
+        
+        url = f"{self.base_url}/chat/completions"
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+            "stream_options": {"include_usage": True}
+        }
+        if response_format and model in JSON_MODE_MODELS:
+            payload["response_format"] = response_format
         
-        if self.provider == "deepseek":
-            return self._deepseek_call(messages, temperature, max_tokens, stream)
-        elif self.provider == "openai":
-            return self._openai_call(messages, temperature, max_tokens, stream)
-        else:
-            raise ValueError(f"Unsupported AI provider: {self.provider}")
+        with span("ai.stream_completion", provider=self.provider, route=route, model=model, messages=len(messages), max_tokens=max_tokens) as trace:
+            chunks = 0
+            usage: Dict[str, Any] = {}
+            started = time.perf_counter()
+            try:
+                with get_client(self.base_url).stream("POST", url, json=payload, headers=headers, timeout=30.0) as response:
+                    response.raise_for_status()
+                    for content in iter_sse_content(response.iter_lines(), usage, finish_reasons):
+                        chunks += 1
+                        yield content
+            except Exception as e:
+                logger.error(f"Streaming API call failed: {e}")
+                route_stats.record(route, model, time.perf_counter() - started, usage, error=True)
+                raise
+            finally:
+                trace.set(chunks=chunks)
+            route_stats.record(route, model, time.perf_counter() - started, usage)
+            if usage:
+                self._record_usage(usage, trace)
+    
+    def complete(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = config.DEFAULT_TEMPERATURE,
+        max_tokens: int = config.DEFAULT_MAX_TOKENS,
+        response_format: Optional[Dict[str, Any]] = None,
+        on_token: Optional[Callable[[str], None]] = None,
+        kind: str = "chat"
+    ) -> str:
+        """Full response text, continued when the provider stops at ``max_tokens``
+        
+        A reply with finish_reason "length" is sent back as an assistant turn
+        with a request to carry on, up to config.MAX_CONTINUATIONS times, and
+        the parts are joined. ``on_token`` switches to streaming.
+        """
+        
+        parts: List[str] = []
+        request = messages
+        with span("ai.complete", max_tokens=max_tokens) as trace:
+            for continuation in range(config.MAX_CONTINUATIONS + 1):
+                if on_token is None:
+                    response = self.chat_completion(request, temperature, max_tokens, response_format=response_format, kind=kind)
+                    choice = response["choices"][0]
+                    parts.append(choice["message"].get("content") or "")
+                    finish_reason = choice.get("finish_reason")
+                else:
+                    finish_reasons: List[str] = []
+                    for part in self.stream_completion(request, temperature, max_tokens, response_format, finish_reasons, kind):
+                        parts.append(part)
+                        on_token(part)
+                    finish_reason = finish_reasons[-1] if finish_reasons else None
+                
+                trace.set(continuations=continuation, finish_reason=finish_reason)
+                if finish_reason != "length" or continuation == config.MAX_CONTINUATIONS:
+                    break
+                logger.info(f"AI response stopped at max_tokens ({max_tokens}); asking it to continue")
+                request = messages + [
+                    {"role": "assistant", "content": "".join(parts)},
+                    {"role": "user", "content": CONTINUE_PROMPT}
+                ]
+                # JSON mode would make the continuation a new document
+                response_format = None
+        return "".join(parts)
+    
+    def _record_usage(self, usage: Dict[str, Any], trace: Any):
+        hit, miss = usage_stats.record(usage)
+        trace.set(
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            cache_hit_tokens=hit,
+            cache_miss_tokens=miss,
+        )
+        logger.debug(f"AI usage: {usage.get('prompt_tokens', 0)} prompt tokens ({hit} cached), {usage.get('completion_tokens', 0)} completion tokens")
     
     def _deepseek_call(
         self,
         messages: List[Dict[str, str]],
+        model: str,
         temperature: float,
         max_tokens: int,
-        stream: bool
+        stream: bool,
+        response_format: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Call DeepSeek API"""
         
@@ -45,18 +339,19 @@ class AIEngine:
             "Authorization": f"Bearer {self.api_key}"
         }
         payload = {
-            "model": "deepseek-chat",
+            "model": model,
             "messages": messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
             "stream": stream
         }
+        if response_format and model in JSON_MODE_MODELS:
+            payload["response_format"] = response_format
         
         try:
-            with httpx.Client() as client:
-                response = client.post(url, json=payload, headers=headers, timeout=30.0)
-                response.raise_for_status()
-                return response.json()
+            response = get_client(self.base_url).post(url, json=payload, headers=headers, timeout=30.0)
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
             logger.error(f"DeepSeek API call failed: {e}")
             raise
@@ -64,9 +359,11 @@ class AIEngine:
     def _openai_call(
         self,
         messages: List[Dict[str, str]],
+        model: str,
         temperature: float,
         max_tokens: int,
-        stream: bool
+        stream: bool,
+        response_format: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Call OpenAI-compatible API"""
         
@@ -76,85 +373,54 @@ class AIEngine:
             "Authorization": f"Bearer {self.api_key}"
         }
         payload = {
-            "model": "gpt-4",  # Adjust as needed
+            "model": model,
             "messages": messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
             "stream": stream
         }
+        if response_format and model in JSON_MODE_MODELS:
+            payload["response_format"] = response_format
         
         try:
-            with httpx.Client() as client:
-                response = client.post(url, json=payload, headers=headers, timeout=30.0)
-                response.raise_for_status()
-                return response.json()
+            response = get_client(self.base_url).post(url, json=payload, headers=headers, timeout=30.0)
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
             logger.error(f"OpenAI API call failed: {e}")
             raise
     
-    def decompose_task(self, goal: str, tech_stack: str = "", constraints: List[str] = None) -> Dict[str, Any]:
-        """AI-powered task decomposition"""
+    def decompose_task(
+        self,
+        goal: str,
+        tech_stack: str = "",
+        constraints: List[str] = None,
+        on_token: Optional[Callable[[str], None]] = None,
+        seed: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """AI-powered task decomposition
         
-        system_prompt = """You are an expert software architect and project planner. Your task is to decompose complex software development goals into structured, executable plans.
-
-Output MUST be valid JSON with this structure:
-{
-    "goal": "original goal",
-    "architecture_overview": "high-level description",
-    "total_hours": 100,
-    "top_modules": [
-        {
-            "id": "module-1",
-            "name": "Module Name",
-            "description": "What this module does",
-            "estimated_hours": 20,
-            "tasks": [
-                {
-                    "id": "task-1",
-                    "title": "Task title",
-                    "description": "Detailed description",
-                    "priority": "high|medium|low",
-                    "estimated_hours": 4,
-                    "dependencies": ["other-task-id"],
-                    "acceptance_criteria": ["list", "of", "criteria"]
-                }
-            ]
-        }
-    ],
-    "risks": ["list of potential risks"],
-    "success_criteria": ["list of success metrics"]
-}"""
-
-        user_prompt = f"""
-Project Goal: {goal}
-Technology Stack: {tech_stack}
-Constraints: {constraints or []}
-
-Please decompose this into a structured development plan. Consider:
-1. Modular architecture
-2. Task dependencies
-3. Risk assessment
-4. Realistic time estimates
-5. Clear acceptance criteria
-
-Return JSON only, no other text.
-"""
+        ``on_token`` receives the response as it streams in; ``seed`` is an
+        outline of a similar earlier plan for the AI to adapt. ``max_tokens``
+        is sized from the expected plan size. The response is requested in
+        JSON mode where the model supports it, and fenced, truncated or
+        slightly malformed JSON is repaired locally instead of asking again.
+        """
         
         messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
+            {"role": "system", "content": DECOMPOSE_SYSTEM_PROMPT},
+            {"role": "user", "content": decompose_user_prompt(goal, tech_stack, constraints, seed)}
         ]
         
-        response = self.chat_completion(messages, temperature=0.2)
-        content = response["choices"][0]["message"]["content"]
+        max_tokens = plan_output_tokens(goal, constraints, seed)
+        content = self.complete(messages, 0.2, max_tokens, JSON_OBJECT, on_token, kind="outline")
         
-        # Parse JSON from response
         try:
-            start = content.find('{')
-            end = content.rfind('}') + 1
-            json_str = content[start:end]
-            return json.loads(json_str)
-        except json.JSONDecodeError as e:
+            plan, repairs = parse_plan(content, goal)
+        except ValueError as e:
             logger.error(f"Failed to parse AI response as JSON: {e}")
             logger.error(f"Raw content: {content}")
-            raise ValueError("AI response was not valid JSON")
\ No newline at end of file
+            raise ValueError("AI response was not valid JSON")
+        if repairs:
+            logger.info(f"Repaired AI response locally: {', '.join(sorted(set(repairs)))}")
+        return plan
\ No newline at end of file
@@ -1,10 +1,14 @@
 import uuid
-from typing import Dict, List, Any
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Union
 from .ai_engine import AIEngine
 from .plans_manager import PlansManager
+from .similarity import find_similar_plan
+from ..config import config
 from ..utils.logger import setup_logger
+from ..utils.tracing import span
 
-logger = setup_logger()
+logger = setup_logger(__name__)
 
 class TaskDecomposer:
     """Main task decomposition engine"""
@@ -16,26 +20,105 @@ class TaskDecomposer:
         self.ai_engine = AIEngine()
         self.plans_manager = PlansManager()
         
-    def run(self) -> Dict[str, Any]:
-        """Run full decomposition pipeline"""
+    def find_similar_plan(self, threshold: Optional[float] = None, exclude: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+        """Catalog entry of the most similar saved plan, if it reaches the reuse threshold
         
-        logger.info(f"Starting decomposition for goal: {self.goal}")
+        ``exclude`` is a plan file left out of the catalog, e.g. the one about to be replaced.
+        """
         
-        # 1. AI-powered decomposition
-        ai_plan = self.ai_engine.decompose_task(
-            self.goal, self.tech_stack, self.constraints
+        catalog = self.plans_manager.list_plans()
+        if exclude is not None:
+            excluded = Path(exclude).resolve()
+            catalog = [entry for entry in catalog if (self.plans_manager.plans_dir / entry["file"]).resolve() != excluded]
+        return find_similar_plan(
+            catalog, self.goal, self.tech_stack, self.constraints,
+            config.PLAN_REUSE_THRESHOLD if threshold is None else threshold
         )
+    
+    def run(
+        self,
+        on_token: Optional[Callable[[str], None]] = None,
+        reuse: Union[bool, Callable[[Dict[str, Any]], bool], None] = None,
+        similar: Union[bool, Dict[str, Any]] = False,
+        exclude: Optional[Path] = None
+    ) -> Dict[str, Any]:
+        """Run full decomposition pipeline, streaming the AI response to ``on_token`` if given
+        
+        ``similar`` True looks up the most similar saved plan (leaving out
+        ``exclude``), a catalog entry uses that plan without a second lookup,
+        and False (the default) uses none, so results don't depend on what
+        happens to be saved. ``reuse`` decides, or is called with the entry to
+        decide, whether to adapt that plan instead of calling the AI.
+        Otherwise the similar plan's outline is given to the AI as a seed.
+        """
         
-        # 2. Enhance with additional metadata
-        enhanced_plan = self._enhance_plan(ai_plan)
+        logger.info(f"Starting decomposition for goal: {self.goal}")
         
-        # 3. Validate plan structure
-        self._validate_plan(enhanced_plan)
+        with span("decompose", goal=self.goal, tech_stack=self.tech_stack) as trace:
+            # 1. Look for a near-duplicate of an earlier plan
+            with span("decompose.similar") as similar_trace:
+                if similar is True:
+                    similar = self.find_similar_plan(exclude=exclude)
+                elif similar is False:
+                    similar = None
+                similar_plan = None
+                if similar is not None:
+                    similar_trace.set(file=similar["file"], similarity=round(similar["similarity"], 3))
+                    similar_plan = self.plans_manager.load_plan(self.plans_manager.plans_dir / similar["file"])
+            
+            # 2. Reuse it, or run AI-powered decomposition
+            if similar_plan is not None and (reuse(similar) if callable(reuse) else bool(reuse)):
+                logger.info(f"Reusing {similar['file']} ({similar['similarity']:.0%} similar)")
+                with span("decompose.reuse"):
+                    ai_plan = self._adapt_plan(similar_plan, similar)
+            else:
+                with span("decompose.ai"):
+                    ai_plan = self.ai_engine.decompose_task(
+                        self.goal, self.tech_stack, self.constraints, on_token=on_token,
+                        seed=self._outline(similar_plan) if similar_plan is not None else None
+                    )
+            
+            # 3. Enhance with additional metadata
+            with span("decompose.enhance"):
+                enhanced_plan = self._enhance_plan(ai_plan)
+            
+            # 4. Validate plan structure
+            with span("decompose.validate"):
+                self._validate_plan(enhanced_plan)
+            
+            modules = enhanced_plan.get('top_modules', [])
+            trace.set(modules=len(modules), tasks=sum(len(m.get("tasks", [])) for m in modules), reused="reused_from" in enhanced_plan)
         
         logger.info(f"Decomposition completed. Modules: {len(enhanced_plan.get('top_modules', []))}")
         
         return enhanced_plan
     
+    def _adapt_plan(self, plan: Dict[str, Any], similar: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn a freshly loaded saved plan into a starting plan for this goal"""
+        
+        for key in ("saved_at", "aria_version", "reused_from"):
+            plan.pop(key, None)
+        plan["goal"] = self.goal
+        plan["reused_from"] = {"file": similar["file"], "goal": similar["goal"], "similarity": round(similar["similarity"], 3)}
+        
+        for module in plan.get("top_modules", []):
+            for task in module.get("tasks", []):
+                task["status"] = "pending"
+        
+        return plan
+    
+    @staticmethod
+    def _outline(plan: Dict[str, Any], max_tasks: int = 60) -> str:
+        """Compact module and task title outline of a plan for use as a prompt seed"""
+        
+        lines = [f"Goal: {plan.get('goal', '')}"]
+        remaining = max_tasks
+        for module in plan.get("top_modules", []):
+            titles = [task.get("title", "") for task in module.get("tasks", [])[:max(remaining, 0)]]
+            remaining -= len(titles)
+            lines.append(f"- {module.get('name', '')}: {'; '.join(titles)}")
+        return "\n".join(lines)
+    
     def _enhance_plan(self, plan: Dict[str, Any]) -> Dict[str, Any]:
         """Add additional metadata and structure to AI plan"""
         
@@ -1,20 +1,89 @@
+import itertools
 import subprocess
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-from ..plugins.base import PluginManager
+from ..config import config
+from ..plugins.base import BasePlugin, PluginManager
+from ..utils.file_ops import StagedDirectory, write_files
 from ..utils.logger import setup_logger
+from ..utils.tracing import span
+from .manifest import MANIFEST_FILE, BuildManifest
 
-logger = setup_logger()
+logger = setup_logger(__name__)
+
+# Plugin instance owned by each process-pool worker, set once by the pool initializer
+_worker_plugin: Optional[BasePlugin] = None
 
 class CodeGenerator:
     """Generate code and project structure"""
     
-    def __init__(self):
+    def __init__(self, workers: Optional[int] = None):
         self.plugin_manager = PluginManager()
+        # Number of worker processes for per-task code generation; 0 or 1 runs in-process
+        self.workers = config.GENERATION_WORKERS if workers is None else workers
+    
+    def generate_project(
+        self,
+        plan: Dict[str, Any],
+        target_path: Path,
+        force: bool = False,
+        staged: bool = True
+    ) -> Dict[str, Any]:
+        """Generate complete project from plan
+        
+        Output is tracked in a build manifest inside ``target_path`` so that
+        re-runs only regenerate units whose inputs changed; ``force``
+        regenerates everything. With ``staged``, generation happens in a
+        staging directory that replaces ``target_path`` only on success.
+        """
+        
+        with span("generate.project", target=str(target_path), force=force) as trace:
+            results = self._generate_project(plan, Path(target_path), force, staged)
+            trace.set(
+                generated=len(results["generated_files"]),
+                skipped=len(results["skipped"]),
+                errors=len(results["errors"]),
+            )
+        return results
+    
+    def _generate_project(self, plan: Dict[str, Any], target_path: Path, force: bool, staged: bool) -> Dict[str, Any]:
+        cwd = Path.cwd().resolve()
+        if staged and (cwd == target_path.resolve() or target_path.resolve() in cwd.parents):
+            logger.warning(f"Cannot stage generation into the working directory, writing in place: {target_path}")
+            staged = False
+        
+        if not staged:
+            return self._generate(plan, target_path, force)
+        
+        with StagedDirectory(target_path) as staging:
+            results = self._generate(plan, staging.path, force)
+            if results["success"]:
+                try:
+                    staging.commit([*results["generated_files"], staging.path / MANIFEST_FILE])
+                except OSError as e:
+                    logger.error(f"Could not swap generated output into {target_path}: {e}")
+                    results["success"] = False
+                    results["errors"].append(f"Could not replace {target_path}: {e}")
+            if not results["success"]:
+                # Nothing reached the target; the staging tree is discarded on exit
+                results["generated_files"] = []
+                results["deleted_files"] = []
+        
+        # Report paths as they are after the swap
+        staging_prefix = str(staging.path)
+        for key in ("generated_files", "deleted_files"):
+            results[key] = [
+                str(staging.target) + path[len(staging_prefix):] if path.startswith(staging_prefix) else path
+                for path in results[key]
+            ]
+        
+        return results
     
-    def generate_project(self, plan: Dict[str, Any], target_path: Path) -> Dict[str, Any]:
-        """Generate complete project from plan"""
+    def _generate(self, plan: Dict[str, Any], target_path: Path, force: bool) -> Dict[str, Any]:
+        """Generate the project directly into ``target_path``"""
         
         target_path = Path(target_path)
         target_path.mkdir(parents=True, exist_ok=True)
@@ -22,37 +91,53 @@ class CodeGenerator:
         results = {
             "success": True,
             "generated_files": [],
+            "skipped": [],
+            "deleted_files": [],
             "errors": [],
             "warnings": []
         }
         
+        manifest = BuildManifest.load(target_path)
+        active_units: List[str] = []
+        
         try:
             # Detect framework from tech stack
             framework = self._detect_framework(plan.get("tech_stack", ""))
+            plugin = self.plugin_manager.get_plugin(framework) if framework else None
             
-            if framework:
+            if plugin:
                 # Use plugin to scaffold base project
-                plugin = self.plugin_manager.get_plugin(framework)
-                if plugin:
-                    scaffold_result = plugin.scaffold_project(
-                        plan["goal"], 
-                        target_path
-                    )
+                unit = "scaffold"
+                inputs = manifest.fingerprint(plugin.name, plugin.version, framework, plan["goal"])
+                active_units.append(unit)
+                
+                if not force and manifest.is_fresh(unit, inputs):
+                    results["skipped"].append(unit)
+                else:
+                    with span("generate.scaffold", plugin=plugin.name):
+                        scaffold_result = plugin.scaffold_project(
+                            plan["goal"], 
+                            target_path
+                        )
                     
                     if scaffold_result.get("success"):
-                        results["generated_files"].extend(scaffold_result.get("generated_files", []))
+                        files = _scaffold_files(scaffold_result)
+                        results["generated_files"].extend(files)
+                        self._record(manifest, unit, inputs, files, results)
                     else:
                         results["errors"].append(f"Scaffolding failed: {scaffold_result.get('error')}")
             
             # Generate module-specific code
-            for module in plan.get("top_modules", []):
-                module_result = self._generate_module(module, target_path, framework)
-                results["generated_files"].extend(module_result.get("generated_files", []))
-                results["errors"].extend(module_result.get("errors", []))
-                results["warnings"].extend(module_result.get("warnings", []))
+            if plugin:
+                active_units.extend(self._generate_tasks(plan.get("top_modules", []), target_path, framework, plugin, manifest, force, results))
             
             # Generate project documentation
-            self._generate_documentation(plan, target_path, results)
+            with span("generate.docs"):
+                active_units.append(self._generate_documentation(plan, target_path, manifest, force, results))
+            
+            # Remove files produced by units that are no longer part of the plan
+            self._delete_files(manifest.prune(active_units), results)
+            manifest.save()
             
         except Exception as e:
             results["success"] = False
@@ -78,35 +163,121 @@ class CodeGenerator:
         
         return None
     
-    def _generate_module(self, module: Dict[str, Any], base_path: Path, framework: Optional[str]) -> Dict[str, Any]:
-        """Generate code for a specific module"""
+    def _generate_tasks(
+        self,
+        modules: List[Dict[str, Any]],
+        base_path: Path,
+        framework: str,
+        plugin: BasePlugin,
+        manifest: BuildManifest,
+        force: bool,
+        results: Dict[str, Any]
+    ) -> List[str]:
+        """Generate code for every changed task; returns the units of all plan tasks"""
         
-        result = {
-            "generated_files": [],
-            "errors": [],
-            "warnings": []
-        }
+        plugin_id = (plugin.name, plugin.version, framework)
+        active_units = []
+        pending = []
         
-        try:
-            # Use plugin to generate module code
-            if framework:
-                plugin = self.plugin_manager.get_plugin(framework)
-                if plugin:
-                    for task in module.get("tasks", []):
-                        task_result = plugin.generate_code(task, {"module": module, "framework": framework})
-                        
-                        if task_result.get("success"):
-                            result["generated_files"].extend(task_result.get("files_created", []))
-                        else:
-                            result["errors"].append(f"Failed to generate code for task {task['id']}")
-            
-        except Exception as e:
-            result["errors"].append(f"Module generation failed: {str(e)}")
+        for module in modules:
+            context = _task_context(module, framework, base_path)
+            # Sibling tasks are left out so editing one task doesn't regenerate the whole module
+            metadata = {key: value for key, value in module.items() if key != "tasks"}
+            for task in module.get("tasks", []):
+                unit = f"task:{module.get('id')}:{task.get('id')}"
+                # target_path is left out: staged runs generate into a fresh directory each time
+                inputs = manifest.fingerprint(plugin_id, task, metadata)
+                active_units.append(unit)
+                
+                if not force and manifest.is_fresh(unit, inputs):
+                    results["skipped"].append(unit)
+                else:
+                    pending.append((task, context, unit, inputs))
+        
+        with span("generate.tasks", tasks=len(active_units), pending=len(pending), workers=self.workers):
+            task_results = self._run_tasks(plugin, [(task, context) for task, context, _, _ in pending])
         
-        return result
+        for (task, _, unit, inputs), task_result in zip(pending, task_results):
+            if task_result.get("success"):
+                files = task_result.get("files_created", [])
+                results["generated_files"].extend(files)
+                self._record(manifest, unit, inputs, files, results)
+            else:
+                error = f"Failed to generate code for task {task.get('id')}"
+                if task_result.get("error"):
+                    error += f": {task_result['error']}"
+                results["errors"].append(error)
+        
+        return active_units
+    
+    def _run_tasks(self, plugin: BasePlugin, jobs: List[tuple]) -> List[Dict[str, Any]]:
+        """Run (task, context) jobs through the plugin, in a process pool when workers are configured"""
+        
+        if self.workers > 1 and len(jobs) > 1:
+            try:
+                return self._run_tasks_parallel(plugin, jobs)
+            except Exception as e:
+                logger.warning(f"Parallel generation unavailable, falling back to serial: {e}")
+        
+        task_results = []
+        for module_id, module_jobs in itertools.groupby(jobs, key=lambda job: job[1]["module"].get("id")):
+            with span("generate.module", module=str(module_id)):
+                task_results.extend(_run_plugin_task(plugin, task, context) for task, context in module_jobs)
+        return task_results
+    
+    def _run_tasks_parallel(self, plugin: BasePlugin, jobs: List[tuple]) -> List[Dict[str, Any]]:
+        """Fan per-task generation out to worker processes, keeping results in job order"""
+        
+        # A few batches per worker amortizes IPC without starving the pool
+        workers = min(self.workers, len(jobs))
+        batch_size = max(1, len(jobs) // (workers * 4))
+        batches = [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
+        
+        task_results: List[Dict[str, Any]] = []
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(plugin,))
+        with span("generate.parallel", workers=workers, batches=len(batches)), pool:
+            futures = [pool.submit(_generate_task_batch, batch) for batch in batches]
+            for batch, future in zip(batches, futures):
+                try:
+                    task_results.extend(future.result())
+                except BrokenProcessPool as e:
+                    if not task_results:
+                        # No worker got going (e.g. the plugin can't be pickled or imported
+                        # in a child): let _run_tasks() fall back to the serial path
+                        raise
+                    # A worker died mid-run: fail the batches it took down with it
+                    task_results.extend({"success": False, "error": str(e)} for _ in batch)
+                except Exception as e:
+                    task_results.extend({"success": False, "error": str(e)} for _ in batch)
+        
+        return task_results
+    
+    def _record(self, manifest: BuildManifest, unit: str, inputs: str, files: List[Any], results: Dict[str, Any]):
+        """Record a regenerated unit and delete files it stopped producing"""
+        self._delete_files(manifest.record(unit, inputs, files), results)
+    
+    def _delete_files(self, paths: List[Path], results: Dict[str, Any]):
+        """Delete orphaned generated files"""
+        for path in paths:
+            try:
+                path.unlink()
+                results["deleted_files"].append(str(path))
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                results["warnings"].append(f"Could not delete orphaned file {path}: {e}")
     
-    def _generate_documentation(self, plan: Dict[str, Any], base_path: Path, results: Dict[str, Any]):
-        """Generate project documentation"""
+    def _generate_documentation(
+        self,
+        plan: Dict[str, Any],
+        base_path: Path,
+        manifest: BuildManifest,
+        force: bool,
+        results: Dict[str, Any]
+    ) -> str:
+        """Generate project documentation; returns its manifest unit"""
+        
+        unit = "docs"
         
         try:
             # Generate README.md
@@ -122,11 +293,55 @@ class CodeGenerator:
                 readme_content += f"### {module['name']}\n"
                 readme_content += f"{module.get('description', '')}\n\n"
             
-            readme_path = base_path / "README.md"
-            with open(readme_path, 'w') as f:
-                f.write(readme_content)
+            inputs = manifest.fingerprint(readme_content)
+            if not force and manifest.is_fresh(unit, inputs):
+                results["skipped"].append(unit)
+                return unit
             
-            results["generated_files"].append(str(readme_path))
+            readme_path = base_path / "README.md"
+            results["generated_files"].extend(write_files({readme_path: readme_content}))
+            self._record(manifest, unit, inputs, [readme_path], results)
             
         except Exception as e:
-            results["warnings"].append(f"Documentation generation failed: {str(e)}")
\ No newline at end of file
+            results["warnings"].append(f"Documentation generation failed: {str(e)}")
+        
+        return unit
+
+def _task_context(module: Dict[str, Any], framework: str, base_path: Path) -> Dict[str, Any]:
+    """Build the picklable context passed to ``plugin.generate_code``
+
+    ``module["tasks"]`` lists the module's tasks by ID and title only, so each
+    task doesn't ship every sibling's full description to the workers.
+    """
+    summary = dict(module)
+    summary["tasks"] = [{"id": task.get("id"), "title": task.get("title", "")} for task in module.get("tasks", [])]
+    return {
+        "module": summary,
+        "framework": framework,
+        "target_path": str(base_path),
+    }
+
+def _scaffold_files(scaffold_result: Dict[str, Any]) -> List[str]:
+    """Files written by a scaffold, walking its output directory if the plugin did not list them"""
+    if scaffold_result.get("generated_files"):
+        return list(scaffold_result["generated_files"])
+    if scaffold_result.get("path"):
+        return [str(path) for path in sorted(Path(scaffold_result["path"]).rglob("*")) if path.is_file()]
+    return []
+
+def _run_plugin_task(plugin: BasePlugin, task: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one task through a plugin, turning exceptions into a failed result"""
+    try:
+        with span("plugin.generate_code", plugin=plugin.name, task=str(task.get("id"))):
+            return plugin.generate_code(task, context)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+def _init_worker(plugin: BasePlugin):
+    """Process-pool initializer: receive the plugin once per worker"""
+    global _worker_plugin
+    _worker_plugin = plugin
+
+def _generate_task_batch(jobs: List[tuple]) -> List[Dict[str, Any]]:
+    """Process-pool entry point: generate a batch of tasks in order"""
+    return [_run_plugin_task(_worker_plugin, task, context) for task, context in jobs]
@@ -0,0 +1,264 @@
+"""Local repair of almost-valid JSON plans returned by the AI
+
+A response that is cut off at max_tokens, wrapped in a markdown fence or
+carrying a trailing comma still holds a usable plan. Repairing it here
+costs microseconds; asking again costs a full completion.
+"""
+import json
+import re
+import threading
+from collections import Counter
+from typing import Dict, List, Any, Optional, Tuple
+
+PRIORITIES = ("high", "medium", "low")
+
+FENCE_PATTERN = re.compile(r"```(?:json|JSON)?\s*\n?(.*?)(?:```|$)", re.DOTALL)
+
+CLOSERS = {"{": "}", "[": "]"}
+
+class RepairStats:
+    """How often AI responses needed repair, and which repairs"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.responses = 0
+        self.repaired = 0
+        self.failed = 0
+        self.repairs: Counter = Counter()
+
+    def record(self, repairs: List[str], failed: bool = False):
+        with self._lock:
+            self.responses += 1
+            if failed:
+                self.failed += 1
+            elif repairs:
+                self.repaired += 1
+            self.repairs.update(repairs)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "responses": self.responses,
+                "repaired": self.repaired,
+                "failed": self.failed,
+                "repair_rate": self.repaired / self.responses if self.responses else 0.0,
+                "repairs": dict(self.repairs),
+            }
+
+repair_stats = RepairStats()
+
+def repair_json(text: str) -> Tuple[Any, List[str]]:
+    """Parse JSON, repairing fences, surrounding prose, trailing commas and truncation
+
+    Returns the value and the names of the repairs applied; raises
+    ValueError when nothing parseable is left.
+    """
+
+    try:
+        return json.loads(text), []
+    except json.JSONDecodeError:
+        pass
+
+    repairs = []
+    fenced = FENCE_PATTERN.search(text)
+    if fenced:
+        text = fenced.group(1)
+        repairs.append("markdown_fence")
+
+    start = text.find("{")
+    if start == -1:
+        raise ValueError("No JSON object in response")
+    if text[:start].strip():
+        repairs.append("surrounding_text")
+    text = text[start:]
+
+    cleaned, scan_repairs = _scan(text)
+    repairs.extend(repair for repair in scan_repairs if repair not in repairs or repair == "trailing_comma")
+    try:
+        return json.loads(cleaned), repairs
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Unrepairable JSON: {e}") from e
+
+def _scan(text: str) -> Tuple[str, List[str]]:
+    """Drop trailing commas and close whatever a truncated document left open
+
+    Tracks the last point at which every value written so far was complete,
+    so a truncated response is cut back to it rather than ending mid-key
+    or mid-number.
+    """
+
+    out: List[str] = []
+    stack: List[str] = []
+    # In an object: whether the next string is a key
+    expect_key: List[bool] = []
+    repairs = []
+    safe_length, safe_stack = 0, []
+    in_string = escaped = False
+    string_is_key = False
+    i = 0
+
+    while i < len(text):
+        char = text[i]
+        if in_string:
+            out.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+                if not string_is_key:
+                    safe_length, safe_stack = len(out), list(stack)
+            i += 1
+            continue
+
+        if char == '"':
+            in_string = True
+            string_is_key = bool(stack) and stack[-1] == "{" and expect_key[-1]
+            out.append(char)
+        elif char in "{[":
+            stack.append(char)
+            expect_key.append(char == "{")
+            out.append(char)
+            safe_length, safe_stack = len(out), list(stack)
+        elif char in "}]":
+            if not stack:
+                break
+            # Trailing comma before the closer
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+                repairs.append("trailing_comma")
+            out.append(CLOSERS[stack.pop()])
+            expect_key.pop()
+            safe_length, safe_stack = len(out), list(stack)
+            if not stack:
+                # Anything after the top-level value is noise
+                if text[i + 1:].strip() and "surrounding_text" not in repairs:
+                    repairs.append("surrounding_text")
+                break
+        elif char == ",":
+            safe_length, safe_stack = len(out), list(stack)
+            if stack and stack[-1] == "{":
+                expect_key[-1] = True
+            out.append(char)
+        elif char == ":":
+            if stack and stack[-1] == "{":
+                expect_key[-1] = False
+            out.append(char)
+        else:
+            out.append(char)
+        i += 1
+
+    if not stack and not in_string:
+        return "".join(out), repairs
+
+    # Truncated: keep only complete values and close the open containers
+    repairs.append("truncated")
+    kept = "".join(out[:safe_length]).rstrip()
+    if kept.endswith(","):
+        kept = kept[:-1]
+    return kept + "".join(CLOSERS[opener] for opener in reversed(safe_stack)), repairs
+
+def validate_plan(plan: Any, goal: str = "") -> List[str]:
+    """Fix a decoded plan in place so it matches the plan schema; returns the repairs made"""
+
+    if not isinstance(plan, dict):
+        raise ValueError("AI response is not a JSON object")
+
+    repairs = []
+    if not isinstance(plan.get("goal"), str) or not plan.get("goal"):
+        plan["goal"] = goal
+        repairs.append("missing_goal")
+
+    modules = plan.get("top_modules")
+    if not isinstance(modules, list):
+        plan["top_modules"] = modules = []
+        repairs.append("missing_modules")
+
+    valid_modules = [module for module in modules if isinstance(module, dict)]
+    if len(valid_modules) != len(modules):
+        plan["top_modules"] = modules = valid_modules
+        repairs.append("invalid_module")
+
+    seen_ids = set()
+    for m, module in enumerate(modules, 1):
+        if not module.get("id"):
+            module["id"] = f"module-{m}"
+            repairs.append("missing_id")
+        if not module.get("name"):
+            module["name"] = f"Module {m}"
+            repairs.append("missing_name")
+
+        tasks = module.get("tasks")
+        if not isinstance(tasks, list):
+            module["tasks"] = tasks = []
+            repairs.append("missing_tasks")
+        valid_tasks = [task for task in tasks if isinstance(task, dict) and task.get("title")]
+        if len(valid_tasks) != len(tasks):
+            module["tasks"] = tasks = valid_tasks
+            repairs.append("invalid_task")
+
+        for t, task in enumerate(tasks, 1):
+            if not task.get("id") or task["id"] in seen_ids:
+                task["id"] = _unique(f"task-{m}-{t}", seen_ids)
+                repairs.append("missing_id")
+            seen_ids.add(task["id"])
+
+            hours = _number(task.get("estimated_hours", 0))
+            if hours is None:
+                hours = 0
+                repairs.append("invalid_hours")
+            elif hours != task.get("estimated_hours", 0):
+                repairs.append("invalid_hours")
+            task["estimated_hours"] = hours
+
+            priority = str(task.get("priority", "medium")).lower()
+            if priority not in PRIORITIES:
+                priority = "medium"
+            if priority != task.get("priority", "medium"):
+                repairs.append("invalid_priority")
+            task["priority"] = priority
+
+            dependencies = task.get("dependencies", [])
+            if isinstance(dependencies, str):
+                dependencies = [dependencies]
+            if not isinstance(dependencies, list):
+                dependencies = []
+            dependencies = [str(dependency) for dependency in dependencies]
+            if dependencies != task.get("dependencies", []):
+                repairs.append("invalid_dependencies")
+            task["dependencies"] = dependencies
+
+    return repairs
+
+def parse_plan(content: str, goal: str = "") -> Tuple[Dict[str, Any], List[str]]:
+    """Decode and schema-check an AI plan response, repairing what can be repaired"""
+
+    try:
+        plan, repairs = repair_json(content)
+        repairs += validate_plan(plan, goal)
+    except ValueError:
+        repair_stats.record([], failed=True)
+        raise
+    repair_stats.record(repairs)
+    return plan, repairs
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    match = re.search(r"\d+(?:\.\d+)?", str(value))
+    if not match:
+        return None
+    number = float(match.group())
+    return int(number) if number.is_integer() else number
+
+def _unique(candidate: str, seen: set) -> str:
+    result, n = candidate, 2
+    while result in seen:
+        result = f"{candidate}-{n}"
+        n += 1
+    return result
@@ -0,0 +1,152 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+MANIFEST_FILE = ".aria-manifest.json"
+MANIFEST_VERSION = 1
+
+class BuildManifest:
+    """Record of which generation unit produced which file, for incremental rebuilds
+
+    A unit is one independently regenerated piece of output (the scaffold,
+    one task, the README). Each unit stores a fingerprint of its inputs and
+    each file stores the unit that wrote it plus a content hash.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.path = self.root / MANIFEST_FILE
+        self.units: Dict[str, str] = {}
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self._unit_files: Dict[str, List[str]] = {}
+
+    @classmethod
+    def load(cls, root: Path) -> "BuildManifest":
+        """Load the manifest from a target directory, or start an empty one"""
+
+        manifest = cls(root)
+        if not manifest.path.exists():
+            return manifest
+
+        try:
+            with open(manifest.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                raise ValueError(f"unsupported manifest version {data.get('version')}")
+            manifest.units = data.get("units", {})
+            manifest.files = data.get("files", {})
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable build manifest {manifest.path}: {e}")
+            manifest.units, manifest.files = {}, {}
+
+        for rel_path, entry in manifest.files.items():
+            manifest._unit_files.setdefault(entry["unit"], []).append(rel_path)
+        return manifest
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"version": MANIFEST_VERSION, "units": self.units, "files": self.files}
+
+    def save(self):
+        """Write the manifest next to the generated files
+
+        The file is replaced rather than rewritten, since in a staged build it
+        starts as a hard link to the live tree's manifest.
+        """
+
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+    @staticmethod
+    def fingerprint(*inputs: Any) -> str:
+        """Stable hash of JSON-serializable generation inputs"""
+
+        payload = json.dumps(inputs, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def hash_content(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def is_fresh(self, unit: str, inputs: str) -> bool:
+        """True when the unit's inputs are unchanged and its files are intact"""
+
+        if self.units.get(unit) != inputs:
+            return False
+
+        for rel_path in self._unit_files.get(unit, []):
+            entry = self.files[rel_path]
+            file_path = self.root / rel_path
+            try:
+                stat = file_path.stat()
+            except OSError:
+                return False
+            # Unchanged size and mtime means unchanged content; otherwise fall back to hashing
+            if stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns"):
+                continue
+            if self.hash_content(file_path.read_bytes()) != entry["hash"]:
+                return False
+
+        return True
+
+    def record(self, unit: str, inputs: str, files: Iterable[Any]) -> List[Path]:
+        """Store the files a unit produced; returns its previous files it no longer produces"""
+
+        previous = set(self._unit_files.pop(unit, []))
+        current = []
+
+        for file_path in files:
+            rel_path = self._relative(file_path)
+            if rel_path is None:
+                continue
+            absolute = self.root / rel_path
+            if not absolute.is_file():
+                continue
+            owner = self.files.get(rel_path, {}).get("unit")
+            if owner not in (None, unit) and rel_path in self._unit_files.get(owner, []):
+                self._unit_files[owner].remove(rel_path)
+            stat = absolute.stat()
+            self.files[rel_path] = {
+                "unit": unit,
+                "hash": self.hash_content(absolute.read_bytes()),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            }
+            current.append(rel_path)
+
+        self.units[unit] = inputs
+        self._unit_files[unit] = current
+
+        stale = previous - set(current)
+        for rel_path in stale:
+            self.files.pop(rel_path, None)
+        return [self.root / rel_path for rel_path in sorted(stale)]
+
+    def prune(self, active_units: Iterable[str]) -> List[Path]:
+        """Forget units that no longer exist in the plan; returns their orphaned files"""
+
+        active = set(active_units)
+        orphaned = []
+
+        for unit in [u for u in self.units if u not in active]:
+            del self.units[unit]
+            for rel_path in self._unit_files.pop(unit, []):
+                self.files.pop(rel_path, None)
+                orphaned.append(self.root / rel_path)
+
+        return sorted(orphaned)
+
+    def _relative(self, file_path: Any) -> Optional[str]:
+        """Path relative to the manifest root, or None for files outside it"""
+
+        try:
+            rel_path = Path(file_path).resolve().relative_to(self.root.resolve())
+        except ValueError:
+            return None
+        return rel_path.as_posix()
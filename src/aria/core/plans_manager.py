@@ -1,12 +1,16 @@
 import json
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 from ..config import config
 from ..utils.logger import setup_logger
+from ..utils.tracing import span
 
-logger = setup_logger()
+logger = setup_logger(__name__)
+
+# Plan summaries for list_plans, keyed by path and reused while (mtime, size) is unchanged
+_catalog_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
 
 class PlansManager:
     """Manage project plan files"""
@@ -32,8 +36,9 @@ class PlansManager:
         plan_with_meta["saved_at"] = datetime.now().isoformat()
         plan_with_meta["aria_version"] = "0.1.0"
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(plan_with_meta, f, indent=2, ensure_ascii=False)
+        with span("plans.save", file=str(file_path)):
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(plan_with_meta, f, indent=2, ensure_ascii=False)
         
         logger.info(f"Plan saved to: {file_path}")
         return file_path
@@ -45,10 +50,11 @@ class PlansManager:
         if not file_path.exists():
             raise FileNotFoundError(f"Plan file not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            plan = json.load(f)
+        with span("plans.load", file=str(file_path)):
+            with open(file_path, 'r', encoding='utf-8') as f:
+                plan = json.load(f)
         
-        logger.info(f"Plan loaded from: {file_path}")
+        logger.debug(f"Plan loaded from: {file_path}")
         return plan
     
     def list_plans(self) -> list[Dict[str, Any]]:
@@ -57,14 +63,25 @@ class PlansManager:
         plans = []
         for plan_file in self.plans_dir.glob("*.json"):
             try:
+                stat = plan_file.stat()
+                key = str(plan_file.resolve())
+                cached = _catalog_cache.get(key)
+                if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                    plans.append(cached[2])
+                    continue
+                
                 plan = self.load_plan(plan_file)
-                plans.append({
+                summary = {
                     "file": plan_file.name,
                     "goal": plan.get("goal", "Unknown"),
+                    "tech_stack": plan.get("tech_stack", ""),
+                    "constraints": plan.get("constraints", []),
                     "saved_at": plan.get("saved_at", ""),
                     "modules": len(plan.get("top_modules", [])),
                     "total_tasks": sum(len(m.get("tasks", [])) for m in plan.get("top_modules", []))
-                })
+                }
+                _catalog_cache[key] = (stat.st_mtime_ns, stat.st_size, summary)
+                plans.append(summary)
             except Exception as e:
                 logger.warning(f"Failed to load plan {plan_file}: {e}")
         
@@ -0,0 +1,117 @@
+"""Prompt text sent to the AI provider
+
+Providers cache prompts by prefix (DeepSeek context caching, OpenAI prompt
+caching), so everything static lives in the system prompts below and is
+sent byte-for-byte the same on every call. Per-request values only go in
+the user message that follows. Don't interpolate anything into these
+constants; a changed character early in a prompt invalidates the cached
+prefix after it.
+"""
+from typing import Dict, List, Any, Optional
+
+DECOMPOSE_SYSTEM_PROMPT = """You are an expert software architect and project planner. Your task is to decompose complex software development goals into structured, executable plans.
+
+Output MUST be valid JSON with this structure:
+{
+    "goal": "original goal",
+    "architecture_overview": "high-level description",
+    "total_hours": 100,
+    "top_modules": [
+        {
+            "id": "module-1",
+            "name": "Module Name",
+            "description": "What this module does",
+            "estimated_hours": 20,
+            "tasks": [
+                {
+                    "id": "task-1",
+                    "title": "Task title",
+                    "description": "Detailed description",
+                    "priority": "high|medium|low",
+                    "estimated_hours": 4,
+                    "dependencies": ["other-task-id"],
+                    "acceptance_criteria": ["list", "of", "criteria"]
+                }
+            ]
+        }
+    ],
+    "risks": ["list of potential risks"],
+    "success_criteria": ["list of success metrics"]
+}
+
+Decompose the project described in the user message into a structured development plan. Consider:
+1. Modular architecture
+2. Task dependencies
+3. Risk assessment
+4. Realistic time estimates
+5. Clear acceptance criteria
+
+If the user message includes an outline of a similar earlier project, reuse what fits and change what doesn't.
+
+Return JSON only, no other text."""
+
+REVIEW_SYSTEM_PROMPT = """You are an expert code reviewer. Analyze the provided code for:
+1. Security vulnerabilities
+2. Performance issues
+3. Code smells and anti-patterns
+4. Best practices compliance
+5. Potential bugs
+6. Readability and maintainability
+
+Provide specific, actionable feedback."""
+
+CONTINUE_PROMPT = "Your reply was cut off. Continue it from exactly where it stopped, without repeating anything or adding commentary."
+
+REVIEW_FINDINGS_SYSTEM_PROMPT = """You are an expert code reviewer. The user message holds one or more source files, or line ranges of them, each under a "### <path> (lines <first>-<last>)" header. Review them for:
+1. Security vulnerabilities
+2. Performance issues
+3. Code smells and anti-patterns
+4. Best practices compliance
+5. Potential bugs
+6. Readability and maintainability
+
+Report only real, specific problems; an empty list is a fine answer for clean code.
+
+Output MUST be valid JSON with this structure:
+{
+    "findings": [
+        {
+            "file": "path exactly as in the header",
+            "line": 42,
+            "severity": "critical|high|medium|low|info",
+            "category": "security|performance|bug|maintainability|style",
+            "message": "what is wrong",
+            "suggestion": "how to fix it"
+        }
+    ],
+    "summaries": {"path exactly as in the header": "one sentence on the overall quality of that code"}
+}
+
+Line numbers are line numbers in the file, within the range given in its header.
+
+Return JSON only, no other text."""
+
+def decompose_user_prompt(goal: str, tech_stack: str = "", constraints: Optional[List[str]] = None, seed: Optional[str] = None) -> str:
+    """The per-request part of a decomposition prompt"""
+
+    prompt = f"""Project Goal: {goal}
+Technology Stack: {tech_stack}
+Constraints: {constraints or []}
+"""
+    if seed:
+        prompt += f"""
+Similar earlier project:
+{seed}
+"""
+    return prompt
+
+def review_user_prompt(code: str) -> str:
+    return f"Please review this code:\n\n```\n{code}\n```"
+
+def review_chunk_prompt(pieces: List[Dict[str, Any]]) -> str:
+    """The per-request part of a findings review: each piece is a file or line range of one"""
+
+    return "\n\n".join(
+        f"### {piece['file']} (lines {piece['start']}-{piece['end']})\n```\n{piece['code']}\n```"
+        for piece in pieces
+    )
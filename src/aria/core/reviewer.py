@@ -0,0 +1,251 @@
+"""Map-reduce AI code review of a file or directory
+
+Source files are split into pieces of at most ``chunk_tokens`` tokens
+(breaking at top-level statements or blank lines where possible), small
+pieces are packed together so a request carries several files, and the
+requests run concurrently on a bounded thread pool. Findings come back as
+JSON and are merged locally, per file and for the whole project, without
+another AI call.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from ..config import config
+from ..utils.logger import setup_logger
+from ..utils.tracing import span
+from .ai_engine import AIEngine, JSON_OBJECT
+from .json_repair import repair_json
+from .prompts import REVIEW_FINDINGS_SYSTEM_PROMPT, review_chunk_prompt
+from .tokens import estimate_tokens
+
+logger = setup_logger(__name__)
+
+SOURCE_EXTENSIONS = frozenset({
+    ".py", ".js", ".jsx", ".ts", ".tsx", ".mjs", ".vue", ".svelte", ".go", ".rs", ".java", ".kt",
+    ".rb", ".php", ".c", ".h", ".cc", ".cpp", ".hpp", ".cs", ".swift", ".scala", ".sql", ".sh",
+})
+SKIP_DIRS = frozenset({"node_modules", "__pycache__", "venv", "dist", "build", "target", "vendor"})
+# Larger files are almost always generated or minified
+MAX_FILE_BYTES = 256 * 1024
+
+REVIEW_OUTPUT_TOKENS = 1500
+SEVERITIES = ("critical", "high", "medium", "low", "info")
+
+def collect_sources(path: Path) -> List[Tuple[str, str]]:
+    """(relative path, text) of the source files under ``path``, in walk order
+
+    A single file is reviewed whatever its extension. Hidden and dependency
+    directories, oversized files and files that aren't UTF-8 are skipped.
+    """
+
+    path = Path(path)
+    if path.is_file():
+        candidates = [path]
+        root = path.parent
+    else:
+        root = path
+        candidates = []
+        for directory, dirnames, filenames in os.walk(path):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith(".") and d not in SKIP_DIRS)
+            for filename in sorted(filenames):
+                if Path(filename).suffix.lower() in SOURCE_EXTENSIONS:
+                    candidates.append(Path(directory) / filename)
+
+    sources = []
+    for candidate in candidates:
+        try:
+            if candidate.stat().st_size > MAX_FILE_BYTES:
+                logger.info(f"Skipping large file {candidate}")
+                continue
+            text = candidate.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            logger.info(f"Skipping {candidate}: {e}")
+            continue
+        if text.strip():
+            sources.append((candidate.relative_to(root).as_posix(), text))
+    return sources
+
+def split_source(name: str, text: str, max_tokens: int) -> List[Dict[str, Any]]:
+    """Line ranges of one file, each within ``max_tokens``
+
+    A range is cut at the last top-level statement or blank line in its
+    second half, so functions and classes stay whole where they fit.
+    """
+
+    lines = text.splitlines()
+    max_chars = max_tokens * 4
+    pieces = []
+    start = 0
+    while start < len(lines):
+        tokens = 0
+        boundary = None
+        end = start
+        while end < len(lines):
+            line = lines[end]
+            if len(line) > max_chars:
+                lines[end] = line = line[:max_chars]
+            line_tokens = estimate_tokens(line) + 1
+            if tokens + line_tokens > max_tokens and end > start:
+                break
+            tokens += line_tokens
+            if tokens > max_tokens // 2:
+                # Cut after a blank line, or before a top-level statement
+                if not line.strip():
+                    boundary = end + 1
+                elif end > start and not line[0].isspace():
+                    boundary = end
+            end += 1
+        if end < len(lines) and boundary is not None:
+            end = boundary
+        code = "\n".join(lines[start:end])
+        pieces.append({"file": name, "start": start + 1, "end": end, "code": code, "tokens": estimate_tokens(code)})
+        start = end
+    return pieces
+
+def build_chunks(sources: List[Tuple[str, str]], max_tokens: int) -> List[List[Dict[str, Any]]]:
+    """Pieces of every source packed into requests of at most ``max_tokens``, in order"""
+
+    chunks: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    current_tokens = 0
+    for name, text in sources:
+        for piece in split_source(name, text, max_tokens):
+            if current and current_tokens + piece["tokens"] > max_tokens:
+                chunks.append(current)
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += piece["tokens"]
+    if current:
+        chunks.append(current)
+    return chunks
+
+def normalize_findings(result: Any, chunk: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    """Findings and per-file summaries of one response, coerced to the report schema"""
+
+    if not isinstance(result, dict):
+        raise ValueError("Review response is not a JSON object")
+
+    files = {piece["file"] for piece in chunk}
+    only_file = next(iter(files)) if len(files) == 1 else None
+    findings = []
+    for finding in result.get("findings") or []:
+        if not isinstance(finding, dict) or not finding.get("message"):
+            continue
+        name = finding.get("file")
+        if name not in files:
+            if only_file is None:
+                continue
+            name = only_file
+        try:
+            line = int(finding.get("line"))
+        except (TypeError, ValueError):
+            line = None
+        severity = str(finding.get("severity", "medium")).lower()
+        findings.append({
+            "file": name,
+            "line": line,
+            "severity": severity if severity in SEVERITIES else "medium",
+            "category": str(finding.get("category") or "general").lower(),
+            "message": str(finding["message"]).strip(),
+            "suggestion": str(finding.get("suggestion") or "").strip(),
+        })
+
+    summaries = result.get("summaries")
+    summaries = {
+        name: str(summary).strip()
+        for name, summary in (summaries.items() if isinstance(summaries, dict) else [])
+        if name in files and summary
+    }
+    return findings, summaries
+
+def merge_findings(path: str, results: List[Dict[str, Any]], files: List[str]) -> Dict[str, Any]:
+    """Project report from per-chunk results: findings grouped and deduplicated per file"""
+
+    per_file: Dict[str, Dict[str, Any]] = {name: {"findings": [], "summary": ""} for name in files}
+    seen = set()
+    failed = []
+    for result in results:
+        if result.get("error"):
+            failed.append({"files": result["files"], "error": result["error"]})
+            continue
+        for finding in result["findings"]:
+            key = (finding["file"], finding["line"], finding["message"].lower())
+            if key in seen:
+                continue
+            seen.add(key)
+            per_file[finding["file"]]["findings"].append(finding)
+        for name, summary in result["summaries"].items():
+            existing = per_file[name]["summary"]
+            per_file[name]["summary"] = f"{existing} {summary}".strip()
+
+    by_severity = dict.fromkeys(SEVERITIES, 0)
+    by_category: Dict[str, int] = {}
+    for report in per_file.values():
+        report["findings"].sort(key=lambda f: (SEVERITIES.index(f["severity"]), f["line"] or 0))
+        for finding in report["findings"]:
+            by_severity[finding["severity"]] += 1
+            by_category[finding["category"]] = by_category.get(finding["category"], 0) + 1
+
+    return {
+        "path": path,
+        "files_reviewed": len(files),
+        "chunks": len(results),
+        "failed_chunks": failed,
+        "summary": {
+            "findings": sum(by_severity.values()),
+            "by_severity": by_severity,
+            "by_category": dict(sorted(by_category.items(), key=lambda item: -item[1])),
+        },
+        "files": per_file,
+    }
+
+class ProjectReviewer:
+    """Reviews a file or directory through the AI, chunk by chunk and concurrently"""
+
+    def __init__(self, workers: Optional[int] = None, chunk_tokens: Optional[int] = None, ai_engine: Any = None):
+        self.workers = max(1, config.REVIEW_WORKERS if workers is None else workers)
+        self.chunk_tokens = config.REVIEW_CHUNK_TOKENS if chunk_tokens is None else chunk_tokens
+        self.ai_engine = ai_engine or AIEngine()
+
+    def review(self, path: Path, on_progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """Review report for ``path``; ``on_progress(done, total)`` is called as chunks finish"""
+
+        with span("review", path=str(path)) as trace:
+            with span("review.chunk"):
+                sources = collect_sources(path)
+                chunks = build_chunks(sources, self.chunk_tokens)
+            workers = min(self.workers, len(chunks)) or 1
+            trace.set(files=len(sources), chunks=len(chunks), workers=workers)
+            if on_progress:
+                on_progress(0, len(chunks))
+
+            results = []
+            with span("review.map"), ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(self._review_chunk, chunk) for chunk in chunks]
+                for done, future in enumerate(as_completed(futures), 1):
+                    results.append(future.result())
+                    if on_progress:
+                        on_progress(done, len(chunks))
+
+            with span("review.reduce"):
+                report = merge_findings(str(path), results, [name for name, _ in sources])
+            trace.set(findings=report["summary"]["findings"], failed=len(report["failed_chunks"]))
+        return report
+
+    def _review_chunk(self, chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Findings for one request; failures are reported in the result rather than raised"""
+
+        files = sorted({piece["file"] for piece in chunk})
+        messages = [
+            {"role": "system", "content": REVIEW_FINDINGS_SYSTEM_PROMPT},
+            {"role": "user", "content": review_chunk_prompt(chunk)}
+        ]
+        try:
+            content = self.ai_engine.complete(messages, 0.1, REVIEW_OUTPUT_TOKENS, JSON_OBJECT, kind="review")
+            result, _ = repair_json(content)
+            findings, summaries = normalize_findings(result, chunk)
+        except Exception as e:
+            logger.error(f"Review of {', '.join(files)} failed: {e}")
+            return {"files": files, "error": str(e)}
+        return {"files": files, "findings": findings, "summaries": summaries}
@@ -0,0 +1,115 @@
+"""Per-call model choice between a provider's fast and large model
+
+Each request kind ("outline" for decompositions, "review" for code
+reviews, "chat" for anything else) maps to a tier through
+config.MODEL_ROUTES. Two rules then adjust it:
+
+- size: a fast-tier call whose prompt plus completion budget exceeds
+  config.ROUTE_LARGE_TOKENS, or the fast model's context window, goes to
+  the large model;
+- latency: with config.ROUTE_LATENCY_TARGET set, a large-tier call whose
+  worst case (observed seconds per completion token times max_tokens)
+  misses the target goes to the fast model, if that is expected faster.
+
+Context windows come from tokens.CONTEXT_WINDOWS: the size rule never
+escalates to a large model with a smaller window than the fast one, and
+the latency rule only picks the fast model when the call fits its window.
+"""
+import threading
+from typing import Dict, Any, Optional, Tuple
+from ..config import config
+from .tokens import CONTEXT_WINDOWS, DEFAULT_CONTEXT_WINDOW
+
+TIERS = ("fast", "large")
+
+def parse_routes(spec: str) -> Dict[str, str]:
+    """Parse ``"outline=large,review=fast"`` into request kind -> tier"""
+
+    routes = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        kind, _, tier = item.partition("=")
+        if tier.strip() not in TIERS:
+            raise ValueError(f"Unknown model tier in MODEL_ROUTES: {item.strip()}")
+        routes[kind.strip()] = tier.strip()
+    return routes
+
+class RouteStats:
+    """Calls, tokens and latency per route and per model"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.routes: Dict[str, Dict[str, Any]] = {}
+        # model -> [seconds, completion tokens] of calls that reported usage
+        self.speed: Dict[str, list] = {}
+
+    def record(self, route: str, model: str, seconds: float, usage: Dict[str, Any], error: bool = False):
+        completion_tokens = usage.get("completion_tokens", 0) or 0
+        with self._lock:
+            stats = self.routes.setdefault(route, {
+                "model": model, "calls": 0, "errors": 0, "seconds": 0.0,
+                "prompt_tokens": 0, "completion_tokens": 0,
+            })
+            stats["model"] = model
+            stats["calls"] += 1
+            stats["errors"] += error
+            stats["seconds"] += seconds
+            stats["prompt_tokens"] += usage.get("prompt_tokens", 0) or 0
+            stats["completion_tokens"] += completion_tokens
+            if completion_tokens and not error:
+                speed = self.speed.setdefault(model, [0.0, 0])
+                speed[0] += seconds
+                speed[1] += completion_tokens
+
+    def seconds_per_token(self, model: str) -> Optional[float]:
+        """Observed seconds per completion token of ``model``, None before any call"""
+
+        with self._lock:
+            speed = self.speed.get(model)
+            return speed[0] / speed[1] if speed else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                route: {**stats, "avg_seconds": stats["seconds"] / stats["calls"] if stats["calls"] else 0.0}
+                for route, stats in self.routes.items()
+            }
+
+route_stats = RouteStats()
+
+class ModelRouter:
+    """Chooses the model for each call of one provider"""
+
+    def __init__(self, provider: str):
+        self.provider = provider
+        self.models = {tier: getattr(config, f"{provider.upper()}_{tier.upper()}_MODEL", None) for tier in TIERS}
+        self.routes = parse_routes(config.MODEL_ROUTES)
+
+    def route(self, kind: str, prompt_tokens: int, max_tokens: int) -> Tuple[str, str]:
+        """(route name, model) for a request of ``kind``; the route name is "<kind>:<tier>[:<rule>]" """
+
+        if not all(self.models.values()):
+            raise ValueError(f"Unsupported AI provider: {self.provider}")
+
+        tier = self.routes.get(kind, "large")
+        rule = ""
+        needed = prompt_tokens + max_tokens
+        windows = {tier: CONTEXT_WINDOWS.get(model, DEFAULT_CONTEXT_WINDOW) for tier, model in self.models.items()}
+        if tier == "fast" and windows["large"] >= windows["fast"] and (
+            needed > config.ROUTE_LARGE_TOKENS or needed > windows["fast"]
+        ):
+            tier, rule = "large", "size"
+        elif (
+            tier == "large"
+            and config.ROUTE_LATENCY_TARGET > 0
+            and self.models["fast"] != self.models["large"]
+            and needed <= windows["fast"]
+        ):
+            large = route_stats.seconds_per_token(self.models["large"])
+            fast = route_stats.seconds_per_token(self.models["fast"])
+            if large is not None and large * max_tokens > config.ROUTE_LATENCY_TARGET and (fast is None or fast < large):
+                tier, rule = "fast", "latency"
+
+        name = f"{kind}:{tier}:{rule}" if rule else f"{kind}:{tier}"
+        return name, self.models[tier]
@@ -1,5 +1,6 @@
 import time
-from typing import Dict, Any, List
+from pathlib import Path
+from typing import Dict, Any, List, Optional
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
@@ -8,14 +9,14 @@ from rich.prompt import Confirm, IntPrompt
 from .generator import CodeGenerator
 from ..utils.logger import setup_logger
 
-logger = setup_logger()
+logger = setup_logger(__name__)
 
 class PlanRunner:
     """Execute project plans step-by-step"""
     
-    def __init__(self, plan: Dict[str, Any]):
+    def __init__(self, plan: Dict[str, Any], workers: Optional[int] = None):
         self.plan = plan
-        self.generator = CodeGenerator()
+        self.generator = CodeGenerator(workers=workers)
         self.console = Console()
     
     def run_interactive(self):
@@ -50,7 +51,7 @@ class PlanRunner:
         
         self.console.print("[bold green]✅ Project execution completed![/bold green]")
     
-    def run_automated(self):
+    def run_automated(self, force: bool = False):
         """Run plan in automated mode"""
         
         self.console.print(Panel.fit(
@@ -59,11 +60,15 @@ class PlanRunner:
             border_style="blue"
         ))
         
-        results = self.generator.generate_project(self.plan, Path("./generated-project"))
+        results = self.generator.generate_project(self.plan, Path("./generated-project"), force=force)
         
         if results["success"]:
             self.console.print(f"[green]✅ Project generated successfully![/green]")
             self.console.print(f"[blue]Generated {len(results['generated_files'])} files[/blue]")
+            if results["skipped"]:
+                self.console.print(f"[blue]Skipped {len(results['skipped'])} unchanged units[/blue]")
+            if results["deleted_files"]:
+                self.console.print(f"[blue]Deleted {len(results['deleted_files'])} orphaned files[/blue]")
         else:
             self.console.print(f"[red]❌ Project generation failed[/red]")
             for error in results["errors"]:
@@ -0,0 +1,237 @@
+import heapq
+from typing import Dict, List, Any, Optional, Sequence, FrozenSet
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+PRIORITY_RANK = {"high": 2, "medium": 1, "low": 0}
+
+class TaskGraph:
+    """Flattened dependency DAG of a plan's tasks"""
+
+    def __init__(self, plan: Dict[str, Any]):
+        self.ids: List[str] = []
+        self.titles: List[str] = []
+        self.hours: List[float] = []
+        self.priorities: List[str] = []
+        self.skills: List[FrozenSet[str]] = []
+
+        raw_dependencies = []
+        for module in plan.get("top_modules", []):
+            for task in module.get("tasks", []):
+                self.ids.append(str(task.get("id", f"task-{len(self.ids)}")))
+                self.titles.append(task.get("title", ""))
+                self.hours.append(_to_hours(task.get("estimated_hours", 0)))
+                self.priorities.append(task.get("priority", "medium"))
+                self.skills.append(frozenset(s.lower() for s in task.get("skills", []) or []))
+                raw_dependencies.append(task.get("dependencies", []) or [])
+
+        index = {task_id: i for i, task_id in enumerate(self.ids)}
+        self.index = index
+
+        # Resolve dependency IDs to indexes, ignoring unknown ones like _validate_plan does
+        self.dependencies: List[List[int]] = []
+        self.dependents: List[List[int]] = [[] for _ in self.ids]
+        for i, deps in enumerate(raw_dependencies):
+            resolved = []
+            for dep_id in deps:
+                j = index.get(dep_id)
+                if j is None or j == i:
+                    logger.debug(f"Ignoring invalid dependency {dep_id} of task {self.ids[i]}")
+                    continue
+                resolved.append(j)
+                self.dependents[j].append(i)
+            self.dependencies.append(resolved)
+
+        self.order = self._topological_order()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _topological_order(self) -> List[int]:
+        """Kahn's algorithm; raises ValueError on dependency cycles"""
+
+        indegree = [len(deps) for deps in self.dependencies]
+        queue = [i for i, degree in enumerate(indegree) if degree == 0]
+        order = []
+
+        while queue:
+            i = queue.pop()
+            order.append(i)
+            for j in self.dependents[i]:
+                indegree[j] -= 1
+                if indegree[j] == 0:
+                    queue.append(j)
+
+        if len(order) != len(self.ids):
+            cyclic = [self.ids[i] for i, degree in enumerate(indegree) if degree > 0]
+            raise ValueError(f"Plan has circular task dependencies: {', '.join(cyclic[:5])}")
+
+        return order
+
+    def levels(self) -> List[List[int]]:
+        """Group tasks by depth so each level only depends on earlier levels"""
+
+        depth = [0] * len(self.ids)
+        for i in self.order:
+            for j in self.dependencies[i]:
+                depth[i] = max(depth[i], depth[j] + 1)
+
+        levels: List[List[int]] = [[] for _ in range(max(depth, default=-1) + 1)]
+        for i, d in enumerate(depth):
+            levels[d].append(i)
+        return levels
+
+    def bottom_levels(self) -> List[float]:
+        """Longest remaining path (including the task itself) from each task"""
+
+        rank = [0.0] * len(self.ids)
+        for i in reversed(self.order):
+            tail = max((rank[j] for j in self.dependents[i]), default=0.0)
+            rank[i] = self.hours[i] + tail
+        return rank
+
+class ScheduleSimulator:
+    """Discrete-event list-scheduling simulation of a plan on N workers"""
+
+    def __init__(self, plan: Dict[str, Any]):
+        self.graph = TaskGraph(plan)
+        # Critical-path-first priority list, computed once and reused across worker sweeps
+        self.rank = self.graph.bottom_levels()
+
+    @property
+    def critical_path_hours(self) -> float:
+        return max(self.rank, default=0.0)
+
+    def simulate(self, workers: int, worker_skills: Optional[Sequence[Sequence[str]]] = None) -> Dict[str, Any]:
+        """Simulate the plan and return makespan, utilization and idle gaps
+
+        ``worker_skills`` optionally lists the skill tags of the first workers;
+        any remaining workers are generalists that can pick up every task.
+        """
+
+        if workers < 1:
+            raise ValueError("At least one worker is required")
+
+        graph = self.graph
+        skills: List[Optional[FrozenSet[str]]] = [None] * workers
+        for w, tags in enumerate(list(worker_skills or [])[:workers]):
+            skills[w] = frozenset(t.strip().lower() for t in tags if t.strip())
+
+        # One ready heap per distinct skill requirement keeps worker matching cheap
+        ready: Dict[FrozenSet[str], List] = {}
+        ready_count = 0
+        remaining = [len(deps) for deps in graph.dependencies]
+
+        def push_ready(i: int):
+            nonlocal ready_count
+            ready_count += 1
+            key = (-self.rank[i], -PRIORITY_RANK.get(graph.priorities[i], 1), i)
+            heapq.heappush(ready.setdefault(graph.skills[i], []), key)
+
+        for i, count in enumerate(remaining):
+            if count == 0:
+                push_ready(i)
+
+        def pick_task(w: int) -> Optional[int]:
+            nonlocal ready_count
+            best_heap = None
+            for requirement, heap in ready.items():
+                if not heap:
+                    continue
+                if skills[w] is not None and not requirement <= skills[w]:
+                    continue
+                if best_heap is None or heap[0] < best_heap[0]:
+                    best_heap = heap
+            if best_heap is None:
+                return None
+            ready_count -= 1
+            return heapq.heappop(best_heap)[2]
+
+        events: List = []  # (finish_time, worker, task)
+        free = list(range(workers))
+        free_since = [0.0] * workers
+        busy = [0.0] * workers
+        task_counts = [0] * workers
+        idle_gaps: List[Dict[str, Any]] = []
+        schedule: List[Dict[str, Any]] = []
+        now = 0.0
+        done = 0
+
+        while done < len(graph):
+            still_free = []
+            for w in free:
+                i = pick_task(w) if ready_count else None
+                if i is None:
+                    still_free.append(w)
+                    continue
+                if now > free_since[w]:
+                    idle_gaps.append({"worker": w, "start": free_since[w], "end": now})
+                finish = now + graph.hours[i]
+                busy[w] += graph.hours[i]
+                task_counts[w] += 1
+                schedule.append({"task_id": graph.ids[i], "worker": w, "start": now, "end": finish})
+                heapq.heappush(events, (finish, w, i))
+            free = still_free
+
+            if not events:
+                blocked = [graph.ids[i] for heap in ready.values() for _, _, i in heap]
+                raise ValueError(f"No worker has the skills required by tasks: {', '.join(blocked[:5])}")
+
+            # Advance the clock to the next completion and release everything finishing then
+            now = events[0][0]
+            while events and events[0][0] == now:
+                _, w, i = heapq.heappop(events)
+                done += 1
+                free.append(w)
+                free_since[w] = now
+                for j in graph.dependents[i]:
+                    remaining[j] -= 1
+                    if remaining[j] == 0:
+                        push_ready(j)
+
+        makespan = now
+        for w in range(workers):
+            if free_since[w] < makespan:
+                idle_gaps.append({"worker": w, "start": free_since[w], "end": makespan})
+
+        worker_stats = [
+            {
+                "worker": w,
+                "skills": sorted(skills[w]) if skills[w] is not None else [],
+                "tasks": task_counts[w],
+                "busy_hours": busy[w],
+                "utilization": busy[w] / makespan if makespan else 0.0,
+            }
+            for w in range(workers)
+        ]
+
+        total_hours = sum(graph.hours)
+        return {
+            "workers": workers,
+            "tasks": len(graph),
+            "makespan": makespan,
+            "total_hours": total_hours,
+            "critical_path_hours": self.critical_path_hours,
+            "utilization": total_hours / (makespan * workers) if makespan else 0.0,
+            "idle_hours": makespan * workers - total_hours,
+            "worker_stats": worker_stats,
+            "idle_gaps": idle_gaps,
+            "schedule": schedule,
+        }
+
+    def sweep(self, max_workers: int, worker_skills: Optional[Sequence[Sequence[str]]] = None) -> List[Dict[str, Any]]:
+        """Simulate 1..max_workers workers for capacity planning"""
+
+        results = []
+        for workers in range(1, max_workers + 1):
+            result = self.simulate(workers, worker_skills)
+            results.append({k: result[k] for k in ("workers", "makespan", "utilization", "idle_hours")})
+        return results
+
+def _to_hours(value: Any) -> float:
+    """Coerce an AI-provided hour estimate to a non-negative float"""
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return 0.0
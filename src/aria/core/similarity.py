@@ -0,0 +1,72 @@
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Any, Optional
+
+STOP_WORDS = frozenset("""
+a an and app application are as at be build builds building by create for from in into is it make of on or
+platform project site that the to using with web website
+""".split())
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stop words; "Next.js" becomes "nextjs" """
+    return [token for token in TOKEN_PATTERN.findall(text.lower().replace(".", "")) if token not in STOP_WORDS]
+
+def plan_text(goal: str, tech_stack: str = "", constraints: Optional[List[str]] = None) -> str:
+    return " ".join([goal, tech_stack or "", *(constraints or [])])
+
+class SimilarityIndex:
+    """TF-IDF vectors of short documents, compared by cosine similarity
+
+    Small and dependency-free: meant for catalogs of a few thousand saved
+    plans, rebuilt whenever the catalog is read.
+    """
+
+    def __init__(self, documents: List[str]):
+        self.counts = [Counter(tokenize(document)) for document in documents]
+        document_frequency: Counter = Counter()
+        for counts in self.counts:
+            document_frequency.update(counts.keys())
+        total = len(documents)
+        # Smoothed so terms found in every document still count
+        self.idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in document_frequency.items()}
+        self.default_idf = math.log(1 + total) + 1
+        self.vectors = [self._vector(counts) for counts in self.counts]
+
+    def _vector(self, counts: Counter) -> Dict[str, float]:
+        vector = {term: count * self.idf.get(term, self.default_idf) for term, count in counts.items()}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        return {term: weight / norm for term, weight in vector.items()} if norm else {}
+
+    def scores(self, document: str) -> List[float]:
+        """Cosine similarity of ``document`` with every indexed document, in index order"""
+
+        query = self._vector(Counter(tokenize(document)))
+        return [
+            sum(weight * vector.get(term, 0.0) for term, weight in query.items())
+            for vector in self.vectors
+        ]
+
+def find_similar_plan(
+    catalog: List[Dict[str, Any]],
+    goal: str,
+    tech_stack: str = "",
+    constraints: Optional[List[str]] = None,
+    threshold: float = 0.0
+) -> Optional[Dict[str, Any]]:
+    """Most similar catalog entry (as listed by PlansManager.list_plans) scoring at least ``threshold``"""
+
+    if not catalog:
+        return None
+
+    index = SimilarityIndex([
+        plan_text(entry.get("goal", ""), entry.get("tech_stack", ""), entry.get("constraints"))
+        for entry in catalog
+    ])
+    scores = index.scores(plan_text(goal, tech_stack, constraints))
+    best = max(range(len(catalog)), key=scores.__getitem__)
+    if scores[best] < threshold:
+        return None
+    return {**catalog[best], "similarity": scores[best]}
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from collections.abc import Mapping
+from typing import Dict, List, Any, Iterator, Optional
 from pathlib import Path
-import importlib.util
-import sys
+import importlib
+from ..utils.tracing import span
 
 class BasePlugin(ABC):
     """Base class for all aria plugins"""
@@ -37,43 +38,126 @@ class BasePlugin(ABC):
     
     @abstractmethod
     def generate_code(self, task: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate code for specific task"""
+        """Generate code for specific task
+
+        ``context`` holds ``module`` (the task's module; its ``tasks`` list
+        only carries each task's ``id`` and ``title``), ``framework`` and
+        ``target_path``. Existing files must be replaced, not rewritten in
+        place (``aria.utils.file_ops.write_files`` does this): in a staged
+        build they are hard links to the live project.
+        """
         pass
 
+# Entry point group third-party packages use to register plugins, e.g. in pyproject.toml:
+#   [project.entry-points."aria.plugins"]
+#   django = "aria_django.plugin:DjangoPlugin"
+PLUGIN_ENTRY_POINT_GROUP = "aria.plugins"
+
+class PluginSpec:
+    """Plugin metadata, available without importing the plugin itself"""
+    
+    def __init__(self, name: str, target: str, description: str = "", frameworks: Optional[List[str]] = None):
+        self.name = name.lower()
+        self.target = target  # "package.module:ClassName"
+        self.description = description
+        self.frameworks = [f.lower() for f in (frameworks if frameworks is not None else [name])]
+    
+    def load(self) -> BasePlugin:
+        """Import and instantiate the plugin"""
+        module_name, _, attr = self.target.partition(":")
+        obj = importlib.import_module(module_name)
+        for part in attr.split("."):
+            obj = getattr(obj, part)
+        return obj() if isinstance(obj, type) else obj
+
+BUILTIN_PLUGINS = [
+    PluginSpec(
+        "nextjs", "aria.plugins.nextjs:NextJSPlugin",
+        "Next.js 14+ project scaffolding and analysis", ["nextjs", "next", "next.js"]
+    ),
+    PluginSpec(
+        "flask", "aria.plugins.python_flask:FlaskPlugin",
+        "Flask project scaffolding and analysis", ["flask"]
+    ),
+    PluginSpec(
+        "code_review", "aria.plugins.code_review:CodeReviewPlugin",
+        "AI-powered code review and analysis", []
+    ),
+]
+
 class PluginManager:
-    """Manage loading and execution of plugins"""
+    """Manage loading and execution of plugins
+    
+    Plugins are registered by metadata and only imported and instantiated
+    the first time they are requested.
+    """
     
     def __init__(self):
-        self.plugins: Dict[str, BasePlugin] = {}
+        self.specs: Dict[str, PluginSpec] = {}
+        self._instances: Dict[str, BasePlugin] = {}
+        self._discovered = False
+        self.plugins = _LazyPlugins(self)
         self.load_builtin_plugins()
     
     def load_builtin_plugins(self):
-        """Load built-in plugins"""
-        try:
-            from .nextjs import NextJSPlugin
-            self.register_plugin(NextJSPlugin())
-        except ImportError as e:
-            print(f"Warning: Could not load NextJS plugin: {e}")
-        
-        try:
-            from .python_flask import FlaskPlugin
-            self.register_plugin(FlaskPlugin())
-        except ImportError as e:
-            print(f"Warning: Could not load Flask plugin: {e}")
+        """Register built-in plugins"""
+        for spec in BUILTIN_PLUGINS:
+            self.register_spec(spec)
+    
+    def discover_plugins(self):
+        """Register third-party plugins advertised through package entry points"""
+        if self._discovered:
+            return
+        self._discovered = True
         
         try:
-            from .code_review import CodeReviewPlugin
-            self.register_plugin(CodeReviewPlugin())
-        except ImportError as e:
-            print(f"Warning: Could not load Code Review plugin: {e}")
+            for entry_point in _entry_points(PLUGIN_ENTRY_POINT_GROUP):
+                if entry_point.name.lower() not in self.specs:
+                    self.register_spec(PluginSpec(entry_point.name, entry_point.value))
+        except Exception as e:
+            print(f"Warning: Could not discover plugins: {e}")
+    
+    def register_spec(self, spec: PluginSpec):
+        """Register a plugin by metadata without importing it"""
+        self.specs[spec.name] = spec
     
     def register_plugin(self, plugin: BasePlugin):
         """Register a plugin"""
-        self.plugins[plugin.name.lower()] = plugin
+        name = plugin.name.lower()
+        self._instances[name] = plugin
+        if name not in self.specs:
+            target = f"{type(plugin).__module__}:{type(plugin).__qualname__}"
+            self.register_spec(PluginSpec(name, target, plugin.description))
     
     def get_plugin(self, name: str) -> Optional[BasePlugin]:
-        """Get plugin by name"""
-        return self.plugins.get(name.lower())
+        """Get plugin by name or supported framework, loading it on first use"""
+        key = self._resolve(name)
+        if key is None:
+            return None
+        
+        if key not in self._instances:
+            try:
+                self._instances[key] = self.specs[key].load()
+            except Exception as e:
+                print(f"Warning: Could not load {key} plugin: {e}")
+                return None
+        
+        return self._instances[key]
+    
+    def _resolve(self, name: str) -> Optional[str]:
+        """Map a plugin name or framework alias to a registered plugin name"""
+        name = name.lower()
+        for attempt in range(2):
+            if name in self.specs:
+                return name
+            for spec in self.specs.values():
+                if name in spec.frameworks:
+                    return spec.name
+            if attempt == 0 and not self._discovered:
+                self.discover_plugins()
+            else:
+                break
+        return None
     
     def analyze_project(self, project_path: Path) -> Dict[str, Any]:
         """Auto-detect project type and analyze"""
@@ -81,11 +165,13 @@ class PluginManager:
         if (project_path / "package.json").exists():
             plugin = self.get_plugin("nextjs")
             if plugin:
-                return plugin.analyze_project(project_path)
+                with span("plugin.analyze_project", plugin=plugin.name, path=str(project_path)):
+                    return plugin.analyze_project(project_path)
         elif (project_path / "requirements.txt").exists() or (project_path / "pyproject.toml").exists():
             plugin = self.get_plugin("flask")
             if plugin:
-                return plugin.analyze_project(project_path)
+                with span("plugin.analyze_project", plugin=plugin.name, path=str(project_path)):
+                    return plugin.analyze_project(project_path)
         
         return {"framework": "unknown", "files_analyzed": 0, "issues": [], "recommendations": []}
     
@@ -98,4 +184,46 @@ class PluginManager:
                 "error": f"Template '{template}' not found. Available: {list(self.plugins.keys())}"
             }
         
-        return plugin.scaffold_project(name, path)
\ No newline at end of file
+        with span("plugin.scaffold_project", plugin=plugin.name, project=name):
+            return plugin.scaffold_project(name, path)
+
+_default_manager: Optional[PluginManager] = None
+
+def get_plugin_manager() -> PluginManager:
+    """Process-wide plugin registry, so long-lived processes keep plugins loaded"""
+    global _default_manager
+    if _default_manager is None:
+        _default_manager = PluginManager()
+    return _default_manager
+
+class _LazyPlugins(Mapping):
+    """Read-only name -> plugin view that instantiates plugins on access"""
+    
+    def __init__(self, manager: PluginManager):
+        self._manager = manager
+    
+    def __getitem__(self, name: str) -> BasePlugin:
+        plugin = self._manager.get_plugin(name) if name.lower() in self._manager.specs else None
+        if plugin is None:
+            raise KeyError(name)
+        return plugin
+    
+    def __iter__(self) -> Iterator[str]:
+        self._manager.discover_plugins()
+        return iter(self._manager.specs)
+    
+    def __len__(self) -> int:
+        self._manager.discover_plugins()
+        return len(self._manager.specs)
+    
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._manager._resolve(name) == name.lower()
+
+def _entry_points(group: str):
+    """Entry points of a group across Python versions"""
+    from importlib.metadata import entry_points
+    
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        return eps.select(group=group)
+    return eps.get(group, [])
@@ -1,13 +1,21 @@
 from pathlib import Path
 from typing import Dict, List, Any
-from ..core.ai_engine import AIEngine
 from .base import BasePlugin
+from ..core.prompts import REVIEW_SYSTEM_PROMPT, review_user_prompt
 
 class CodeReviewPlugin(BasePlugin):
     """Code review plugin for aria"""
     
     def __init__(self):
-        self.ai_engine = AIEngine()
+        self._ai_engine = None
+    
+    @property
+    def ai_engine(self):
+        """AI engine, created on first review so loading the plugin stays cheap"""
+        if self._ai_engine is None:
+            from ..core.ai_engine import AIEngine
+            self._ai_engine = AIEngine()
+        return self._ai_engine
     
     @property
     def name(self) -> str:
@@ -27,7 +35,7 @@ class CodeReviewPlugin(BasePlugin):
             "framework": "code_review",
             "files_analyzed": 0,
             "issues": [],
-            "recommendations": ["Use 'aria review <file>' to analyze specific files"]
+            "recommendations": ["Run 'aria review <path>' for an AI review of a file or the whole project"]
         }
     
     def scaffold_project(self, project_name: str, target_path: Path) -> Dict[str, Any]:
@@ -47,25 +55,14 @@ class CodeReviewPlugin(BasePlugin):
                 "error": "No code provided for review"
             }
         
-        system_prompt = """You are an expert code reviewer. Analyze the provided code for:
-1. Security vulnerabilities
-2. Performance issues
-3. Code smells and anti-patterns
-4. Best practices compliance
-5. Potential bugs
-6. Readability and maintainability
-
-Provide specific, actionable feedback."""
-        
-        user_prompt = f"Please review this code:\n\n```\n{code_to_review}\n```"
-        
+        # Static system prompt first so providers can reuse the cached prefix
         messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
+            {"role": "system", "content": REVIEW_SYSTEM_PROMPT},
+            {"role": "user", "content": review_user_prompt(code_to_review)}
         ]
         
         try:
-            response = self.ai_engine.chat_completion(messages, temperature=0.1)
+            response = self.ai_engine.chat_completion(messages, temperature=0.1, kind="review")
             review = response["choices"][0]["message"]["content"]
             
             return {
@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import Dict, List, Any
 import json
+from ..utils.templates import get_template_pack
 from .base import BasePlugin
 
 class NextJSPlugin(BasePlugin):
@@ -71,112 +72,13 @@ class NextJSPlugin(BasePlugin):
         try:
             project_dir.mkdir(parents=True, exist_ok=True)
             
-            # Create package.json
-            package_json = {
-                "name": project_name,
-                "version": "0.1.0",
-                "private": True,
-                "scripts": {
-                    "dev": "next dev",
-                    "build": "next build",
-                    "start": "next start",
-                    "lint": "next lint"
-                },
-                "dependencies": {
-                    "next": "14.0.0",
-                    "react": "^18.0.0",
-                    "react-dom": "^18.0.0"
-                },
-                "devDependencies": {
-                    "typescript": "^5.0.0",
-                    "@types/node": "^20.0.0",
-                    "@types/react": "^18.0.0",
-                    "@types/react-dom": "^18.0.0",
-                    "eslint": "^8.0.0",
-                    "eslint-config-next": "14.0.0"
-                }
-            }
-            
-            with open(project_dir / "package.json", "w") as f:
-                json.dump(package_json, f, indent=2)
-            
-            # Create basic app structure
-            app_dir = project_dir / "app"
-            app_dir.mkdir(exist_ok=True)
-            
-            # Create layout.tsx
-            layout_content = """export const metadata = {
-  title: 'Next.js',
-  description: 'Generated by create next app',
-}
-
-export default function RootLayout({
-  children,
-}: {
-  children: React.ReactNode
-}) {
-  return (
-    <html lang="en">
-      <body>{children}</body>
-    </html>
-  )
-}
-"""
-            with open(app_dir / "layout.tsx", "w") as f:
-                f.write(layout_content)
-            
-            # Create page.tsx
-            page_content = """export default function Home() {
-  return (
-    <main>
-      <h1>Welcome to {project_name}</h1>
-      <p>Built with Next.js 14</p>
-    </main>
-  )
-}
-""".format(project_name=project_name)
-            
-            with open(app_dir / "page.tsx", "w") as f:
-                f.write(page_content)
-            
-            # Create additional config files
-            with open(project_dir / "next.config.js", "w") as f:
-                f.write("/** @type {import('next').NextConfig} */\nconst nextConfig = {}\n\nmodule.exports = nextConfig\n")
-            
-            with open(project_dir / "tsconfig.json", "w") as f:
-                f.write("""{
-  "compilerOptions": {
-    "target": "es5",
-    "lib": ["dom", "dom.iterable", "es6"],
-    "allowJs": true,
-    "skipLibCheck": true,
-    "strict": true,
-    "noEmit": true,
-    "esModuleInterop": true,
-    "module": "esnext",
-    "moduleResolution": "bundler",
-    "resolveJsonModule": true,
-    "isolatedModules": true,
-    "jsx": "preserve",
-    "incremental": true,
-    "plugins": [
-      {
-        "name": "next"
-      }
-    ],
-    "baseUrl": ".",
-    "paths": {
-      "@/*": ["./*"]
-    }
-  },
-  "include": ["next-env.d.ts", "**/*.ts", "**/*.tsx", ".next/types/**/*.ts"],
-  "exclude": ["node_modules"]
-}
-""")
+            # package.json, app router files and config from the bundled template pack
+            generated_files = get_template_pack("nextjs").write(project_dir, {"project_name": project_name})
             
             return {
                 "success": True,
                 "path": str(project_dir),
+                "generated_files": generated_files,
                 "next_steps": [
                     f"cd {project_name}",
                     "npm install",
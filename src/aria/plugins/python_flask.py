@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import Dict, List, Any
 import json
+from ..utils.templates import get_template_pack
 from .base import BasePlugin
 
 class FlaskPlugin(BasePlugin):
@@ -61,48 +62,13 @@ class FlaskPlugin(BasePlugin):
         try:
             project_dir.mkdir(parents=True, exist_ok=True)
             
-            # Create requirements.txt
-            requirements_content = """flask
-python-dotenv
-"""
-            with open(project_dir / "requirements.txt", "w") as f:
-                f.write(requirements_content)
-            
-            # Create app.py
-            app_content = """from flask import Flask
-
-app = Flask(__name__)
-
-@app.route('/')
-def hello_world():
-    return 'Hello, World!'
-
-if __name__ == '__main__':
-    app.run(debug=True)
-"""
-            with open(project_dir / "app.py", "w") as f:
-                f.write(app_content)
-            
-            # Create .env file
-            with open(project_dir / ".env", "w") as f:
-                f.write("FLASK_APP=app.py\nFLASK_ENV=development\n")
-            
-            # Create .gitignore
-            gitignore_content = """__pycache__/
-*.pyc
-*.pyo
-*.pyd
-.Python
-env/
-venv/
-.venv/
-"""
-            with open(project_dir / ".gitignore", "w") as f:
-                f.write(gitignore_content)
+            # requirements.txt, app.py, .env and .gitignore from the bundled template pack
+            generated_files = get_template_pack("flask").write(project_dir, {"project_name": project_name})
             
             return {
                 "success": True,
                 "path": str(project_dir),
+                "generated_files": generated_files,
                 "next_steps": [
                     f"cd {project_name}",
                     "python -m venv venv",
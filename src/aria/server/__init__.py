@@ -0,0 +1 @@
+"""Long-running aria services"""
@@ -0,0 +1,193 @@
+import hmac
+import json
+import re
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+from .. import __version__
+from ..config import config
+from ..utils.logger import setup_logger
+from .jobs import JOB_HANDLERS, JOB_STATUSES, JobQueue, JobWorkerPool
+
+logger = setup_logger(__name__)
+
+# Request bodies carry goals and inline plans, not uploads
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+JOB_PATH = re.compile(r"^/jobs/([0-9a-f]{32})(/result)?$")
+
+LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
+class ApiServer:
+    """Local HTTP/JSON API in front of a persistent job queue
+
+    Endpoints:
+      POST /jobs               {"type": "decompose|generate|analyze", "params": {...}} -> 202 job
+      GET  /jobs[?status=...]  recent jobs
+      GET  /jobs/<id>          job status
+      GET  /jobs/<id>/result   job result once finished (409 while queued or running)
+      GET  /health             version, workers, queue counts and AI token usage
+
+    Request bodies must be sent as application/json, which a browser can't
+    do cross-site without a CORS preflight this server never answers.
+    Without a token, only loopback Host headers (or the bound address) are
+    accepted, so a DNS-rebound page can't reach the API either.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        workers: Optional[int] = None,
+        db_path: Optional[Path] = None,
+        token: Optional[str] = None
+    ):
+        self.queue = JobQueue(Path(db_path or config.JOBS_DB))
+        self.pool = JobWorkerPool(self.queue, workers or config.API_WORKERS)
+        self.token = token if token is not None else config.API_TOKEN
+        self.httpd = ThreadingHTTPServer((host, port), _ApiHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.api = self
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.httpd.server_address[:2]
+
+    def serve_forever(self):
+        """Start the job workers and serve HTTP until shutdown()"""
+
+        self.pool.start()
+        host, port = self.address
+        logger.info(f"aria API listening on http://{host}:{port} with {self.pool.workers} worker(s)")
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.httpd.server_close()
+            self.pool.stop()
+            self.queue.close()
+
+    def shutdown(self):
+        self.httpd.shutdown()
+
+    def dispatch(self, method: str, path: str, body: Optional[Dict[str, Any]]) -> Tuple[int, Dict[str, Any]]:
+        """Route one request; returns (HTTP status, JSON body)"""
+
+        url = urlsplit(path)
+
+        if method == "GET" and url.path == "/health":
+            from ..core.ai_engine import usage_stats
+            from ..core.json_repair import repair_stats
+            from ..core.routing import route_stats
+            return HTTPStatus.OK, {
+                "version": __version__,
+                "workers": self.pool.workers,
+                "jobs": self.queue.counts(),
+                "ai_usage": usage_stats.snapshot(),
+                "json_repair": repair_stats.snapshot(),
+                "routes": route_stats.snapshot(),
+            }
+
+        if url.path == "/jobs":
+            if method == "POST":
+                return self._submit(body or {})
+            if method == "GET":
+                status = parse_qs(url.query).get("status", [None])[0]
+                if status and status not in JOB_STATUSES:
+                    return HTTPStatus.BAD_REQUEST, {"error": f"Unknown status: {status}"}
+                return HTTPStatus.OK, {"jobs": self.queue.list_jobs(status)}
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": f"{method} not allowed"}
+
+        match = JOB_PATH.match(url.path)
+        if match and method == "GET":
+            job_id, want_result = match.group(1), bool(match.group(2))
+            job = self.queue.get(job_id, include_result=want_result)
+            if job is None:
+                return HTTPStatus.NOT_FOUND, {"error": f"Job not found: {job_id}"}
+            if want_result and job["status"] in ("queued", "running"):
+                return HTTPStatus.CONFLICT, {"error": "Job has not finished", "status": job["status"]}
+            return HTTPStatus.OK, job
+
+        return HTTPStatus.NOT_FOUND, {"error": f"Not found: {url.path}"}
+
+    def _submit(self, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        job_type = body.get("type")
+        params = body.get("params", {})
+        if job_type not in JOB_HANDLERS:
+            return HTTPStatus.BAD_REQUEST, {"error": f"Unknown job type: {job_type}. Available: {list(JOB_HANDLERS)}"}
+        if not isinstance(params, dict):
+            return HTTPStatus.BAD_REQUEST, {"error": "params must be an object"}
+        return HTTPStatus.ACCEPTED, self.queue.submit(job_type, params)
+
+    def allowed_host(self, header: Optional[str]) -> bool:
+        """Whether a request's Host header names this server; any host is fine once a token is required"""
+
+        if self.token:
+            return True
+        host = urlsplit(f"//{header or ''}").hostname
+        return host is not None and (host in LOCAL_HOSTS or host == self.address[0])
+
+    def authorized(self, header: Optional[str]) -> bool:
+        if not self.token:
+            return True
+        return hmac.compare_digest(header or "", f"Bearer {self.token}")
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    server_version = f"aria/{__version__}"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def _handle(self, method: str):
+        api: ApiServer = self.server.api
+
+        if not api.allowed_host(self.headers.get("Host")):
+            self._send(HTTPStatus.FORBIDDEN, {"error": "Host not allowed"})
+            return
+
+        if not api.authorized(self.headers.get("Authorization")):
+            self._send(HTTPStatus.UNAUTHORIZED, {"error": "Missing or invalid API token"})
+            return
+
+        body = None
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            self._send(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Request body too large"})
+            return
+        if length or method == "POST":
+            content_type = (self.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+            if content_type != "application/json":
+                self._send(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, {"error": "Content-Type must be application/json"})
+                return
+        if length:
+            try:
+                body = json.loads(self.rfile.read(length))
+            except ValueError as e:
+                self._send(HTTPStatus.BAD_REQUEST, {"error": f"Invalid JSON: {e}"})
+                return
+            if not isinstance(body, dict):
+                self._send(HTTPStatus.BAD_REQUEST, {"error": "Request body must be a JSON object"})
+                return
+
+        try:
+            status, payload = api.dispatch(method, self.path, body)
+        except Exception as e:
+            logger.error(f"API request {method} {self.path} failed: {e}")
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)}
+        self._send(status, payload)
+
+    def _send(self, status: int, payload: Dict[str, Any]):
+        data = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
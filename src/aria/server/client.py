@@ -0,0 +1,118 @@
+"""Console entry point that forwards commands to a running `aria serve` daemon
+
+This module runs on every `aria` invocation, so it only imports the
+standard library pieces it needs and falls back to the in-process CLI
+whenever no compatible daemon answers.
+"""
+import json
+import os
+import socket
+import stat
+import sys
+from typing import Dict, List, Any, Optional
+from .. import __version__
+
+# Read straight from the environment: loading config (and .env) here would cost the startup time we are saving
+SOCKET_ENV = "ARIA_SOCKET"
+NO_DAEMON_ENV = "ARIA_NO_DAEMON"
+
+# Non-interactive commands whose output is fully captured; TUI and prompting commands always run locally.
+# Long-running ones such as review also stay local: the daemon runs one command at a time.
+FORWARDABLE_COMMANDS = frozenset({"version", "analyze", "new", "plan"})
+
+CONNECT_TIMEOUT = 0.2
+
+# Parent of the per-user socket directory when XDG_RUNTIME_DIR is unset
+FALLBACK_ROOT = "/tmp"
+
+def fallback_socket_dir() -> str:
+    """Private per-user directory holding the socket when XDG_RUNTIME_DIR is unset"""
+    return os.path.join(FALLBACK_ROOT, f"aria-{os.getuid()}")
+
+def default_socket_path() -> str:
+    """Per-user socket path, under XDG_RUNTIME_DIR when available"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "aria.sock")
+    return os.path.join(fallback_socket_dir(), "aria.sock")
+
+def private_directory(directory: str) -> bool:
+    """True when ``directory`` is a real directory owned by this user with mode 0700"""
+    try:
+        info = os.lstat(directory)
+    except OSError:
+        return False
+    return stat.S_ISDIR(info.st_mode) and info.st_uid == os.getuid() and stat.S_IMODE(info.st_mode) == 0o700
+
+def trusted_socket_path(path: str) -> bool:
+    """False for a socket in a shared location that another user could have created first"""
+    return os.path.dirname(path) != fallback_socket_dir() or private_directory(os.path.dirname(path))
+
+def socket_path() -> str:
+    return os.environ.get(SOCKET_ENV) or default_socket_path()
+
+def forwardable(argv: List[str]) -> bool:
+    """True when the command line can run inside the daemon"""
+    # Profiles and traces measure this process, and option values would be mistaken for the command name
+    if any(arg.startswith(("--profile", "--trace")) for arg in argv):
+        return False
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    return command in FORWARDABLE_COMMANDS
+
+def should_forward(argv: List[str]) -> bool:
+    """True when the daemon should run this command line"""
+    if os.environ.get(NO_DAEMON_ENV) or not hasattr(socket, "AF_UNIX"):
+        return False
+    return forwardable(argv)
+
+def request(payload: Dict[str, Any], path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Send one request to the daemon; returns None when no trusted daemon is listening"""
+    path = path or socket_path()
+    if not trusted_socket_path(path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(path)
+            sock.settimeout(None)
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+    
+    if not line:
+        return None
+    return json.loads(line)
+
+def forward(argv: List[str], path: Optional[str] = None) -> Optional[int]:
+    """Run a command line on the daemon and print its output; returns the exit code"""
+    try:
+        width = os.get_terminal_size(sys.stdout.fileno()).columns
+    except (OSError, ValueError):
+        width = None
+    
+    response = request({
+        "op": "run",
+        "version": __version__,
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "width": width,
+    }, path)
+    if response is None or "error" in response:
+        return None
+    
+    sys.stdout.write(response.get("output", ""))
+    sys.stdout.flush()
+    return int(response.get("exit_code", 0))
+
+def main():
+    """`aria` console script"""
+    argv = sys.argv[1:]
+    if should_forward(argv):
+        exit_code = forward(argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+    
+    from ..cli import app
+    app(prog_name="aria")
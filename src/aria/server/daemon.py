@@ -0,0 +1,180 @@
+import json
+import os
+import socketserver
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+from .. import __version__
+from ..config import config
+from ..utils.logger import setup_logger
+from .client import default_socket_path, fallback_socket_dir, forwardable, private_directory, request
+
+logger = setup_logger(__name__)
+
+# Rich falls back to this width when the client did not report a terminal
+DEFAULT_WIDTH = 80
+
+class AriaDaemon:
+    """Long-lived process that keeps aria warm and runs forwarded CLI commands
+
+    Imports, the plugin registry, pooled AI connections, the AI response
+    cache and the plan catalog are set up once and shared by every command.
+    """
+
+    def __init__(self, path: Optional[str] = None, cache_size: int = 256):
+        self.path = str(path or config.DAEMON_SOCKET or default_socket_path())
+        self.cache_size = cache_size
+        self._server: Optional[socketserver.BaseServer] = None
+        # Commands swap process-wide stdout and cwd, so they run one at a time
+        self._lock = threading.Lock()
+        self._app = None
+        self._runner = None
+
+    def warm_up(self):
+        """Import the CLI stack and load plugins, caches and the plan catalog"""
+
+        from typer.testing import CliRunner
+        from ..cli import app
+        from ..core import ai_engine
+        from ..core.plans_manager import PlansManager
+        from ..plugins.base import get_plugin_manager
+
+        manager = get_plugin_manager()
+        for name in list(manager.plugins):
+            manager.get_plugin(name)
+
+        if self.cache_size:
+            ai_engine.enable_response_cache(self.cache_size)
+
+        try:
+            PlansManager().list_plans()
+        except Exception as e:
+            logger.warning(f"Could not preload plan catalog: {e}")
+
+        self._app = app
+        self._runner = CliRunner()
+
+    def bind(self):
+        """Create the listening socket, replacing a stale one left by a crashed daemon"""
+
+        if os.path.exists(self.path):
+            if request({"op": "ping"}, self.path) is not None:
+                raise RuntimeError(f"An aria daemon is already listening on {self.path}")
+            os.unlink(self.path)
+        directory = os.path.dirname(self.path)
+        if directory == fallback_socket_dir():
+            # Shared /tmp: the directory must be ours alone, or another user could plant the socket
+            try:
+                os.mkdir(directory, 0o700)
+            except FileExistsError:
+                pass
+            if not private_directory(directory):
+                raise RuntimeError(f"{directory} must be a directory owned by you with mode 0700")
+        else:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+
+        # Owner-only socket: forwarded commands run with the daemon's privileges
+        previous_umask = os.umask(0o177)
+        try:
+            self._server = _UnixServer(self.path, _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+        self._server.aria_daemon = self
+
+    def serve_forever(self):
+        """Warm up and serve requests until shutdown() or a shutdown request"""
+
+        if self._server is None:
+            self.bind()
+        if self._runner is None:
+            self.warm_up()
+
+        logger.info(f"aria daemon {__version__} listening on {self.path}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._server = None
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    def shutdown(self):
+        """Stop serve_forever() from another thread"""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one client request"""
+
+        op = message.get("op")
+        if op == "ping":
+            return {"ok": True, "version": __version__, "pid": os.getpid()}
+        if op == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+        if op != "run":
+            return {"error": f"Unknown request: {op}"}
+
+        # An older or newer client should run its own code rather than ours
+        if message.get("version") != __version__:
+            return {"error": f"Daemon version {__version__} does not match client {message.get('version')}"}
+
+        argv = [str(arg) for arg in message.get("argv", [])]
+        if not forwardable(argv):
+            return {"error": f"Command not served by the daemon: {' '.join(argv)}"}
+
+        return self.run(argv, message.get("cwd"), message.get("width"))
+
+    def run(self, argv: List[str], cwd: Optional[str] = None, width: Optional[int] = None) -> Dict[str, Any]:
+        """Run a CLI command in-process and capture its output"""
+
+        from ..cli import console
+        from ..utils import formatting
+
+        if self._runner is None:
+            self.warm_up()
+
+        with self._lock:
+            previous_cwd = os.getcwd()
+            consoles = (console, formatting.console)
+            previous_state = [(c.width, c._force_terminal) for c in consoles]
+            try:
+                if cwd:
+                    os.chdir(cwd)
+                # Clients only report a width when stdout is a terminal
+                for output_console in consoles:
+                    output_console.width = width or DEFAULT_WIDTH
+                    output_console._force_terminal = width is not None
+                result = self._runner.invoke(self._app, argv, prog_name="aria")
+            finally:
+                os.chdir(previous_cwd)
+                for output_console, (previous_width, force_terminal) in zip(consoles, previous_state):
+                    output_console.width = previous_width
+                    output_console._force_terminal = force_terminal
+
+        output = result.output
+        if result.exception is not None and not isinstance(result.exception, SystemExit):
+            logger.error(f"Command {argv} failed: {result.exception}")
+            output += f"Error: {result.exception}\n"
+        return {"exit_code": result.exit_code, "output": output}
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    aria_daemon: AriaDaemon
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """One newline-delimited JSON request and response per connection"""
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            response = self.server.aria_daemon.handle(json.loads(line))
+        except Exception as e:
+            logger.error(f"Daemon request failed: {e}")
+            response = {"error": str(e)}
+        try:
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+        except OSError:  # client went away
+            pass
@@ -0,0 +1,258 @@
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+"""
+
+class JobQueue:
+    """Persistent FIFO job queue backed by SQLite
+
+    Jobs survive restarts: anything left ``running`` by a previous process
+    is put back in the queue when the queue is opened.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared by the HTTP and worker threads, serialized by a lock
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._available = threading.Condition()
+
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+            requeued = self._conn.execute(
+                "UPDATE jobs SET status = 'queued', started_at = NULL WHERE status = 'running'"
+            ).rowcount
+        if requeued:
+            logger.info(f"Requeued {requeued} interrupted job(s)")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def submit(self, job_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a job to the end of the queue"""
+
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, type, params, status, created_at) VALUES (?, ?, ?, 'queued', ?)",
+                (job_id, job_type, json.dumps(params), time.time())
+            )
+        with self._available:
+            self._available.notify()
+        return self.get(job_id)
+
+    def claim(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Mark the oldest queued job as running and return it, waiting up to ``timeout``"""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self._claim_next()
+            if job is not None:
+                return job
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            with self._available:
+                self._available.wait(remaining)
+
+    def _claim_next(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at, rowid LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = 'running', started_at = ? WHERE id = ?",
+                        (time.time(), row["id"])
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return None if row is None else self.get(row["id"], include_params=True)
+
+    def complete(self, job_id: str, result: Any):
+        self._finish(job_id, "succeeded", result=json.dumps(result, default=str))
+
+    def fail(self, job_id: str, error: str):
+        self._finish(job_id, "failed", error=error)
+
+    def _finish(self, job_id: str, status: str, result: Optional[str] = None, error: Optional[str] = None):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+                (status, result, error, time.time(), job_id)
+            )
+
+    def get(self, job_id: str, include_params: bool = False, include_result: bool = False) -> Optional[Dict[str, Any]]:
+        """Job status record, or None for unknown IDs"""
+
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return None if row is None else _to_job(row, include_params, include_result)
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Most recent jobs first, optionally filtered by status"""
+
+        query = "SELECT * FROM jobs"
+        args: List[Any] = []
+        if status:
+            query += " WHERE status = ?"
+            args.append(status)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        args.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, args).fetchall()
+        return [_to_job(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update({row["status"]: row["n"] for row in rows})
+        return counts
+
+class JobWorkerPool:
+    """Threads that take jobs off a JobQueue and run the matching handler"""
+
+    def __init__(self, queue: JobQueue, workers: int = 2, handlers: Optional[Dict[str, Callable]] = None):
+        self.queue = queue
+        self.workers = max(1, workers)
+        self.handlers = handlers if handlers is not None else JOB_HANDLERS
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"aria-job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0):
+        """Stop after the jobs currently running finish (or ``timeout`` passes)"""
+        self._stop.set()
+        with self.queue._available:
+            self.queue._available.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _work(self):
+        while not self._stop.is_set():
+            job = self.queue.claim(timeout=1.0)
+            if job is None:
+                continue
+            self.run_job(job)
+
+    def run_job(self, job: Dict[str, Any]):
+        handler = self.handlers.get(job["type"])
+        logger.info(f"Running {job['type']} job {job['id']}")
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown job type: {job['type']}")
+            self.queue.complete(job["id"], handler(job["params"]))
+        except Exception as e:
+            logger.error(f"Job {job['id']} failed: {e}")
+            self.queue.fail(job["id"], str(e))
+
+def run_decompose_job(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Decompose a goal into a plan and save it unless ``save`` is false
+    
+    With ``reuse`` true, a near-duplicate saved plan is adapted instead of
+    calling the AI. Otherwise saved plans play no part.
+    """
+
+    from ..core.decomposer import TaskDecomposer
+
+    goal = params.get("goal")
+    if not goal:
+        raise ValueError("decompose jobs require a 'goal'")
+
+    decomposer = TaskDecomposer(goal, params.get("tech_stack", ""), params.get("constraints") or [])
+    reuse = bool(params.get("reuse", False))
+    plan = decomposer.run(reuse=reuse, similar=reuse)
+
+    result: Dict[str, Any] = {"plan": plan}
+    if params.get("save", True):
+        output = params.get("output")
+        result["plan_file"] = str(decomposer.plans_manager.save_plan(plan, Path(output) if output else None))
+    return result
+
+def run_generate_job(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate project files from an inline plan or a saved plan file"""
+
+    from ..core.generator import CodeGenerator
+    from ..core.plans_manager import PlansManager
+
+    plan = params.get("plan")
+    if plan is None:
+        if not params.get("plan_file"):
+            raise ValueError("generate jobs require a 'plan' or 'plan_file'")
+        plan = PlansManager().load_plan(Path(params["plan_file"]))
+    if not params.get("target_path"):
+        raise ValueError("generate jobs require a 'target_path'")
+
+    return CodeGenerator(params.get("workers")).generate_project(
+        plan, Path(params["target_path"]), force=bool(params.get("force", False))
+    )
+
+def run_analyze_job(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Analyze an existing project directory"""
+
+    from ..plugins.base import get_plugin_manager
+
+    if not params.get("path"):
+        raise ValueError("analyze jobs require a 'path'")
+    return get_plugin_manager().analyze_project(Path(params["path"]))
+
+JOB_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "decompose": run_decompose_job,
+    "generate": run_generate_job,
+    "analyze": run_analyze_job,
+}
+
+def _to_job(row: sqlite3.Row, include_params: bool = False, include_result: bool = False) -> Dict[str, Any]:
+    job = {
+        "id": row["id"],
+        "type": row["type"],
+        "status": row["status"],
+        "error": row["error"],
+        "created_at": row["created_at"],
+        "started_at": row["started_at"],
+        "finished_at": row["finished_at"],
+    }
+    if include_params:
+        job["params"] = json.loads(row["params"])
+    if include_result:
+        job["result"] = json.loads(row["result"]) if row["result"] is not None else None
+    return job
@@ -0,0 +1,8 @@
+export default function Home() {
+  return (
+    <main>
+      <h1>Welcome to {{ project_name }}</h1>
+      <p>Built with Next.js 14</p>
+    </main>
+  )
+}
@@ -1,17 +1,35 @@
 from textual.widgets import Static
 from textual.containers import Horizontal
 from textual.app import ComposeResult
+from textual.reactive import reactive
 
 class DashboardHeader(Static):
     """Dashboard header component"""
     
-    def __init__(self, project_goal: str):
+    completed = reactive(0)
+    total = reactive(0)
+    
+    def __init__(self, project_goal: str, completed: int = 0, total: int = 0):
         super().__init__()
         self.project_goal = project_goal
+        # Initial values without running the watchers, which need the mounted children
+        self.set_reactive(DashboardHeader.completed, completed)
+        self.set_reactive(DashboardHeader.total, total)
     
     def compose(self) -> ComposeResult:
         yield Horizontal(
             Static("🌀 Aria Dashboard", classes="header-title"),
             Static(f"Project: {self.project_goal}", classes="header-project"),
+            Static(self.progress_text(), classes="header-progress", id="progress"),
             classes="header-container"
-        )
\ No newline at end of file
+        )
+    
+    def progress_text(self) -> str:
+        percent = round(self.completed / self.total * 100) if self.total else 0
+        return f"✅ {self.completed}/{self.total} tasks ({percent}%)"
+    
+    def watch_completed(self) -> None:
+        self.query_one("#progress", Static).update(self.progress_text())
+    
+    def watch_total(self) -> None:
+        self.query_one("#progress", Static).update(self.progress_text())
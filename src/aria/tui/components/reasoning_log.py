@@ -1,13 +1,55 @@
+import threading
+from typing import List
 from textual.widgets import Static, TextArea
 from textual.containers import Vertical
 from textual.app import ComposeResult
 
+# Screen updates per second while text is streaming in
+FRAME_RATE = 20
+
 class ReasoningLog(Static):
-    """AI reasoning log display"""
+    """AI reasoning log display
+    
+    ``append`` may be called from any thread for every streamed token; the
+    text is buffered and written to the TextArea at most FRAME_RATE times a
+    second, so fast streams cost one edit per frame instead of one per token.
+    """
+    
+    def __init__(self, frame_rate: int = FRAME_RATE):
+        super().__init__()
+        self.frame_rate = frame_rate
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
     
     def compose(self) -> ComposeResult:
         yield Vertical(
             Static("🤖 AI Reasoning Log", classes="log-header"),
             TextArea("AI reasoning will appear here...", language="markdown", read_only=True),
             classes="reasoning-container"
-        )
\ No newline at end of file
+        )
+    
+    def on_mount(self) -> None:
+        self.set_interval(1 / self.frame_rate, self.flush)
+    
+    def append(self, text: str) -> None:
+        """Queue text for the next frame; safe to call from worker threads"""
+        with self._lock:
+            self._pending.append(text)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._pending = []
+        self.query_one(TextArea).load_text("")
+    
+    def flush(self) -> None:
+        """Write everything queued since the last frame in a single edit"""
+        
+        with self._lock:
+            if not self._pending:
+                return
+            text = "".join(self._pending)
+            self._pending = []
+        
+        log = self.query_one(TextArea)
+        log.insert(text, log.document.end, maintain_selection_offset=False)
+        log.scroll_end(animate=False)
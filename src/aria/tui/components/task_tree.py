@@ -1,38 +1,158 @@
 from textual.widgets import Tree, Static
 from textual.widgets.tree import TreeNode
 from textual.app import ComposeResult
-from typing import Dict, Any
+from rich.text import Text
+from typing import Callable, Dict, List, Any, Optional
+
+# Children added per expansion; the rest wait behind a "more" node
+PAGE_SIZE = 200
+
+# Plans up to this size open fully expanded, larger ones start collapsed
+AUTO_EXPAND_TASKS = 200
+
+PRIORITY_ICONS = {
+    "high": "🔴",
+    "medium": "🟡",
+    "low": "🟢"
+}
+
+def module_label(module: Dict[str, Any]) -> Text:
+    return Text(f"📦 {module['name']}")
+
+def task_label(task: Dict[str, Any]) -> Text:
+    """Status, priority, title and estimate; built as plain Text so titles are never parsed as markup"""
+    status_icon = "◯" if task.get("status") == "pending" else "✅"
+    priority_icon = PRIORITY_ICONS.get(task.get("priority", "medium"), "⚪")
+    return Text(f"{status_icon} {priority_icon} {task['title']} ({task.get('estimated_hours', 0)}h)")
+
+class PlanTree(Tree):
+    """Tree of a plan's modules and tasks that only builds the nodes being looked at
+
+    Module nodes get their tasks when first expanded, and long lists
+    (modules or tasks) are added a page at a time. Opening the tree costs
+    the same for ten tasks or a hundred thousand; Tree itself only renders
+    visible rows.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        plan: Dict[str, Any],
+        page_size: int = PAGE_SIZE,
+        auto_expand_tasks: int = AUTO_EXPAND_TASKS,
+        module_label: Callable[[Dict[str, Any]], Text] = module_label,
+        task_label: Callable[[Dict[str, Any]], Text] = task_label,
+        **kwargs
+    ):
+        super().__init__(label, **kwargs)
+        self.plan = plan
+        self.modules: List[Dict[str, Any]] = plan.get("top_modules", [])
+        self.page_size = page_size
+        self.module_label = module_label
+        self.task_label = task_label
+
+        self.auto_expand_tasks = auto_expand_tasks
+        # Task indexes to show per module index while filtered, None for everything
+        self.matches: Optional[Dict[int, List[int]]] = None
+
+        self._populate()
+
+    def _populate(self):
+        self.root.expand()
+        self._add_modules(self.root, 0)
+
+        if sum(len(self._tasks(node.data["index"])) for node in self.root.children if node.data["type"] == "module") <= self.auto_expand_tasks:
+            for node in list(self.root.children):
+                if node.data["type"] == "module":
+                    self._load_module(node)
+                    node.expand()
+
+    def show_matches(self, matches: Optional[Dict[int, List[int]]]):
+        """Show only the given tasks (module index -> task indexes), or everything for None"""
+
+        self.matches = matches
+        self.clear()
+        self._populate()
+
+    def _module_indexes(self):
+        return range(len(self.modules)) if self.matches is None else sorted(self.matches)
+
+    def _tasks(self, module_index: int) -> List[Dict[str, Any]]:
+        tasks = self.modules[module_index].get("tasks", [])
+        if self.matches is None:
+            return tasks
+        return [tasks[i] for i in self.matches.get(module_index, [])]
+
+    def _add_modules(self, parent: TreeNode, start: int):
+        indexes = self._module_indexes()
+        for index in indexes[start:start + self.page_size]:
+            module = self.modules[index]
+            parent.add(
+                self.module_label(module),
+                data={"type": "module", "id": module.get("id"), "index": index, "loaded": False},
+                allow_expand=bool(self._tasks(index)),
+            )
+        self._add_more(parent, start, len(indexes), {"type": "more", "of": "modules"})
+
+    def _add_tasks(self, parent: TreeNode, module_index: int, start: int):
+        tasks = self._tasks(module_index)
+        for task in tasks[start:start + self.page_size]:
+            parent.add_leaf(self.task_label(task), data={"type": "task", "id": task.get("id"), "task": task})
+        self._add_more(parent, start, len(tasks), {"type": "more", "of": "tasks", "index": module_index})
+
+    def _add_more(self, parent: TreeNode, start: int, total: int, data: Dict[str, Any]):
+        next_start = start + self.page_size
+        if next_start < total:
+            parent.add_leaf(Text(f"… {total - next_start} more", style="dim italic"), data={**data, "start": next_start})
+
+    def _load_module(self, node: TreeNode):
+        if not node.data["loaded"]:
+            node.data["loaded"] = True
+            self._add_tasks(node, node.data["index"], 0)
+
+    def load_more(self, node: TreeNode):
+        """Replace a "more" node with the next page of its siblings"""
+
+        data = node.data
+        parent = node.parent
+        node.remove()
+        if data["of"] == "modules":
+            self._add_modules(parent, data["start"])
+        else:
+            self._add_tasks(parent, data["index"], data["start"])
+
+    def refresh_task(self, node: TreeNode):
+        """Rebuild one task node's label after its task changed"""
+        node.set_label(self.task_label(node.data["task"]))
+
+    def find_node(self, node_type: str, node_id: Any) -> Optional[TreeNode]:
+        """Loaded node for a module or task ID, if it has been built"""
+
+        stack = list(self.root.children)
+        while stack:
+            node = stack.pop()
+            if node.data and node.data.get("type") == node_type and node.data.get("id") == node_id:
+                return node
+            stack.extend(node.children)
+        return None
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        data = event.node.data
+        if data and data.get("type") == "module":
+            self._load_module(event.node)
+
+    def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
+        data = event.node.data
+        if data and data.get("type") == "more":
+            event.stop()
+            self.load_more(event.node)
 
 class TaskTree(Static):
     """Interactive task tree component"""
-    
+
     def __init__(self, plan: Dict[str, Any]):
         super().__init__()
         self.plan = plan
-    
+
     def compose(self) -> ComposeResult:
-        tree = Tree("Project Plan")
-        tree.root.expand()
-        
-        # Build tree structure
-        for module in self.plan.get("top_modules", []):
-            module_node = tree.root.add(
-                f"📦 {module['name']}",
-                data={"type": "module", "id": module["id"]}
-            )
-            module_node.expand()
-            
-            for task in module.get("tasks", []):
-                status_icon = "◯" if task.get("status") == "pending" else "✅"
-                priority_icon = {
-                    "high": "🔴",
-                    "medium": "🟡", 
-                    "low": "🟢"
-                }.get(task.get("priority", "medium"), "⚪")
-                
-                task_node = module_node.add(
-                    f"{status_icon} {priority_icon} {task['title']} ({task.get('estimated_hours', 0)}h)",
-                    data={"type": "task", "id": task["id"]}
-                )
-        
-        yield tree
\ No newline at end of file
+        yield PlanTree("Project Plan", self.plan)
@@ -1,12 +1,16 @@
 from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical, Horizontal
-from textual.widgets import Header, Footer, Static, Button
+from textual.widgets import Header, Footer, Static, Button, Input
 from textual.binding import Binding
-from typing import Dict, Any
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+import threading
+import time
 
 from .components.header import DashboardHeader
-from .components.task_tree import TaskTree
+from .components.task_tree import PlanTree, TaskTree
 from .components.reasoning_log import ReasoningLog
+from .search import TaskIndex
 
 class AriaDashboard(App):
     """Main TUI Dashboard for aria"""
@@ -43,19 +47,38 @@ class AriaDashboard(App):
         Binding("q", "quit", "Quit"),
         Binding("r", "regenerate", "Regenerate Plan"),
         Binding("s", "save", "Save"),
-        Binding("space", "toggle_task", "Toggle Complete"),
+        # priority so it wins over the tree's own space binding
+        Binding("space", "toggle_task", "Toggle Complete", priority=True),
         Binding("enter", "expand", "Expand/Collapse"),
+        Binding("slash", "search", "Search"),
     ]
     
-    def __init__(self, plan: Dict[str, Any]):
+    # Seconds without changes before toggles are written to disk
+    SAVE_DELAY = 1.0
+    
+    def __init__(self, plan: Dict[str, Any], plan_file: Optional[Path] = None):
         super().__init__()
         self.plan = plan
+        self.plan_file = plan_file
+        self._dirty = False
+        self._save_lock = threading.Lock()
+        self._save_timer = None
+        self._last_change = 0.0
+        self.index: Optional[TaskIndex] = None
+        # Tasks toggled while the index was being built
+        self._unindexed_changes: List[Dict[str, Any]] = []
     
     def compose(self) -> ComposeResult:
-        yield DashboardHeader(self.plan.get("goal", "Unknown Project"))
+        tasks = [task for module in self.plan.get("top_modules", []) for task in module.get("tasks", [])]
+        yield DashboardHeader(
+            self.plan.get("goal", "Unknown Project"),
+            completed=sum(1 for task in tasks if task.get("status") == "completed"),
+            total=len(tasks)
+        )
         
         with Container():
             with Container(classes="sidebar"):
+                yield Input(placeholder="🔍 Filter tasks (/)", id="task-search")
                 yield TaskTree(self.plan)
             
             with Container(classes="main"):
@@ -69,27 +92,180 @@ class AriaDashboard(App):
     def on_mount(self) -> None:
         self.title = "🌀 Aria Dashboard"
         self.sub_title = "AI-Powered Project Management"
+        self.query_one(PlanTree).focus()
+        self._build_index()
+    
+    def _build_index(self) -> None:
+        """Index the plan for search off the UI thread; takes a noticeable fraction of a second on big plans"""
+        plan = self.plan
+        self.index = None
+        self.run_worker(lambda: self.call_from_thread(self._index_ready, plan, TaskIndex(plan)), thread=True, group="index", exclusive=True)
+    
+    def _index_ready(self, plan: Dict[str, Any], index: TaskIndex) -> None:
+        # Ignore indexes of a plan that has since been regenerated
+        if plan is self.plan:
+            for task in self._unindexed_changes:
+                index.update(task)
+            self._unindexed_changes = []
+            self.index = index
+            self._apply_filter()
+    
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id == "task-search":
+            self._apply_filter()
+    
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id == "task-search":
+            self.query_one(PlanTree).focus()
+    
+    def _apply_filter(self) -> None:
+        """Narrow the tree to tasks matching the search box; waits for the index on first use"""
+        
+        query = self.query_one("#task-search", Input).value.strip()
+        tree = self.query_one(PlanTree)
+        if not query:
+            if tree.matches is not None:
+                tree.show_matches(None)
+        elif self.index is not None:
+            tree.show_matches(self.index.search(query))
+    
+    def action_search(self) -> None:
+        self.query_one("#task-search", Input).focus()
+    
+    def check_action(self, action: str, parameters) -> Optional[bool]:
+        # Let the search box receive spaces instead of toggling tasks
+        if action == "toggle_task" and isinstance(self.focused, Input):
+            return False
+        return True
     
     def action_quit(self) -> None:
+        # Don't lose toggles still waiting for the debounce timer
+        try:
+            self._write_plan()
+        except Exception as e:
+            self.notify(f"❌ Save failed: {e}", severity="error")
+            return
         self.exit()
     
     def action_regenerate(self) -> None:
+        if any(worker.is_running for worker in self.workers if worker.group == "regenerate"):
+            self.notify("🔁 Already regenerating the plan")
+            return
+        
         self.notify("🔁 Regenerating plan with AI...")
-        # Implementation would call AI to regenerate plan
+        log = self.query_one(ReasoningLog)
+        log.clear()
+        self.run_worker(lambda: self._regenerate(log), thread=True, group="regenerate")
+    
+    def _regenerate(self, log: ReasoningLog) -> None:
+        """Decompose the goal again in a worker thread, streaming the response into the log"""
+        
+        from ..core.decomposer import TaskDecomposer
+        
+        decomposer = TaskDecomposer(
+            self.plan.get("goal", ""), self.plan.get("tech_stack", ""), self.plan.get("constraints") or []
+        )
+        try:
+            # Never seed from a saved plan: the closest one is the plan being replaced
+            plan = decomposer.run(on_token=log.append, similar=False)
+        except Exception as e:
+            log.append(f"\n\n❌ Regeneration failed: {e}\n")
+            self.call_from_thread(self.notify, f"❌ Regeneration failed: {e}", severity="error")
+            return
+        self.call_from_thread(self._replace_plan, plan)
+    
+    async def _replace_plan(self, plan: Dict[str, Any]) -> None:
+        """Show a regenerated plan and save it over the current one"""
+        
+        self.plan = plan
+        tasks = [task for module in plan.get("top_modules", []) for task in module.get("tasks", [])]
+        header = self.query_one(DashboardHeader)
+        header.total = len(tasks)
+        header.completed = sum(1 for task in tasks if task.get("status") == "completed")
+        
+        await self.query_one(TaskTree).remove()
+        await self.query_one(".sidebar").mount(TaskTree(plan))
+        self._build_index()
+        
+        self._dirty = True
+        self._schedule_save()
+        self.notify("✅ Plan regenerated")
     
     def action_save(self) -> None:
-        self.notify("💾 Plan saved!")
-        # Implementation would save current state
+        self._dirty = True
+        self._flush()
     
     def action_toggle_task(self) -> None:
-        self.notify("✅ Task status toggled")
-        # Implementation would toggle task completion
+        tree = self.query_one(PlanTree)
+        node = tree.cursor_node
+        if node is None or not node.data or node.data.get("type") != "task":
+            return
+        
+        task = node.data["task"]
+        done = task.get("status") != "completed"
+        task["status"] = "completed" if done else "pending"
+        tree.refresh_task(node)
+        self.query_one(DashboardHeader).completed += 1 if done else -1
+        # Keep searches for "completed" or "pending" current
+        if self.index is not None:
+            self.index.update(task)
+        else:
+            self._unindexed_changes.append(task)
+        
+        self._dirty = True
+        self._schedule_save()
+    
+    def _schedule_save(self) -> None:
+        """Debounce writes so a burst of toggles ends in one write, SAVE_DELAY after the last"""
+        self._last_change = time.monotonic()
+        if self._save_timer is None:
+            self._save_timer = self.set_timer(self.SAVE_DELAY, self._save_when_idle)
+    
+    def _save_when_idle(self) -> None:
+        self._save_timer = None
+        remaining = self._last_change + self.SAVE_DELAY - time.monotonic()
+        if remaining > 0:
+            self._save_timer = self.set_timer(remaining, self._save_when_idle)
+        else:
+            self._flush()
+    
+    def _flush(self) -> None:
+        if self._save_timer is not None:
+            self._save_timer.stop()
+            self._save_timer = None
+        self.run_worker(self._save_in_background, thread=True, group="save")
+    
+    def _save_in_background(self) -> None:
+        try:
+            saved = self._write_plan()
+        except Exception as e:
+            self.call_from_thread(self.notify, f"❌ Save failed: {e}", severity="error")
+            return
+        if saved:
+            self.call_from_thread(self.notify, "💾 Plan saved!")
+    
+    def _write_plan(self) -> bool:
+        """Write the plan if it changed since the last write"""
+        
+        from ..core.plans_manager import PlansManager
+        
+        # Writes are serialized; a toggle during a write marks the plan dirty again
+        with self._save_lock:
+            if not self._dirty:
+                return False
+            self._dirty = False
+            try:
+                self.plan_file = PlansManager().save_plan(self.plan, self.plan_file)
+            except Exception:
+                self._dirty = True
+                raise
+        return True
     
     def action_expand(self) -> None:
         self.notify("📂 Expanded/collapsed section")
         # Implementation would handle expand/collapse
 
-def run_tui(plan: Dict[str, Any]):
-    """Run the TUI dashboard with given plan"""
-    app = AriaDashboard(plan)
+def run_tui(plan: Dict[str, Any], plan_file: Optional[Path] = None):
+    """Run the TUI dashboard with given plan, saving changes to ``plan_file``"""
+    app = AriaDashboard(plan, plan_file)
     app.run()
\ No newline at end of file
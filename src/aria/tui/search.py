@@ -0,0 +1,100 @@
+import math
+from collections import Counter, defaultdict
+from typing import Dict, List, Any, Set, Tuple
+
+# Share of a term's trigrams a task needs when nothing contains the term exactly
+FUZZY_MATCH = 0.6
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def task_text(task: Dict[str, Any]) -> str:
+    """Searchable text of a task: ID, title, description, priority, status and dependency IDs"""
+    return "\n".join([
+        str(task.get("id", "")),
+        str(task.get("title", "")),
+        str(task.get("description", "")),
+        str(task.get("priority", "")),
+        str(task.get("status", "")),
+        *map(str, task.get("dependencies", [])),
+    ]).lower()
+
+class TaskIndex:
+    """Trigram index over a plan's tasks for as-you-type filtering
+
+    Each task is indexed by its ID, title, description, priority, status and
+    dependency IDs. A query matches tasks containing every whitespace
+    separated term; a term found nowhere falls back to tasks sharing most
+    of its trigrams, so small typos still find something. update() re-indexes
+    one task after an edit such as a status toggle.
+    """
+
+    def __init__(self, plan: Dict[str, Any]):
+        # (module index, task index) for each indexed task, in plan order
+        self.positions: List[Tuple[int, int]] = []
+        self.texts: List[str] = []
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        # id() of each indexed task dict -> its number, for update()
+        self.numbers: Dict[int, int] = {}
+
+        for module_index, module in enumerate(plan.get("top_modules", [])):
+            for task_index, task in enumerate(module.get("tasks", [])):
+                text = task_text(task)
+                number = len(self.texts)
+                self.positions.append((module_index, task_index))
+                self.texts.append(text)
+                self.numbers[id(task)] = number
+                for gram in trigrams(text):
+                    self.postings[gram].append(number)
+
+    def update(self, task: Dict[str, Any]) -> bool:
+        """Re-index a task dict of the indexed plan after it changed; False if it isn't indexed"""
+
+        number = self.numbers.get(id(task))
+        if number is None:
+            return False
+
+        text = task_text(task)
+        old, new = trigrams(self.texts[number]), trigrams(text)
+        for gram in old - new:
+            self.postings[gram].remove(number)
+        for gram in new - old:
+            self.postings[gram].append(number)
+        self.texts[number] = text
+        return True
+
+    def search(self, query: str) -> Dict[int, List[int]]:
+        """Matching task indexes grouped by module index, both in plan order"""
+
+        matches = None
+        for term in query.lower().split():
+            found = self._match(term)
+            matches = found if matches is None else matches & found
+            if not matches:
+                break
+
+        grouped: Dict[int, List[int]] = {}
+        for number in sorted(matches or ()):
+            module_index, task_index = self.positions[number]
+            grouped.setdefault(module_index, []).append(task_index)
+        return grouped
+
+    def _match(self, term: str) -> Set[int]:
+        if len(term) < 3:
+            return {number for number, text in enumerate(self.texts) if term in text}
+
+        grams = sorted(trigrams(term), key=lambda gram: len(self.postings.get(gram, ())))
+        candidates = set(self.postings.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(self.postings.get(gram, ()))
+        exact = {number for number in candidates if term in self.texts[number]}
+        if exact:
+            return exact
+
+        counts: Counter = Counter()
+        for gram in grams:
+            counts.update(self.postings.get(gram, ()))
+        needed = max(1, math.ceil(len(grams) * FUZZY_MATCH))
+        return {number for number, count in counts.items() if count >= needed}
@@ -1,8 +1,8 @@
 from textual.app import ComposeResult
-from textual.containers import Vertical, Horizontal
-from textual.widgets import Static, Tree, Label
-from textual.widgets.tree import TreeNode
+from textual.widgets import Static, Label
+from rich.text import Text
 from typing import Dict, Any
+from .components.task_tree import PlanTree
 
 class TaskViewer(Static):
     """Task viewer component"""
@@ -14,20 +14,11 @@ class TaskViewer(Static):
     def compose(self) -> ComposeResult:
         yield Label("Project Tasks")
         
-        tree = Tree("Project Structure")
-        tree.root.expand()
-        
-        # Add modules to tree
-        for module in self.plan.get("top_modules", []):
-            module_node = tree.root.add(module["name"], expand=False)
-            module_node.allow_expand = True
-            
-            # Add tasks to module
-            for task in module.get("tasks", []):
-                task_node = module_node.add(
-                    f"{task['title']} ({task.get('estimated_hours', 0)}h)",
-                    expand=False
-                )
-                task_node.allow_expand = True
-        
-        yield tree
\ No newline at end of file
+        # Modules start collapsed; their tasks are only built when opened
+        yield PlanTree(
+            "Project Structure",
+            self.plan,
+            auto_expand_tasks=0,
+            module_label=lambda module: Text(module["name"]),
+            task_label=lambda task: Text(f"{task['title']} ({task.get('estimated_hours', 0)}h)")
+        )
@@ -1,7 +1,19 @@
+import errno
 import os
 import shutil
+import sys
+import tempfile
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any, Optional
+from .logger import setup_logger
+from .templates import load_template
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = setup_logger(__name__)
 
 def read_file(file_path: Path) -> str:
     """Read file content with error handling"""
@@ -15,12 +27,253 @@ def write_file(file_path: Path, content: str) -> Dict[str, Any]:
     """Write content to file with directory creation"""
     try:
         file_path.parent.mkdir(parents=True, exist_ok=True)
+        _unlink(file_path)
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(content)
         return {"success": True, "file_path": str(file_path)}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
+def write_files(files: Dict[Path, str]) -> List[str]:
+    """Write many files in one batch, creating each parent directory once"""
+    
+    created = set()
+    written = []
+    for file_path, content in files.items():
+        file_path = Path(file_path)
+        if file_path.parent not in created:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            created.add(file_path.parent)
+        _unlink(file_path)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        written.append(str(file_path))
+    return written
+
+def _unlink(file_path: Path):
+    """Remove a file before rewriting it, so a hard link to it elsewhere keeps the old content"""
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        pass
+
+def sync_tree(root_path: Path, files: Optional[Iterable[Any]] = None):
+    """Flush ``files`` (default: every file under ``root_path``) and every directory to disk
+    
+    All directories are synced even when only some files are, since entries
+    linked or deleted there must survive a crash too.
+    """
+    
+    for directory, _, filenames in os.walk(root_path):
+        if files is None:
+            for filename in filenames:
+                _fsync_file(os.path.join(directory, filename))
+        _fsync_directory(Path(directory))
+    
+    for path in files or ():
+        _fsync_file(path)
+
+def _fsync_file(path: Any):
+    if os.path.islink(path) or not os.path.isfile(path):
+        return
+    with open(path, 'rb') as f:
+        os.fsync(f.fileno())
+
+# Top-level directories of a project that generation never writes to. They are
+# moved, not copied, into the staged tree at commit so staging stays cheap.
+CARRIED_DIRS = frozenset({".git", "node_modules", ".venv", "venv", ".next", "__pycache__"})
+
+# renameat2(2) flag swapping two paths in one step (Linux 3.15+)
+RENAME_EXCHANGE = 2
+AT_FDCWD = -100
+
+def exchange_paths(first: Path, second: Path) -> bool:
+    """Atomically swap two paths; False where the OS or filesystem can't"""
+    
+    if not sys.platform.startswith("linux"):
+        return False
+    import ctypes
+    libc = ctypes.CDLL(None, use_errno=True)
+    renameat2 = getattr(libc, "renameat2", None)
+    if renameat2 is None:
+        return False
+    if renameat2(AT_FDCWD, os.fsencode(str(first)), AT_FDCWD, os.fsencode(str(second)), RENAME_EXCHANGE) == 0:
+        return True
+    error = ctypes.get_errno()
+    if error in (errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+        return False
+    raise OSError(error, os.strerror(error), str(first))
+
+class StagedDirectory:
+    """Build a directory beside its target and swap it in only on commit
+    
+    The staging directory lives in the target's parent so the final rename
+    stays on one filesystem. It starts as hard links to the target's files
+    (copies where the filesystem can't link), without CARRIED_DIRS, which
+    are moved across just before the swap. Writers must replace files
+    rather than rewrite them in place, as write_files() does, or the change
+    would reach the target through the link. Until commit() the target is
+    never touched; leaving the context without committing removes the
+    staging tree, after moving any carried directories back.
+    
+    On Linux the swap is a single renameat2(RENAME_EXCHANGE), so readers
+    see the old or the new tree. Elsewhere the old tree is renamed aside
+    first, leaving a moment with no tree at the target; a crash there, or
+    between carrying directories and swapping, is undone by recover(),
+    which runs before every staging. An exclusive lock on a ``.{name}.lock``
+    sibling, held from recover() until the context exits, keeps concurrent
+    generations of one target from staging over each other.
+    """
+    
+    def __init__(self, target: Path, seed: bool = True):
+        self.target = Path(target).resolve()
+        self.seed = seed
+        self.path: Optional[Path] = None
+        self.committed = False
+        # Seeded files that had to be copied rather than linked, and so need syncing
+        self.copied: List[str] = []
+        self._lock_fd: Optional[int] = None
+    
+    def __enter__(self) -> "StagedDirectory":
+        self.target.parent.mkdir(parents=True, exist_ok=True)
+        self._lock()
+        try:
+            self.recover()
+            self.path = Path(tempfile.mkdtemp(prefix=f".{self.target.name}.staging-", dir=self.target.parent))
+            if self.seed and self.target.is_dir():
+                # Start from the current tree so incremental generation can skip unchanged files
+                shutil.copytree(
+                    self.target, self.path, symlinks=True, dirs_exist_ok=True,
+                    ignore=self._ignore, copy_function=self._link_or_copy
+                )
+        except BaseException:
+            self.__exit__(None, None, None)
+            raise
+        return self
+    
+    def _lock(self):
+        self._lock_fd = os.open(self.target.parent / f".{self.target.name}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+    
+    def _link_or_copy(self, src: str, dst: str):
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+            self.copied.append(dst)
+    
+    def _ignore(self, directory: str, names: List[str]) -> List[str]:
+        if Path(directory) != self.target:
+            return []
+        return [name for name in names if name in CARRIED_DIRS]
+    
+    def recover(self):
+        """Undo a commit() interrupted by a crash, then drop leftover staging and backup trees"""
+        
+        parent, name = self.target.parent, self.target.name
+        for backup in sorted(parent.glob(f".{name}.old-*")):
+            if not self.target.exists() and (backup / name).is_dir():
+                logger.warning(f"Restoring {self.target} from interrupted swap")
+                os.rename(backup / name, self.target)
+            shutil.rmtree(backup, ignore_errors=True)
+        
+        for leftover in sorted(parent.glob(f".{name}.staging-*")):
+            stranded = False
+            for carried in CARRIED_DIRS:
+                if not (leftover / carried).is_dir():
+                    continue
+                if self.target.is_dir() and not (self.target / carried).exists():
+                    os.rename(leftover / carried, self.target / carried)
+                elif not self.target.is_dir():
+                    stranded = True
+            if stranded:
+                logger.warning(f"Keeping {leftover}: it holds directories carried from {self.target}")
+                continue
+            shutil.rmtree(leftover, ignore_errors=True)
+    
+    def commit(self, written: Optional[Iterable[Any]] = None):
+        """Make the staged tree durable, then swap it in place of the target
+        
+        ``written`` lists the files generated into the staging tree; only
+        those (and any seeded copies) are synced, since linked files are
+        already durable. Without it every file is synced.
+        
+        If the swap fails the target is left as it was, carried directories
+        included, and the error is raised.
+        """
+        
+        sync_tree(self.path, None if written is None else [*written, *self.copied])
+        
+        if self.target.exists():
+            for carried in CARRIED_DIRS:
+                if (self.target / carried).is_dir() and not (self.path / carried).exists():
+                    os.rename(self.target / carried, self.path / carried)
+            
+            backup = None
+            try:
+                if exchange_paths(self.target, self.path):
+                    swapped_out = self.path
+                else:
+                    backup = Path(tempfile.mkdtemp(prefix=f".{self.target.name}.old-", dir=self.target.parent))
+                    os.rename(self.target, backup / self.target.name)
+                    os.rename(self.path, self.target)
+                    swapped_out = backup
+            except BaseException:
+                if backup is not None and not self.target.exists() and (backup / self.target.name).is_dir():
+                    os.rename(backup / self.target.name, self.target)
+                self._return_carried()
+                raise
+            # Whatever is left there is the old tree
+            shutil.rmtree(swapped_out, ignore_errors=True)
+        else:
+            os.rename(self.path, self.target)
+        
+        # Persist the swap and the carried directories' new entries
+        _fsync_directory(self.target.parent)
+        _fsync_directory(self.target)
+        self.committed = True
+    
+    def _return_carried(self) -> bool:
+        """Move carried directories from staging back to the target; False if any couldn't be"""
+        
+        returned = True
+        for carried in CARRIED_DIRS:
+            if not (self.path / carried).is_dir():
+                continue
+            if self.target.is_dir() and not (self.target / carried).exists():
+                os.rename(self.path / carried, self.target / carried)
+            elif not self.target.is_dir():
+                returned = False
+        return returned
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if not self.committed and self.path is not None and self.path.exists():
+                if self._return_carried():
+                    shutil.rmtree(self.path, ignore_errors=True)
+                else:
+                    # Left for recover() rather than deleting what may be the user's .git
+                    logger.warning(f"Keeping {self.path}: it holds directories carried from {self.target}")
+        finally:
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+        return False
+
+def _fsync_directory(directory: Path):
+    """Persist a rename by syncing its parent directory (no-op where unsupported)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
 def get_directory_structure(root_path: Path, max_depth: int = 3) -> Dict[str, Any]:
     """Get hierarchical directory structure"""
     
@@ -55,12 +308,8 @@ def copy_template(template_path: Path, destination: Path, variables: Dict[str, s
     """Copy template files with variable substitution"""
     try:
         if template_path.is_file():
-            content = read_file(template_path)
-            
-            # Replace variables
-            if variables:
-                for key, value in variables.items():
-                    content = content.replace(f"{{{{ {key} }}}}", value)
+            # Compiled once per file version, all variables substituted in one pass
+            content = load_template(template_path).render(variables)
             
             write_file(destination, content)
             return True
@@ -1,4 +1,5 @@
-from typing import Dict, Any, List
+import math
+from typing import Callable, Dict, Any, Iterator, List, Optional, TextIO, Tuple
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -7,6 +8,96 @@ from rich import box
 
 console = Console()
 
+# Rendered pieces per (view, task ID), reused while the task's fingerprint is unchanged
+_render_cache: Dict[Tuple[str, str], Tuple[Tuple[Any, ...], Any]] = {}
+MAX_RENDER_CACHE = 100000
+
+TSV_COLUMNS = ["module", "task_id", "title", "hours", "priority", "status", "dependencies"]
+
+def _fingerprint(task: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (
+        task.get('title'),
+        task.get('estimated_hours', 0),
+        task.get('priority', 'medium'),
+        task.get('status'),
+        tuple(task.get('dependencies', [])),
+        task.get('description'),
+        tuple(task.get('acceptance_criteria', [])),
+    )
+
+def _rendered(view: str, task: Dict[str, Any], render: Callable[[Dict[str, Any]], Any]) -> Any:
+    """Cached render(task), redone only when the task changed since it was cached"""
+    
+    key = (view, str(task.get('id') or task['title']))
+    fingerprint = _fingerprint(task)
+    cached = _render_cache.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    
+    if len(_render_cache) >= MAX_RENDER_CACHE:
+        _render_cache.clear()
+    rendered = render(task)
+    _render_cache[key] = (fingerprint, rendered)
+    return rendered
+
+def page_bounds(total: int, page: int = 1, limit: Optional[int] = None) -> Tuple[int, int, int]:
+    """(start, end, pages) of a 1-based page of ``limit`` items; no limit is a single page"""
+    
+    if not limit:
+        return 0, total, 1
+    pages = max(1, math.ceil(total / limit))
+    if page < 1 or page > pages:
+        raise ValueError(f"Page {page} is out of range (1-{pages})")
+    start = (page - 1) * limit
+    return start, min(start + limit, total), pages
+
+def iter_plan_tasks(plan: Dict[str, Any], start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """(module, task) pairs for tasks ``start`` to ``end`` in plan order, skipping whole modules before ``start``"""
+    
+    position = 0
+    for module in plan.get('top_modules', []):
+        tasks = module.get('tasks', [])
+        if end is not None and position >= end:
+            return
+        if position + len(tasks) > start:
+            first = max(start - position, 0)
+            last = len(tasks) if end is None else min(end - position, len(tasks))
+            for task in tasks[first:last]:
+                yield module, task
+        position += len(tasks)
+
+def count_tasks(plan: Dict[str, Any]) -> int:
+    return sum(len(module.get('tasks', [])) for module in plan.get('top_modules', []))
+
+def _page_caption(start: int, end: int, total: int, page: int, pages: int) -> Optional[str]:
+    if pages == 1:
+        return None
+    return f"Tasks {start + 1}-{end} of {total} · page {page}/{pages}"
+
+def _tsv_field(value: Any) -> str:
+    return str(value).replace("\t", " ").replace("\n", " ")
+
+def _tsv_row(task: Dict[str, Any]) -> str:
+    return "\t".join(_tsv_field(value) for value in (
+        task.get('id', ''),
+        task['title'],
+        task.get('estimated_hours', 0),
+        task.get('priority', 'medium'),
+        task.get('status', ''),
+        ','.join(task.get('dependencies', [])),
+    ))
+
+def stream_task_rows(plan: Dict[str, Any], file: TextIO, page: int = 1, limit: Optional[int] = None) -> int:
+    """Write tasks as tab-separated rows as they are produced, for pipes and scripts; returns the row count"""
+    
+    start, end, _ = page_bounds(count_tasks(plan), page, limit)
+    file.write("\t".join(TSV_COLUMNS) + "\n")
+    rows = 0
+    for module, task in iter_plan_tasks(plan, start, end):
+        file.write(f"{_tsv_field(module['name'])}\t{_rendered('tsv', task, _tsv_row)}\n")
+        rows += 1
+    return rows
+
 def format_plan_summary(plan: Dict[str, Any]) -> str:
     """Format plan as readable summary"""
     
@@ -37,11 +128,23 @@ def format_plan_summary(plan: Dict[str, Any]) -> str:
     
     return summary
 
-def display_plan_table(plan: Dict[str, Any]):
-    """Display plan as rich table"""
+def _table_cells(task: Dict[str, Any]) -> Tuple[str, ...]:
+    return (
+        task['title'],
+        str(task.get('estimated_hours', 0)),
+        task.get('priority', 'medium'),
+        ', '.join(task.get('dependencies', [])),
+    )
+
+def display_plan_table(plan: Dict[str, Any], page: int = 1, limit: Optional[int] = None):
+    """Display plan as rich table, one page of ``limit`` tasks at a time"""
+    
+    total = count_tasks(plan)
+    start, end, pages = page_bounds(total, page, limit)
     
     table = Table(
         title=f"Project Plan: {plan['goal']}",
+        caption=_page_caption(start, end, total, page, pages),
         box=box.ROUNDED,
         show_header=True,
         header_style="bold magenta"
@@ -53,55 +156,61 @@ def display_plan_table(plan: Dict[str, Any]):
     table.add_column("Priority", style="yellow")
     table.add_column("Dependencies", style="blue")
     
-    for module in plan.get('top_modules', []):
-        module_name = module['name']
-        first_task = True
-        
-        for task in module.get('tasks', []):
-            task_name = task['title']
-            hours = str(task.get('estimated_hours', 0))
-            priority = task.get('priority', 'medium')
-            deps = ', '.join(task.get('dependencies', []))
-            
-            if first_task:
-                table.add_row(module_name, task_name, hours, priority, deps)
-                first_task = False
-            else:
-                table.add_row("", task_name, hours, priority, deps)
+    current_module = None
+    for module, task in iter_plan_tasks(plan, start, end):
+        # Module name only on its first row of the page
+        module_name = module['name'] if module is not current_module else ""
+        current_module = module
+        table.add_row(module_name, *_rendered("table", task, _table_cells))
     
     console.print(table)
 
-def create_project_tree(plan: Dict[str, Any]) -> Tree:
-    """Create a rich tree visualization of the project"""
+def _task_branch(task: Dict[str, Any]) -> Tree:
+    status_icon = "✅" if task.get('status') == 'completed' else "◯"
+    priority_color = {
+        'high': 'red',
+        'medium': 'yellow', 
+        'low': 'green'
+    }.get(task.get('priority', 'medium'), 'white')
+    
+    task_text = (
+        f"{status_icon} [{priority_color}]{task['title']}[/{priority_color}] "
+        f"({task.get('estimated_hours', 0)}h)"
+    )
+    
+    task_branch = Tree(task_text)
+    
+    # Add task details as children
+    if task.get('description'):
+        task_branch.add(f"📝 {task['description']}")
+    
+    if task.get('acceptance_criteria'):
+        criteria_branch = task_branch.add("🎯 Acceptance Criteria")
+        for criteria in task['acceptance_criteria']:
+            criteria_branch.add(f"  • {criteria}")
+    
+    return task_branch
+
+def create_project_tree(plan: Dict[str, Any], page: int = 1, limit: Optional[int] = None) -> Tree:
+    """Create a rich tree visualization of the project, limited to one page of ``limit`` tasks"""
+    
+    total = count_tasks(plan)
+    start, end, pages = page_bounds(total, page, limit)
     
     tree = Tree(f"[bold cyan]🎯 {plan['goal']}[/bold cyan]")
     
-    for module in plan.get('top_modules', []):
-        module_branch = tree.add(f"[bold green]📦 {module['name']}[/bold green]")
-        
-        for task in module.get('tasks', []):
-            status_icon = "✅" if task.get('status') == 'completed' else "◯"
-            priority_color = {
-                'high': 'red',
-                'medium': 'yellow', 
-                'low': 'green'
-            }.get(task.get('priority', 'medium'), 'white')
-            
-            task_text = (
-                f"{status_icon} [{priority_color}]{task['title']}[/{priority_color}] "
-                f"({task.get('estimated_hours', 0)}h)"
-            )
-            
-            task_branch = module_branch.add(task_text)
-            
-            # Add task details as children
-            if task.get('description'):
-                task_branch.add(f"📝 {task['description']}")
-            
-            if task.get('acceptance_criteria'):
-                criteria_branch = task_branch.add("🎯 Acceptance Criteria")
-                for criteria in task['acceptance_criteria']:
-                    criteria_branch.add(f"  • {criteria}")
+    current_module = None
+    module_branch = None
+    for module, task in iter_plan_tasks(plan, start, end):
+        if module is not current_module:
+            module_branch = tree.add(f"[bold green]📦 {module['name']}[/bold green]")
+            current_module = module
+        # Task subtrees are cached and shared between renders
+        module_branch.children.append(_rendered("tree", task, _task_branch))
+    
+    caption = _page_caption(start, end, total, page, pages)
+    if caption:
+        tree.add(f"[dim]{caption}[/dim]")
     
     return tree
 
@@ -145,8 +254,23 @@ def display_risk_analysis(risk_analysis: Dict[str, Any]):
     
     console.print(f"\n[bold]Overall Risk Level:[/bold] [{risk_color}]{risk_level.upper()}[/{risk_color}]")
 
-def display_module_details(module: Dict[str, Any]):
-    """Display detailed information about a module"""
+def _module_task_lines(task: Dict[str, Any]) -> List[str]:
+    status_icon = "✅" if task.get('status') == 'completed' else "⏳"
+    lines = [
+        f"  {status_icon} [bold]{task['title']}[/bold]",
+        f"    Hours: {task.get('estimated_hours', 0)} | Priority: {task.get('priority', 'medium')}",
+    ]
+    
+    if task.get('dependencies'):
+        lines.append(f"    Dependencies: {', '.join(task['dependencies'])}")
+    
+    if task.get('description'):
+        lines.append(f"    Description: {task['description']}")
+    
+    return lines
+
+def display_module_details(module: Dict[str, Any], page: int = 1, limit: Optional[int] = None):
+    """Display detailed information about a module, one page of ``limit`` tasks at a time"""
     
     console.print(Panel.fit(
         f"[bold cyan]{module['name']}[/bold cyan]",
@@ -156,15 +280,14 @@ def display_module_details(module: Dict[str, Any]):
     
     console.print(f"[bold]Description:[/bold] {module.get('description', 'No description')}")
     
-    if module.get('tasks'):
+    tasks = module.get('tasks', [])
+    if tasks:
+        start, end, pages = page_bounds(len(tasks), page, limit)
         console.print(f"\n[bold]Tasks:[/bold]")
-        for task in module['tasks']:
-            status_icon = "✅" if task.get('status') == 'completed' else "⏳"
-            console.print(f"  {status_icon} [bold]{task['title']}[/bold]")
-            console.print(f"    Hours: {task.get('estimated_hours', 0)} | Priority: {task.get('priority', 'medium')}")
-            
-            if task.get('dependencies'):
-                console.print(f"    Dependencies: {', '.join(task['dependencies'])}")
-            
-            if task.get('description'):
-                console.print(f"    Description: {task['description']}")
\ No newline at end of file
+        for task in tasks[start:end]:
+            for line in _rendered("module", task, _module_task_lines):
+                console.print(line)
+        
+        caption = _page_caption(start, end, len(tasks), page, pages)
+        if caption:
+            console.print(f"\n[dim]{caption}[/dim]")
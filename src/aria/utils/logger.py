@@ -1,40 +1,191 @@
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Dict, List, Any, Optional
 from ..config import config
 
-def setup_logger(name: str = "aria") -> logging.Logger:
-    """Setup logging for aria"""
-    
-    logger = logging.getLogger(name)
-    
-    if logger.handlers:
-        return logger  # Already configured
-    
-    logger.setLevel(logging.INFO)
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
+ROOT_LOGGER = "aria"
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# LogRecord attributes that are not user-supplied ``extra`` fields
+_RECORD_FIELDS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_lock = threading.Lock()
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional["DroppingQueueHandler"] = None
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any ``extra`` fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full
+
+    Drops are reported by a warning queued ahead of the next record that
+    fits, or by shutdown_logging() for any still unreported.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.unreported = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge args into the message but keep ``exc_info`` for the listener's formatter
+
+        The inherited prepare() folds the traceback into ``msg`` and clears
+        ``exc_info``, so JsonFormatter could never write its ``exception`` field.
+        """
+
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            if self.unreported:
+                self.queue.put_nowait(self.drop_warning())
+                self.unreported = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self.unreported += 1
+
+    def drop_warning(self) -> logging.LogRecord:
+        """Warning record for the drops not reported yet"""
+
+        return logging.makeLogRecord({
+            "name": ROOT_LOGGER,
+            "levelno": logging.WARNING,
+            "levelname": "WARNING",
+            "msg": f"Log queue full: dropped {self.unreported} record(s), {self.dropped} in total",
+        })
+
+def setup_logger(name: str = ROOT_LOGGER) -> logging.Logger:
+    """Setup logging for aria
+
+    Modules pass ``__name__``; every ``aria.*`` logger propagates to one
+    queue handler, and a background listener does the console and file I/O.
+    """
+
+    _configure()
+    return logging.getLogger(name)
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    """Parse ``"aria.core.ai_engine=DEBUG,aria.server=WARNING"`` into logger levels"""
+
+    levels = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        name, _, level = item.partition("=")
+        value = logging.getLevelName(level.strip().upper())
+        if not isinstance(value, int):
+            raise ValueError(f"Unknown log level in LOG_LEVELS: {item.strip()}")
+        levels[name.strip()] = value
+    return levels
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            if _queue_handler is not None and _queue_handler.unreported:
+                warning = _queue_handler.drop_warning()
+                for handler in _listener.handlers:
+                    if warning.levelno >= handler.level:
+                        handler.handle(warning)
+                _queue_handler.unreported = 0
+            _listener = None
+
+def _configure():
+    global _listener, _queue_handler
+
+    root = logging.getLogger(ROOT_LOGGER)
+    if _listener is not None or root.handlers:
+        return  # Already configured
+
+    with _lock:
+        if _listener is not None or root.handlers:
+            return
+
+        root.setLevel(logging.getLevelName(config.LOG_LEVEL.upper()))
+        try:
+            levels = parse_levels(config.LOG_LEVELS)
+        except ValueError as e:
+            levels = {}
+            print(f"Warning: {e}", file=sys.stderr)
+        for name, level in levels.items():
+            logging.getLogger(name).setLevel(level)
+
+        handlers = _build_handlers()
+        log_queue: queue.Queue = queue.Queue(config.LOG_QUEUE_SIZE)
+        _queue_handler = DroppingQueueHandler(log_queue)
+        root.addHandler(_queue_handler)
+
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+def _build_handlers() -> List[logging.Handler]:
+    if config.LOG_FORMAT == "json":
+        formatter: logging.Formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT)
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
+    handlers: List[logging.Handler] = [console_handler]
+
     # File handler
     try:
         log_dir = Path(config.LOGS_DIR)
         log_dir.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_dir / "aria.log")
+        log_file = log_dir / "aria.log"
+
+        if config.LOG_ROTATION == "time":
+            file_handler: logging.Handler = logging.handlers.TimedRotatingFileHandler(
+                log_file, when=config.LOG_ROTATE_WHEN, backupCount=config.LOG_BACKUP_COUNT, encoding="utf-8"
+            )
+        elif config.LOG_ROTATION == "none":
+            file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        else:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=config.LOG_MAX_BYTES, backupCount=config.LOG_BACKUP_COUNT, encoding="utf-8"
+            )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     except Exception as e:
-        logger.warning(f"Could not setup file logging: {e}")
-    
-    return logger
\ No newline at end of file
+        print(f"Warning: Could not setup file logging: {e}", file=sys.stderr)
+
+    return handlers
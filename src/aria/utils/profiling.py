@@ -0,0 +1,164 @@
+import cProfile
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+# Blocking socket/TLS calls; cProfile times them in wall-clock, so their own time is time spent waiting
+NETWORK_FUNCTIONS = (
+    "_socket.socket",
+    "_ssl._SSLSocket",
+    "_ssl._SSLContext",
+    "getaddrinfo",
+    "select.poll",
+    "select.epoll",
+    "built-in method select.select",
+)
+
+class Profiler:
+    """cProfile plus a stack sampler (and optional tracemalloc) around one command
+
+    Writes ``<output>.pstats`` for pstats/snakeviz and ``<output>.collapsed``
+    in the folded-stack format flamegraph.pl and speedscope read.
+    """
+
+    def __init__(self, output: Path, top: int = 25, memory: bool = False, interval: float = 0.005):
+        self.output = Path(output)
+        self.top = top
+        self.memory = memory
+        self.interval = interval
+        self.profile = cProfile.Profile()
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._wall = 0.0
+        self._cpu = 0.0
+
+    def start(self):
+        if self.memory:
+            import tracemalloc
+            tracemalloc.start(25)
+
+        self._sampler = threading.Thread(target=self._sample, name="aria-profiler", daemon=True)
+        self._sampler.start()
+
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self.profile.enable()
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop profiling, write the output files and return the summary data"""
+
+        self.profile.disable()
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        pstats_file = self.output.with_name(self.output.name + ".pstats")
+        collapsed_file = self.output.with_name(self.output.name + ".collapsed")
+        self.profile.dump_stats(str(pstats_file))
+        with open(collapsed_file, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+        stats = pstats.Stats(self.profile)
+        network = network_wait(stats)
+        report = {
+            "wall_seconds": wall,
+            "cpu_seconds": cpu,
+            "network_wait_seconds": network,
+            "other_wait_seconds": max(wall - cpu - network, 0.0),
+            "samples": sum(self.stacks.values()),
+            "pstats_file": str(pstats_file),
+            "collapsed_file": str(collapsed_file),
+            "top": _top_functions(stats, self.top),
+        }
+
+        if self.memory:
+            import tracemalloc
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            report["memory_peak_bytes"] = peak
+            report["memory_top"] = [
+                {"location": str(stat.traceback[0]), "size_bytes": stat.size, "count": stat.count}
+                for stat in snapshot.statistics("lineno")[:self.top]
+            ]
+
+        return report
+
+    def _sample(self):
+        """Collapse every thread's Python stack at a fixed interval"""
+
+        own = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            if len(names) != len(frames):
+                names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in frames.items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{Path(code.co_filename).stem}:{code.co_name}")
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                self.stacks[";".join(reversed(stack))] += 1
+
+def network_wait(stats: pstats.Stats) -> float:
+    """Seconds spent inside blocking socket, TLS and DNS calls"""
+
+    total = 0.0
+    for (filename, _, name), (_, _, tottime, _, _) in stats.stats.items():
+        if filename == "~" and any(marker in name for marker in NETWORK_FUNCTIONS):
+            total += tottime
+    return total
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Plain-text summary of a profiling report"""
+
+    lines = [
+        f"Wall time: {report['wall_seconds']:.3f}s "
+        f"(CPU {report['cpu_seconds']:.3f}s, network wait {report['network_wait_seconds']:.3f}s, "
+        f"other wait {report['other_wait_seconds']:.3f}s)",
+        "",
+        f"{'cumulative':>10} {'own':>9} {'calls':>8}  function",
+    ]
+    for entry in report["top"]:
+        lines.append(
+            f"{entry['cumulative_seconds']:>9.3f}s {entry['own_seconds']:>8.3f}s {entry['calls']:>8}  {entry['function']}"
+        )
+
+    if "memory_peak_bytes" in report:
+        lines += ["", f"Peak traced memory: {report['memory_peak_bytes'] / 1024 / 1024:.1f} MiB"]
+        for entry in report["memory_top"][:10]:
+            lines.append(f"{entry['size_bytes'] / 1024:>10.1f} KiB  {entry['location']}")
+
+    lines += [
+        "",
+        f"Profile: {report['pstats_file']}",
+        f"Flamegraph stacks ({report['samples']} samples): {report['collapsed_file']}",
+    ]
+    return "\n".join(lines)
+
+def _top_functions(stats: pstats.Stats, limit: int) -> List[Dict[str, Any]]:
+    entries = []
+    for (filename, line, name), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        location = name if filename == "~" else f"{Path(filename).name}:{line}({name})"
+        entries.append({
+            "function": location,
+            "calls": calls,
+            "own_seconds": tottime,
+            "cumulative_seconds": cumtime,
+        })
+    entries.sort(key=lambda e: e["cumulative_seconds"], reverse=True)
+    return entries[:limit]
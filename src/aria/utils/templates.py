@@ -0,0 +1,131 @@
+import re
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+# Same placeholder syntax copy_template has always used: {{ name }}
+PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+# Bundled template packs: one directory (or .zip archive) per pack
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+# Files that cannot ship as dotfiles in the package are stored as dot_<name>
+DOTFILE_PREFIX = "dot_"
+
+class CompiledTemplate:
+    """Template parsed once into literal chunks and placeholder slots"""
+
+    __slots__ = ("literals", "names", "placeholders")
+
+    def __init__(self, source: str):
+        parts = PLACEHOLDER.split(source)
+        # re.split with one group alternates literal, name, literal, ...
+        self.literals: Tuple[str, ...] = tuple(parts[0::2])
+        self.names: Tuple[str, ...] = tuple(parts[1::2])
+        self.placeholders: Tuple[str, ...] = tuple(m.group(0) for m in PLACEHOLDER.finditer(source))
+
+    def render(self, variables: Optional[Dict[str, Any]] = None) -> str:
+        """Render in a single pass; unknown placeholders are left as-is"""
+
+        if not self.names:
+            return self.literals[0]
+
+        variables = variables or {}
+        out = [self.literals[0]]
+        for name, placeholder, literal in zip(self.names, self.placeholders, self.literals[1:]):
+            value = variables.get(name)
+            out.append(placeholder if value is None else str(value))
+            out.append(literal)
+        return "".join(out)
+
+@lru_cache(maxsize=1024)
+def compile_template(source: str) -> CompiledTemplate:
+    """Compile template source, reusing the compiled form for identical sources"""
+    return CompiledTemplate(source)
+
+def load_template(template_path: Path) -> CompiledTemplate:
+    """Compile a template file, cached until the file changes"""
+    template_path = Path(template_path).resolve()
+    stat = template_path.stat()
+    return _load_template(template_path, stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=256)
+def _load_template(template_path: Path, mtime_ns: int, size: int) -> CompiledTemplate:
+    return compile_template(template_path.read_text(encoding="utf-8"))
+
+class TemplatePack:
+    """A set of compiled file templates, loaded from a directory or a zip archive
+
+    Both file contents and relative paths may contain placeholders. Files named
+    ``dot_<name>`` are written as ``.<name>``.
+    """
+
+    def __init__(self, name: str, files: Dict[str, str]):
+        self.name = name
+        self.files: List[Tuple[CompiledTemplate, CompiledTemplate]] = [
+            (compile_template(_output_path(path)), compile_template(source))
+            for path, source in sorted(files.items())
+        ]
+
+    @classmethod
+    def from_directory(cls, directory: Path) -> "TemplatePack":
+        directory = Path(directory)
+        files = {
+            path.relative_to(directory).as_posix(): path.read_text(encoding="utf-8")
+            for path in directory.rglob("*")
+            if path.is_file() and "__pycache__" not in path.parts
+        }
+        return cls(directory.name, files)
+
+    @classmethod
+    def from_archive(cls, archive: Path) -> "TemplatePack":
+        archive = Path(archive)
+        with zipfile.ZipFile(archive) as zf:
+            files = {
+                info.filename: zf.read(info).decode("utf-8")
+                for info in zf.infolist()
+                if not info.is_dir()
+            }
+        return cls(archive.stem, files)
+
+    def render(self, variables: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        """Render every file; returns relative path -> content"""
+        return {path.render(variables): source.render(variables) for path, source in self.files}
+
+    def write(self, destination: Path, variables: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Render the pack into ``destination``; returns the written file paths"""
+
+        from .file_ops import write_files
+
+        destination = Path(destination)
+        return write_files({destination / rel_path: content for rel_path, content in self.render(variables).items()})
+
+def get_template_pack(name: str) -> TemplatePack:
+    """Load a template pack by bundled name, directory path or .zip path"""
+
+    path = Path(name)
+    if len(path.parts) == 1 and path.suffix != ".zip":
+        candidates = [TEMPLATES_DIR / name, TEMPLATES_DIR / f"{name}.zip"]
+    else:
+        candidates = [path]
+
+    for candidate in candidates:
+        if candidate.is_dir() or (candidate.suffix == ".zip" and candidate.is_file()):
+            candidate = candidate.resolve()
+            return _load_pack(candidate, candidate.stat().st_mtime_ns)
+
+    raise FileNotFoundError(f"Template pack not found: {name}")
+
+@lru_cache(maxsize=64)
+def _load_pack(path: Path, mtime_ns: int) -> TemplatePack:
+    if path.suffix == ".zip":
+        return TemplatePack.from_archive(path)
+    return TemplatePack.from_directory(path)
+
+def _output_path(rel_path: str) -> str:
+    """Map stored file names (dot_env) to their output names (.env)"""
+    return "/".join(
+        "." + part[len(DOTFILE_PREFIX):] if part.startswith(DOTFILE_PREFIX) else part
+        for part in rel_path.split("/")
+    )
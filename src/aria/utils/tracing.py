@@ -0,0 +1,201 @@
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Any, Optional
+
+SERVICE_NAME = "aria"
+
+# OTLP status codes
+STATUS_UNSET, STATUS_OK, STATUS_ERROR = 0, 1, 2
+
+class Span:
+    """One timed operation with attributes and a parent"""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "status", "message")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = attributes
+        self.status = STATUS_UNSET
+        self.message = ""
+
+    def set(self, **attributes: Any):
+        """Add attributes while the span is open"""
+        self.attributes.update(attributes)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+class _NoopSpan:
+    """Returned while tracing is off so instrumented code needs no checks"""
+
+    __slots__ = ()
+
+    def set(self, **attributes: Any):
+        pass
+
+_NOOP = _NoopSpan()
+
+class Tracer:
+    """Collects finished spans for the current process"""
+
+    def __init__(self):
+        self.enabled = False
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._current: contextvars.ContextVar = contextvars.ContextVar("aria_span", default=None)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Any]:
+        """Time the enclosed block as a child of the current span"""
+
+        if not self.enabled:
+            yield _NOOP
+            return
+
+        parent = self._current.get()
+        span = Span(name, parent.trace_id if parent else os.urandom(16).hex(), parent.span_id if parent else None, attributes)
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status = STATUS_ERROR
+            span.message = str(e) or type(e).__name__
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            self._current.reset(token)
+            with self._lock:
+                self.spans.append(span)
+
+    def reset(self) -> List[Span]:
+        """Return the collected spans and start over"""
+        with self._lock:
+            spans, self.spans = self.spans, []
+        return spans
+
+tracer = Tracer()
+
+def span(name: str, **attributes: Any):
+    """Context manager for a span on the process tracer"""
+    return tracer.span(name, **attributes)
+
+def traced(name: str) -> Callable:
+    """Decorator form of span()"""
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def enable_tracing():
+    tracer.enabled = True
+
+def stop_tracing() -> List[Span]:
+    """Disable tracing and return the spans collected so far"""
+    tracer.enabled = False
+    return tracer.reset()
+
+def to_otlp(spans: List[Span]) -> Dict[str, Any]:
+    """OTLP/JSON trace export payload (as accepted by collectors' /v1/traces)"""
+
+    from .. import __version__
+
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": _otlp_attributes({"service.name": SERVICE_NAME, "service.version": __version__})},
+            "scopeSpans": [{
+                "scope": {"name": "aria.tracing"},
+                "spans": [
+                    {
+                        "traceId": s.trace_id,
+                        "spanId": s.span_id,
+                        **({"parentSpanId": s.parent_id} if s.parent_id else {}),
+                        "name": s.name,
+                        "kind": 1,  # internal
+                        "startTimeUnixNano": str(s.start_ns),
+                        "endTimeUnixNano": str(s.end_ns),
+                        "attributes": _otlp_attributes(s.attributes),
+                        "status": {"code": s.status, **({"message": s.message} if s.message else {})},
+                    }
+                    for s in sorted(spans, key=lambda s: s.start_ns)
+                ],
+            }],
+        }]
+    }
+
+def export_otlp(spans: List[Span], path: Path) -> Path:
+    """Write spans as an OTLP/JSON file"""
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(to_otlp(spans), f, indent=2)
+    return path
+
+def format_waterfall(spans: List[Span], width: int = 40) -> str:
+    """Text waterfall: one line per span, indented by depth, with a bar on a shared timeline"""
+
+    if not spans:
+        return "No spans recorded"
+
+    children: Dict[Optional[str], List[Span]] = {}
+    ids = {s.span_id for s in spans}
+    for s in sorted(spans, key=lambda s: s.start_ns):
+        # Spans whose parent was not recorded are shown as roots
+        children.setdefault(s.parent_id if s.parent_id in ids else None, []).append(s)
+
+    start = min(s.start_ns for s in spans)
+    total = max(max(s.end_ns for s in spans) - start, 1)
+
+    rows = []
+    def walk(parent: Optional[str], depth: int):
+        for s in children.get(parent, []):
+            offset = int((s.start_ns - start) / total * width)
+            length = max(1, int((s.end_ns - s.start_ns) / total * width))
+            bar = " " * offset + "█" * min(length, width - offset)
+            label = "  " * depth + s.name + (" ✗" if s.status == STATUS_ERROR else "")
+            rows.append((label, f"{s.duration_ms:9.1f}ms", bar.ljust(width), _format_attributes(s.attributes)))
+            walk(s.span_id, depth + 1)
+    walk(None, 0)
+
+    label_width = max(len(label) for label, _, _, _ in rows)
+    return "\n".join(
+        f"{label.ljust(label_width)} {duration} |{bar}| {attrs}".rstrip()
+        for label, duration, bar, attrs in rows
+    )
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    result = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            typed = {"boolValue": value}
+        elif isinstance(value, int):
+            typed = {"intValue": str(value)}
+        elif isinstance(value, float):
+            typed = {"doubleValue": value}
+        else:
+            typed = {"stringValue": str(value)}
+        result.append({"key": key, "value": typed})
+    return result
+
+def _format_attributes(attributes: Dict[str, Any]) -> str:
+    parts = []
+    for key, value in attributes.items():
+        text = str(value)
+        parts.append(f"{key}={text[:37] + '...' if len(text) > 40 else text}")
+    return " ".join(parts)
@@ -0,0 +1,19 @@
+import httpx
+import pytest
+from aria.core import ai_engine
+
+@pytest.fixture
+def mock_ai(monkeypatch):
+    """Route AI requests to an httpx handler
+
+    ``mock_ai(handler)`` returns an AIEngine whose provider calls go to
+    ``handler``. Patch provider config before calling it, since the engine
+    picks its base URL when created.
+    """
+
+    def install(handler):
+        engine = ai_engine.AIEngine()
+        monkeypatch.setitem(ai_engine._clients, engine.base_url, httpx.Client(transport=httpx.MockTransport(handler)))
+        return engine
+
+    return install
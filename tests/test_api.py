@@ -0,0 +1,115 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+import pytest
+from aria.server.api import ApiServer
+from aria.server.jobs import JobQueue, JobWorkerPool
+
+@pytest.fixture
+def api(tmp_path):
+    """API server on a free port with a temporary job database"""
+    server = ApiServer("127.0.0.1", 0, workers=2, db_path=tmp_path / "jobs.db", token="")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.address
+    yield f"http://{host}:{port}"
+    server.shutdown()
+    thread.join(timeout=5)
+
+def call(url, method="GET", body=None):
+    """Send a JSON request and return (status, body)"""
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+def test_job_queue_is_fifo_and_persistent(tmp_path):
+    """Test that jobs come out in order and interrupted jobs are requeued"""
+    queue = JobQueue(tmp_path / "jobs.db")
+    first = queue.submit("analyze", {"path": "a"})
+    second = queue.submit("analyze", {"path": "b"})
+    
+    claimed = queue.claim(timeout=0)
+    assert claimed["id"] == first["id"]
+    assert claimed["params"] == {"path": "a"}
+    queue.close()
+    
+    reopened = JobQueue(tmp_path / "jobs.db")
+    assert reopened.get(first["id"])["status"] == "queued"
+    assert reopened.claim(timeout=0)["id"] == first["id"]
+    assert reopened.claim(timeout=0)["id"] == second["id"]
+    assert reopened.claim(timeout=0) is None
+
+def test_worker_pool_records_results_and_errors(tmp_path):
+    """Test that handler results and exceptions end up on the job"""
+    queue = JobQueue(tmp_path / "jobs.db")
+    
+    def boom(params):
+        raise RuntimeError("boom")
+    
+    pool = JobWorkerPool(queue, workers=1, handlers={"echo": lambda params: params, "boom": boom})
+    ok = queue.submit("echo", {"value": 1})
+    bad = queue.submit("boom", {})
+    
+    pool.run_job(queue.claim(timeout=0))
+    pool.run_job(queue.claim(timeout=0))
+    
+    assert queue.get(ok["id"], include_result=True)["result"] == {"value": 1}
+    failed = queue.get(bad["id"])
+    assert failed["status"] == "failed"
+    assert failed["error"] == "boom"
+
+def test_api_runs_analyze_job(api, tmp_path):
+    """Test submitting, polling and fetching an analyze job over HTTP"""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "requirements.txt").write_text("flask\n")
+    
+    status, job = call(f"{api}/jobs", "POST", {"type": "analyze", "params": {"path": str(project)}})
+    assert status == 202
+    assert job["status"] == "queued"
+    
+    deadline = time.time() + 10
+    while job["status"] in ("queued", "running") and time.time() < deadline:
+        time.sleep(0.05)
+        _, job = call(f"{api}/jobs/{job['id']}")
+    assert job["status"] == "succeeded"
+    
+    status, result = call(f"{api}/jobs/{job['id']}/result")
+    assert status == 200
+    assert result["result"]["framework"].lower() == "flask"
+
+def test_api_rejects_bad_requests(api):
+    """Test validation errors and unknown jobs"""
+    status, body = call(f"{api}/jobs", "POST", {"type": "nope"})
+    assert status == 400
+    
+    status, _ = call(f"{api}/jobs/{'0' * 32}")
+    assert status == 404
+    
+    status, health = call(f"{api}/health")
+    assert status == 200
+    assert set(health["jobs"]) == {"queued", "running", "succeeded", "failed"}
+
+def test_api_rejects_cross_site_requests(api):
+    """Test non-JSON bodies and foreign Host headers are refused without a token"""
+    request = urllib.request.Request(
+        f"{api}/jobs", data=b'{"type": "analyze", "params": {"path": "."}}', method="POST",
+        headers={"Content-Type": "text/plain"}
+    )
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(request, timeout=5)
+    assert error.value.code == 415
+    
+    request = urllib.request.Request(f"{api}/jobs", headers={"Host": "attacker.example:8765"})
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(request, timeout=5)
+    assert error.value.code == 403
+    
+    status, _ = call(f"{api}/jobs".replace("127.0.0.1", "localhost"))
+    assert status == 200
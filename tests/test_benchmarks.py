@@ -0,0 +1,32 @@
+from benchmarks.plans import make_plan
+from benchmarks.run import compare, run_benchmarks
+from aria.core.scheduler import TaskGraph
+
+def test_make_plan_is_seeded_and_valid():
+    """Test synthetic plans are reproducible, sized and acyclic"""
+    plan = make_plan(500, seed=3)
+    
+    assert plan == make_plan(500, seed=3)
+    assert plan != make_plan(500, seed=4)
+    
+    tasks = [task for module in plan["top_modules"] for task in module["tasks"]]
+    assert len(tasks) == 500
+    assert len({task["id"] for task in tasks}) == 500
+    assert 1.0 < sum(len(task["dependencies"]) for task in tasks) / len(tasks) < 2.0
+    
+    # Dependencies only point backwards, so the graph resolves without cycles
+    assert len(TaskGraph(plan).order) == 500
+
+def test_run_benchmarks_results(tmp_path):
+    """Test the benchmark runner output format and regression comparison"""
+    report = run_benchmarks([10], only=["enhance_plan", "validate_plan"], repeat=2)
+    
+    assert report["meta"]["seed"] == 0
+    assert [(r["benchmark"], r["tasks"], r["runs"]) for r in report["results"]] == [
+        ("enhance_plan", 10, 2),
+        ("validate_plan", 10, 2),
+    ]
+    
+    slower = {"results": [{**r, "median_s": r["median_s"] / 2} for r in report["results"]]}
+    rows = compare(report, slower, threshold=1.5)
+    assert all(row["regression"] for row in rows)
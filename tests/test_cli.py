@@ -50,4 +50,70 @@ def test_run_command_nonexistent_file():
     """Test run command with non-existent file"""
     result = runner.invoke(app, ["run", "nonexistent.json"])
     assert result.exit_code == 1
-    assert "Plan file not found" in result.stdout
\ No newline at end of file
+    assert "Plan file not found" in result.stdout
+
+def test_plan_simulate_command(tmp_path):
+    """Test plan simulate command"""
+    import json
+    plan_file = tmp_path / "plan.json"
+    plan_file.write_text(json.dumps({
+        "goal": "test",
+        "top_modules": [{"name": "Module", "tasks": [
+            {"id": "a", "title": "A", "estimated_hours": 2},
+            {"id": "b", "title": "B", "estimated_hours": 3, "dependencies": ["a"]},
+        ]}]
+    }))
+    
+    result = runner.invoke(app, ["plan", "simulate", str(plan_file), "--workers", "2"])
+    assert result.exit_code == 0
+    assert "Makespan: 5.0h" in result.stdout
+
+def test_plan_show_command(tmp_path):
+    """Test plan show pages tasks and writes TSV when piped"""
+    import json
+    plan_file = tmp_path / "plan.json"
+    plan_file.write_text(json.dumps({
+        "goal": "test",
+        "top_modules": [
+            {"id": "m1", "name": "First", "tasks": [
+                {"id": "a", "title": "A", "estimated_hours": 2, "status": "pending"},
+                {"id": "b", "title": "B", "estimated_hours": 3, "dependencies": ["a"]},
+            ]},
+            {"id": "m2", "name": "Second", "tasks": [
+                {"id": "c", "title": "C", "estimated_hours": 1, "priority": "high"},
+            ]},
+        ]
+    }))
+    
+    result = runner.invoke(app, ["plan", "show", str(plan_file), "--limit", "2", "--page", "2"])
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == [
+        "module\ttask_id\ttitle\thours\tpriority\tstatus\tdependencies",
+        "Second\tc\tC\t1\thigh\t\t",
+    ]
+    
+    result = runner.invoke(app, ["plan", "show", str(plan_file), "--format", "rich", "--limit", "2"])
+    assert result.exit_code == 0
+    assert "Tasks 1-2 of 3 · page 1/2" in result.stdout
+    assert "Second" not in result.stdout
+    
+    result = runner.invoke(app, ["plan", "show", str(plan_file), "--module", "m2", "--format", "rich"])
+    assert result.exit_code == 0
+    assert "Second" in result.stdout and "First" not in result.stdout
+    
+    result = runner.invoke(app, ["plan", "show", str(plan_file), "--limit", "2", "--page", "3"])
+    assert result.exit_code == 1
+    assert "out of range" in result.stdout
+
+def test_trace_output(tmp_path):
+    """Test --trace-output records spans for the command"""
+    import json
+    
+    (tmp_path / "requirements.txt").write_text("flask\n")
+    trace_file = tmp_path / "trace.json"
+    
+    result = runner.invoke(app, ["--trace-output", str(trace_file), "analyze", str(tmp_path)])
+    
+    assert result.exit_code == 0
+    spans = json.loads(trace_file.read_text())["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert [s["name"] for s in spans] == ["plugin.analyze_project"]
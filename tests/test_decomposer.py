@@ -103,4 +103,183 @@ def test_plan_enhancement():
     
     # Check default values
     assert enhanced["top_modules"][0]["tasks"][0]["status"] == "pending"
-    assert enhanced["top_modules"][0]["tasks"][0]["priority"] == "medium"
\ No newline at end of file
+    assert enhanced["top_modules"][0]["tasks"][0]["priority"] == "medium"
+
+def _sse(*contents):
+    """Server-sent event body streaming the given content chunks"""
+    import json
+    events = [f"data: {json.dumps({'choices': [{'delta': {'content': c}}]})}\n\n" for c in contents]
+    return "".join(events) + "data: [DONE]\n\n"
+
+def test_stream_completion_yields_deltas(mock_ai):
+    """Test streamed completions are parsed from server-sent events"""
+    import httpx
+    
+    requests = []
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, text=_sse("Hel", "lo", " world"), headers={"content-type": "text/event-stream"})
+    
+    engine = mock_ai(handler)
+    
+    assert list(engine.stream_completion([{"role": "user", "content": "hi"}])) == ["Hel", "lo", " world"]
+    assert b'"stream":true' in requests[0].content.replace(b" ", b"")
+
+def test_decompose_task_streams_tokens(mock_ai):
+    """Test decompose_task passes streamed tokens to on_token and parses the joined JSON"""
+    import httpx
+    
+    body = _sse('{"goal": "x", ', '"top_modules": []}')
+    engine = mock_ai(lambda request: httpx.Response(200, text=body))
+    
+    tokens = []
+    plan = engine.decompose_task("x", on_token=tokens.append)
+    
+    assert plan == {"goal": "x", "top_modules": []}
+    assert tokens == ['{"goal": "x", ', '"top_modules": []}']
+
+def test_find_similar_plan_tfidf():
+    """Test near-duplicate goals score above the reuse threshold and unrelated ones below"""
+    from aria.core.similarity import find_similar_plan
+    
+    catalog = [
+        {"file": "shop.json", "goal": "Next.js ecommerce with Stripe", "tech_stack": "Next.js, TypeScript", "constraints": []},
+        {"file": "todo.json", "goal": "Flask REST API for a todo list", "tech_stack": "Python, Flask", "constraints": ["SQLite"]},
+    ]
+    
+    match = find_similar_plan(catalog, "Next.js ecommerce store with Stripe", "Next.js, TypeScript", threshold=0.75)
+    assert match["file"] == "shop.json"
+    assert match["similarity"] > 0.75
+    
+    assert find_similar_plan(catalog, "Django blog with comments", "Python, Django", threshold=0.75) is None
+    assert find_similar_plan([], "anything") is None
+
+def test_decomposer_reuses_similar_plan(tmp_path):
+    """Test a near-duplicate saved plan is adapted without calling the AI"""
+    from aria.core.plans_manager import PlansManager
+    
+    plans_manager = PlansManager(tmp_path)
+    plans_manager.save_plan({
+        "goal": "Next.js ecommerce with Stripe",
+        "tech_stack": "Next.js",
+        "constraints": [],
+        "top_modules": [{"id": "m1", "name": "Checkout", "tasks": [
+            {"id": "t1", "title": "Stripe checkout", "status": "completed", "estimated_hours": 3, "dependencies": []}
+        ]}]
+    }, tmp_path / "shop.json")
+    
+    decomposer = TaskDecomposer("Next.js ecommerce shop with Stripe", "Next.js")
+    decomposer.plans_manager = plans_manager
+    
+    def no_ai(*args, **kwargs):
+        raise AssertionError("AI should not be called")
+    decomposer.ai_engine.decompose_task = no_ai
+    
+    offered = []
+    plan = decomposer.run(reuse=lambda similar: offered.append(similar) or True, similar=True)
+    
+    assert offered[0]["file"] == "shop.json"
+    assert plan["goal"] == "Next.js ecommerce shop with Stripe"
+    assert plan["reused_from"]["file"] == "shop.json"
+    assert plan["top_modules"][0]["tasks"][0]["status"] == "pending"
+    assert plan["total_hours"] == 3
+    
+    # Declining passes the similar plan's outline to the AI as a seed
+    seeds = []
+    decomposer.ai_engine.decompose_task = lambda *args, **kwargs: seeds.append(kwargs["seed"]) or {"goal": "x", "top_modules": []}
+    decomposer.run(reuse=lambda similar: False, similar=True)
+    assert "Checkout: Stripe checkout" in seeds[0]
+    
+    # By default, or when excluding the plan being replaced, no seed is sent
+    decomposer.run()
+    decomposer.run(similar=True, exclude=tmp_path / "shop.json")
+    assert seeds[1:] == [None, None]
+    
+    # An entry that was already offered is used as is, without a second lookup
+    entry = decomposer.find_similar_plan()
+    plans_manager.list_plans = lambda: []
+    plan = decomposer.run(reuse=True, similar=entry)
+    assert plan["reused_from"]["file"] == "shop.json"
+
+def test_prompt_prefix_is_stable_and_cache_usage_recorded(monkeypatch, mock_ai):
+    """Test decomposition requests share a byte-identical system prefix and cache hits are counted"""
+    import json
+    import httpx
+    from aria.core import ai_engine
+    from aria.core.prompts import DECOMPOSE_SYSTEM_PROMPT
+    
+    bodies = []
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={
+            "choices": [{"message": {"content": '{"goal": "x", "top_modules": []}'}}],
+            "usage": {"prompt_tokens": 900, "completion_tokens": 20, "prompt_cache_hit_tokens": 768, "prompt_cache_miss_tokens": 132},
+        })
+    
+    engine = mock_ai(handler)
+    monkeypatch.setattr(ai_engine, "usage_stats", ai_engine.UsageStats())
+    
+    engine.decompose_task("Shop", "Next.js")
+    engine.decompose_task("Blog", "Django", ["No JS"])
+    
+    assert bodies[0]["messages"][0] == bodies[1]["messages"][0] == {"role": "system", "content": DECOMPOSE_SYSTEM_PROMPT}
+    assert "Shop" in bodies[0]["messages"][1]["content"] and "Blog" in bodies[1]["messages"][1]["content"]
+    
+    stats = ai_engine.usage_stats.snapshot()
+    assert (stats["requests"], stats["cache_hit_tokens"], stats["cache_miss_tokens"]) == (2, 1536, 264)
+    assert round(stats["cache_hit_rate"], 3) == round(768 / 900, 3)
+    
+    assert ai_engine.prompt_cache_tokens({"prompt_tokens": 100, "prompt_tokens_details": {"cached_tokens": 64}}) == (64, 36)
+    assert ai_engine.prompt_cache_tokens({"prompt_tokens": 100}) == (0, 100)
+
+def test_decompose_task_requests_json_mode_and_repairs(monkeypatch, mock_ai):
+    """Test decompose_task asks for a JSON object and repairs a truncated fenced reply instead of failing"""
+    import json
+    import httpx
+    from aria.core import ai_engine
+    from aria.core.json_repair import repair_stats
+    
+    bodies = []
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        content = '```json\n{"goal": "x", "top_modules": [{"id": "m", "name": "M", "tasks": [{"id": "t1", "title": "A"}, {"id": "t2", "ti'
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+    
+    monkeypatch.setattr(ai_engine.config, "AI_PROVIDER", "deepseek")
+    engine = mock_ai(handler)
+    before = repair_stats.snapshot()
+    
+    plan = engine.decompose_task("x")
+    
+    assert bodies[0]["response_format"] == {"type": "json_object"}
+    assert [task["id"] for task in plan["top_modules"][0]["tasks"]] == ["t1"]
+    after = repair_stats.snapshot()
+    assert after["repaired"] == before["repaired"] + 1
+    assert after["repairs"]["truncated"] == before["repairs"].get("truncated", 0) + 1
+
+def test_decompose_task_continues_truncated_reply(monkeypatch, mock_ai):
+    """Test a reply stopped at max_tokens is continued rather than failing to parse"""
+    import json
+    import httpx
+    from aria.core import ai_engine
+    
+    replies = [
+        ('{"goal": "x", "top_modules": [{"id": "m", "name": "M", "tasks": [{"id": "t1", "ti', "length"),
+        ('tle": "A"}, {"id": "t2", "title": "B"}]}]}', "stop"),
+    ]
+    bodies = []
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        content, finish_reason = replies[len(bodies) - 1]
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}, "finish_reason": finish_reason}]})
+    
+    monkeypatch.setattr(ai_engine.config, "AI_PROVIDER", "deepseek")
+    engine = mock_ai(handler)
+    
+    plan = engine.decompose_task("Todo list")
+    
+    assert [task["title"] for task in plan["top_modules"][0]["tasks"]] == ["A", "B"]
+    assert len(bodies) == 2
+    assert bodies[0]["max_tokens"] < ai_engine.config.DEFAULT_MAX_TOKENS
+    assert bodies[1]["messages"][-2] == {"role": "assistant", "content": replies[0][0]}
+    assert "response_format" not in bodies[1]
@@ -0,0 +1,235 @@
+import os
+import pytest
+from pathlib import Path
+from aria.core.generator import CodeGenerator
+from aria.plugins.base import BasePlugin
+
+class EchoPlugin(BasePlugin):
+    """Plugin writing one file per task, failing on demand"""
+    
+    name = "echo"
+    description = "Test plugin"
+    version = "1.0.0"
+    
+    def analyze_project(self, project_path):
+        return {}
+    
+    def scaffold_project(self, project_name, target_path):
+        return {"success": True, "generated_files": []}
+    
+    def generate_code(self, task, context):
+        if task.get("fail"):
+            raise RuntimeError("boom")
+        path = Path(context["target_path"]) / f"{task['id']}.txt"
+        siblings = [sibling["id"] for sibling in context["module"]["tasks"]]
+        path.write_text(f"{context['module']['name']}:{task['title']}:{siblings.index(task['id'])}:{os.getpid()}")
+        return {"success": True, "files_created": [str(path)]}
+
+def make_plan():
+    return {
+        "goal": "test",
+        "tech_stack": "",
+        "top_modules": [
+            {
+                "id": f"module-{m}",
+                "name": f"Module {m}",
+                "tasks": [
+                    {"id": f"task-{m}-{t}", "title": f"Task {t}", "fail": (m, t) == (1, 2)}
+                    for t in range(5)
+                ]
+            }
+            for m in range(3)
+        ]
+    }
+
+def generate(tmp_path, workers):
+    generator = CodeGenerator(workers=workers)
+    generator.plugin_manager.register_plugin(EchoPlugin())
+    generator._detect_framework = lambda tech_stack: "echo"
+    return generator.generate_project(make_plan(), tmp_path)
+
+def test_generate_project_serial(tmp_path):
+    """Test in-process generation isolates per-task failures"""
+    results = generate(tmp_path, workers=0)
+    
+    assert results["success"] == True
+    assert len(results["errors"]) == 1
+    assert "task-1-2: boom" in results["errors"][0]
+    assert (tmp_path / "README.md").exists()
+
+def test_generate_project_parallel_matches_serial(tmp_path):
+    """Test process-pool generation keeps plan order and error isolation"""
+    serial = generate(tmp_path / "serial", workers=0)
+    parallel = generate(tmp_path / "parallel", workers=3)
+    
+    def names(results):
+        return [Path(f).name for f in results["generated_files"]]
+    
+    assert names(parallel) == names(serial)
+    assert parallel["errors"] == serial["errors"]
+    assert (tmp_path / "parallel" / "task-2-4.txt").read_text().startswith("Module 2:Task 4:4:")
+
+def test_generate_project_parallel_falls_back_when_workers_cannot_start(tmp_path, monkeypatch):
+    """Test a pool whose workers fail to initialize falls back to serial generation"""
+    from aria.core import generator
+    
+    def broken_init(plugin):
+        raise RuntimeError("plugin cannot be imported in the worker")
+    monkeypatch.setattr(generator, "_init_worker", broken_init)
+    
+    results = generate(tmp_path, workers=3)
+    
+    assert len(results["errors"]) == 1
+    assert "task-1-2: boom" in results["errors"][0]
+    assert (tmp_path / "task-2-4.txt").exists()
+
+def test_generate_project_incremental(tmp_path):
+    """Test that re-runs only regenerate changed tasks and delete orphans"""
+    generator = CodeGenerator(workers=0)
+    generator.plugin_manager.register_plugin(EchoPlugin())
+    generator._detect_framework = lambda tech_stack: "echo"
+    plan = make_plan()
+    plan["top_modules"][1]["tasks"][2]["fail"] = False
+    
+    first = generator.generate_project(plan, tmp_path)
+    assert first["skipped"] == []
+    assert (tmp_path / ".aria-manifest.json").exists()
+    
+    second = generator.generate_project(plan, tmp_path)
+    assert second["generated_files"] == []
+    assert len(second["skipped"]) == 17  # scaffold, 15 tasks, docs
+    
+    plan["top_modules"][0]["tasks"][0]["title"] = "Renamed"
+    del plan["top_modules"][2]["tasks"][4]
+    third = generator.generate_project(plan, tmp_path)
+    
+    assert [Path(f).name for f in third["generated_files"]] == ["task-0-0.txt"]
+    assert [Path(f).name for f in third["deleted_files"]] == ["task-2-4.txt"]
+    assert not (tmp_path / "task-2-4.txt").exists()
+    assert "Renamed" in (tmp_path / "task-0-0.txt").read_text()
+    
+    # Edited output is regenerated even when the plan did not change
+    (tmp_path / "task-0-1.txt").write_text("hand edited")
+    fourth = generator.generate_project(plan, tmp_path)
+    assert [Path(f).name for f in fourth["generated_files"]] == ["task-0-1.txt"]
+    
+    forced = generator.generate_project(plan, tmp_path, force=True)
+    assert forced["skipped"] == []
+
+def test_generate_project_staged_failure_leaves_target_untouched(tmp_path):
+    """Test that a failed staged generation never touches the target"""
+    target = tmp_path / "project"
+    generate(target, workers=0)
+    before = sorted(p.name for p in target.iterdir())
+    
+    generator = CodeGenerator(workers=0)
+    generator._detect_framework = lambda tech_stack: "echo"
+    generator.plugin_manager.register_plugin(EchoPlugin())
+    plan = make_plan()
+    del plan["goal"]  # scaffolding raises KeyError mid-generation
+    results = generator.generate_project(plan, target)
+    
+    assert results["success"] == False
+    assert sorted(p.name for p in target.iterdir()) == before
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".project.lock", "project"]
+
+def test_generate_project_staged_swap(tmp_path):
+    """Test that staged output is swapped in and reported at its final path"""
+    target = tmp_path / "project"
+    target.mkdir()
+    (target / "notes.txt").write_text("keep me")
+    
+    results = generate(target, workers=0)
+    
+    assert results["success"] == True
+    assert (target / "notes.txt").read_text() == "keep me"
+    assert all(path.startswith(str(target.resolve())) for path in results["generated_files"])
+    assert all(Path(path).exists() for path in results["generated_files"])
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".project.lock", "project"]
+
+def test_staged_directory_carries_heavy_dirs_and_recovers(tmp_path, monkeypatch):
+    """Test dependency directories are moved rather than copied, and an interrupted swap is undone"""
+    from aria.utils import file_ops
+    from aria.utils.file_ops import StagedDirectory
+    
+    target = tmp_path / "project"
+    (target / "node_modules" / "pkg").mkdir(parents=True)
+    (target / "node_modules" / "pkg" / "index.js").write_text("module.exports = 1")
+    (target / "app.py").write_text("old")
+    inode = (target / "node_modules" / "pkg" / "index.js").stat().st_ino
+    
+    with StagedDirectory(target) as staging:
+        assert not (staging.path / "node_modules").exists()
+        assert (staging.path / "app.py").stat().st_ino == (target / "app.py").stat().st_ino
+        file_ops.write_files({staging.path / "app.py": "new"})
+        assert (target / "app.py").read_text() == "old"
+        staging.commit([staging.path / "app.py"])
+    
+    assert (target / "app.py").read_text() == "new"
+    assert (target / "node_modules" / "pkg" / "index.js").stat().st_ino == inode
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".project.lock", "project"]
+    
+    # Without an atomic exchange, a crash between the two renames leaves only the backup
+    monkeypatch.setattr(file_ops, "exchange_paths", lambda first, second: False)
+    monkeypatch.setattr(file_ops.shutil, "rmtree", lambda *args, **kwargs: None)
+    real_rename = file_ops.os.rename
+    def crash_on_second_rename(src, dst):
+        if ".staging-" in str(src) or ".old-" in str(src):
+            raise RuntimeError("crash")
+        real_rename(src, dst)
+    monkeypatch.setattr(file_ops.os, "rename", crash_on_second_rename)
+    with pytest.raises(RuntimeError):
+        with StagedDirectory(target) as staging:
+            staging.commit()
+    assert not target.exists()
+    
+    monkeypatch.undo()
+    with StagedDirectory(target):
+        pass
+    assert (target / "app.py").read_text() == "new"
+    assert (target / "node_modules" / "pkg" / "index.js").exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".project.lock", "project"]
+
+def test_staged_swap_failure_keeps_carried_dirs(tmp_path, monkeypatch):
+    """Test a failed swap puts carried directories back and is reported as a generation error"""
+    import errno
+    from aria.utils import file_ops
+    
+    target = tmp_path / "project"
+    generate(target, workers=0)
+    (target / ".git").mkdir()
+    (target / ".git" / "HEAD").write_text("ref: refs/heads/main")
+    
+    def busy(first, second):
+        raise OSError(errno.EBUSY, "Device or resource busy")
+    monkeypatch.setattr(file_ops, "exchange_paths", busy)
+    
+    results = generate(target, workers=0)
+    
+    assert results["success"] == False
+    assert "Could not replace" in results["errors"][-1]
+    assert results["generated_files"] == []
+    assert (target / ".git" / "HEAD").read_text() == "ref: refs/heads/main"
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".project.lock", "project"]
+
+def test_staged_directory_locks_target(tmp_path):
+    """Test a second staging of the same target waits until the first one exits"""
+    import threading
+    from aria.utils.file_ops import StagedDirectory
+    
+    target = tmp_path / "project"
+    target.mkdir()
+    entered = threading.Event()
+    
+    def second():
+        with StagedDirectory(target):
+            entered.set()
+    
+    with StagedDirectory(target) as staging:
+        thread = threading.Thread(target=second)
+        thread.start()
+        assert not entered.wait(0.2)
+        assert staging.path.exists()
+    
+    thread.join(timeout=5)
+    assert entered.is_set()
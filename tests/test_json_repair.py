@@ -0,0 +1,39 @@
+import pytest
+
+def test_repair_json_fixes_common_damage():
+    """Test fenced, trailing-comma and truncated responses are repaired locally"""
+    from aria.core.json_repair import repair_json
+    
+    assert repair_json('```json\n{"a": [1, 2,],}\n```') == ({"a": [1, 2]}, ["markdown_fence", "trailing_comma", "trailing_comma"])
+    assert repair_json('Here you go: {"a": "}"} Enjoy!') == ({"a": "}"}, ["surrounding_text"])
+    
+    truncated = '{"goal": "x", "top_modules": [{"name": "M", "tasks": [{"title": "A"}, {"title": "B", "estim'
+    plan, repairs = repair_json(truncated)
+    assert plan == {"goal": "x", "top_modules": [{"name": "M", "tasks": [{"title": "A"}, {"title": "B"}]}]}
+    assert repairs == ["truncated"]
+    
+    with pytest.raises(ValueError):
+        repair_json("no json here")
+
+def test_validate_plan_fills_schema_gaps():
+    """Test a decoded plan is coerced to the plan schema"""
+    from aria.core.json_repair import validate_plan
+    
+    plan = {"top_modules": [{"tasks": [
+        {"title": "A", "estimated_hours": "3 hours", "priority": "HIGH", "dependencies": "task-0"},
+        {"title": "B", "id": "t"},
+        {"title": "C", "id": "t"},
+        {"description": "no title"},
+    ]}, "junk"]}
+    repairs = validate_plan(plan, "goal")
+    
+    module = plan["top_modules"][0]
+    assert plan["goal"] == "goal"
+    assert len(plan["top_modules"]) == 1
+    assert module["id"] == "module-1" and module["name"] == "Module 1"
+    assert [task["title"] for task in module["tasks"]] == ["A", "B", "C"]
+    assert len({task["id"] for task in module["tasks"]}) == 3
+    assert module["tasks"][0]["estimated_hours"] == 3
+    assert module["tasks"][0]["priority"] == "high"
+    assert module["tasks"][0]["dependencies"] == ["task-0"]
+    assert {"missing_goal", "invalid_module", "invalid_task", "missing_id", "invalid_hours"} <= set(repairs)
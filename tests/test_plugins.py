@@ -86,4 +86,43 @@ def test_code_review_plugin():
 def test_abstract_base_plugin():
     """Test that BasePlugin cannot be instantiated"""
     with pytest.raises(TypeError):
-        BasePlugin()
\ No newline at end of file
+        BasePlugin()
+
+def test_nextjs_plugin_scaffold(tmp_path):
+    """Test NextJSPlugin scaffold method"""
+    plugin = NextJSPlugin()
+    
+    result = plugin.scaffold_project("test-next-app", tmp_path)
+    
+    assert result["success"] == True
+    assert (tmp_path / "test-next-app" / "package.json").exists()
+    assert "Welcome to test-next-app" in (tmp_path / "test-next-app" / "app" / "page.tsx").read_text()
+    assert len(result["generated_files"]) == 5
+
+def test_plugin_manager_lazy_loading(monkeypatch):
+    """Test plugins are registered by metadata and imported on first use"""
+    import sys
+    monkeypatch.delitem(sys.modules, "aria.plugins.code_review", raising=False)
+    
+    manager = PluginManager()
+    
+    assert manager.specs["code_review"].description == "AI-powered code review and analysis"
+    assert "aria.plugins.code_review" not in sys.modules
+    
+    plugin = manager.get_plugin("code_review")
+    assert plugin.name == "code_review"
+    assert manager.get_plugin("code_review") is plugin
+    assert manager.get_plugin("next.js").name == "nextjs"
+
+def test_plugin_manager_entry_point_discovery(monkeypatch):
+    """Test third-party plugins registered through entry points"""
+    from importlib.metadata import EntryPoint
+    import aria.plugins.base as base
+    
+    entry_point = EntryPoint("echo", "aria.plugins.python_flask:FlaskPlugin", base.PLUGIN_ENTRY_POINT_GROUP)
+    monkeypatch.setattr(base, "_entry_points", lambda group: [entry_point])
+    
+    manager = PluginManager()
+    
+    assert "echo" in manager.plugins
+    assert isinstance(manager.get_plugin("echo"), FlaskPlugin)
@@ -0,0 +1,89 @@
+import json
+import threading
+import pytest
+from aria.core.reviewer import ProjectReviewer, build_chunks, collect_sources, split_source
+
+class FakeEngine:
+    """Answers each review request with one finding per file in the chunk"""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def complete(self, messages, temperature, max_tokens, response_format=None, on_token=None, kind="chat"):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            prompt = messages[-1]["content"]
+            files = [line[4:].split(" (lines")[0] for line in prompt.splitlines() if line.startswith("### ")]
+            if self.fail_on in files:
+                raise RuntimeError("provider error")
+            findings = [{"file": name, "line": 1, "severity": "HIGH", "category": "bug", "message": f"Problem in {name}"} for name in files]
+            # The same finding twice, as a model sometimes does
+            findings += findings[:1]
+            return "```json\n" + json.dumps({"findings": findings, "summaries": {name: "ok" for name in files}}) + "\n```"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+def _project(tmp_path, files=6, lines=5):
+    for i in range(files):
+        (tmp_path / "pkg").mkdir(exist_ok=True)
+        (tmp_path / "pkg" / f"mod{i}.py").write_text("\n".join(f"value_{n} = {n}" for n in range(lines)))
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.js").write_text("var x = 1;")
+    (tmp_path / "README.md").write_text("# docs")
+    return tmp_path
+
+def test_collect_and_chunk_sources(tmp_path):
+    """Test source discovery skips dependencies and chunks stay within the token budget"""
+    _project(tmp_path, files=3)
+
+    sources = collect_sources(tmp_path)
+    assert [name for name, _ in sources] == ["pkg/mod0.py", "pkg/mod1.py", "pkg/mod2.py"]
+
+    # Small files are packed into one request
+    assert len(build_chunks(sources, 3000)) == 1
+
+    text = "\n\n".join(f"def f{n}():\n    return {n} + {n}" for n in range(200))
+    pieces = split_source("big.py", text, 300)
+    assert len(pieces) > 1
+    assert all(piece["tokens"] <= 300 for piece in pieces)
+    assert pieces[0]["start"] == 1 and pieces[-1]["end"] == len(text.splitlines())
+    assert all(a["end"] + 1 == b["start"] for a, b in zip(pieces, pieces[1:]))
+    assert all(piece["code"].startswith("def ") for piece in pieces)
+
+def test_project_review_merges_findings(tmp_path):
+    """Test chunks are reviewed concurrently within the worker limit and findings merged per file"""
+    _project(tmp_path, files=6, lines=40)
+    engine = FakeEngine(fail_on="pkg/mod5.py")
+    progress = []
+
+    reviewer = ProjectReviewer(workers=2, chunk_tokens=200, ai_engine=engine)
+    report = reviewer.review(tmp_path, on_progress=lambda done, total: progress.append((done, total)))
+
+    assert report["files_reviewed"] == 6
+    assert engine.calls == report["chunks"] > 1
+    assert engine.max_active <= 2
+    assert progress[-1] == (report["chunks"], report["chunks"])
+
+    assert report["failed_chunks"][0]["files"] == ["pkg/mod5.py"]
+    assert report["files"]["pkg/mod5.py"]["findings"] == []
+    for name in ["pkg/mod0.py", "pkg/mod4.py"]:
+        findings = report["files"][name]["findings"]
+        assert [finding["message"] for finding in findings] == [f"Problem in {name}"]
+        assert findings[0]["severity"] == "high"
+        assert report["files"][name]["summary"].startswith("ok")
+    assert report["summary"]["by_severity"]["high"] == 5
+    assert report["summary"]["by_category"] == {"bug": 5}
+
+def test_review_runs_locally():
+    """Test aria review is not forwarded, so it can't hold the daemon's command lock for minutes"""
+    from aria.server.client import forwardable
+
+    assert not forwardable(["review", "src"])
@@ -0,0 +1,49 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from aria.core.risk import ScheduleRiskEstimator
+
+def make_plan(tasks):
+    return {"goal": "test", "top_modules": [{"id": "module-1", "name": "Module 1", "tasks": tasks}]}
+
+def test_risk_percentiles_are_ordered():
+    """Test that completion percentiles are monotonic and above the optimistic bound"""
+    plan = make_plan([
+        {"id": "a", "estimated_hours": 10, "priority": "high"},
+        {"id": "b", "estimated_hours": 5, "priority": "low", "dependencies": ["a"]},
+    ])
+    
+    report = ScheduleRiskEstimator(plan).run(samples=5000, seed=42)
+    
+    assert report["estimated_critical_path_hours"] == 15
+    assert 0.8 * 10 + 0.9 * 5 <= report["p50"] <= report["p80"] <= report["p95"]
+    assert report["p95"] <= 1.8 * 10 + 1.3 * 5
+
+def test_risk_pert_mean():
+    """Test that sampled durations follow the PERT mean (a + 4m + b) / 6"""
+    plan = make_plan([{"id": "a", "estimated_hours": 10, "priority": "medium"}])
+    
+    report = ScheduleRiskEstimator(plan, spreads={"medium": (0.2, 0.4)}).run(samples=50000, seed=1)
+    
+    assert report["mean"] == pytest.approx((8 + 4 * 10 + 14) / 6, rel=0.01)
+
+def test_risk_critical_task_frequency():
+    """Test that the longer parallel branch dominates the critical path"""
+    plan = make_plan([
+        {"id": "long", "estimated_hours": 20, "priority": "low"},
+        {"id": "short", "estimated_hours": 2, "priority": "low"},
+        {"id": "end", "estimated_hours": 1, "dependencies": ["long", "short"]},
+    ])
+    
+    report = ScheduleRiskEstimator(plan, distribution="triangular").run(samples=2000, seed=0)
+    criticality = {task["task_id"]: task["criticality"] for task in report["critical_tasks"]}
+    
+    assert criticality["end"] == 1.0
+    assert criticality["long"] == 1.0
+    assert "short" not in criticality
+
+def test_risk_rejects_unknown_distribution():
+    """Test distribution validation"""
+    with pytest.raises(ValueError, match="Unsupported distribution"):
+        ScheduleRiskEstimator(make_plan([]), distribution="normal")
@@ -0,0 +1,67 @@
+import pytest
+
+def test_model_router_rules(monkeypatch):
+    """Test request kinds map to tiers and the size and latency rules override them"""
+    from aria.core import routing
+    from aria.core.routing import ModelRouter, RouteStats, parse_routes
+    
+    monkeypatch.setattr(routing.config, "MODEL_ROUTES", "outline=large,review=fast")
+    monkeypatch.setattr(routing.config, "ROUTE_LARGE_TOKENS", 6000)
+    monkeypatch.setattr(routing.config, "ROUTE_LATENCY_TARGET", 0.0)
+    monkeypatch.setattr(routing, "route_stats", RouteStats())
+    router = ModelRouter("openai")
+    
+    assert router.route("review", 500, 1000) == ("review:fast", "gpt-4o-mini")
+    assert router.route("outline", 500, 1000) == ("outline:large", "gpt-4o")
+    assert router.route("expand", 500, 1000) == ("expand:large", "gpt-4o")
+    assert router.route("review", 5500, 1000) == ("review:large:size", "gpt-4o")
+    
+    # The large model has been slow: a 2000 token completion would take ~40s
+    monkeypatch.setattr(routing.config, "ROUTE_LATENCY_TARGET", 10.0)
+    routing.route_stats.record("outline:large", "gpt-4o", 20.0, {"completion_tokens": 1000})
+    assert router.route("outline", 500, 2000) == ("outline:fast:latency", "gpt-4o-mini")
+    assert router.route("outline", 500, 400) == ("outline:large", "gpt-4o")
+    assert router.route("outline", 120000, 9000) == ("outline:large", "gpt-4o")
+    
+    # Never escalate to a large model with a smaller context window than the fast one
+    monkeypatch.setattr(routing.config, "OPENAI_LARGE_MODEL", "gpt-4")
+    small_window = ModelRouter("openai")
+    assert small_window.route("review", 5500, 1000) == ("review:fast", "gpt-4o-mini")
+    routing.route_stats.record("outline:large", "gpt-4", 20.0, {"completion_tokens": 1000})
+    assert small_window.route("outline", 500, 2000) == ("outline:fast:latency", "gpt-4o-mini")
+    
+    with pytest.raises(ValueError):
+        parse_routes("review=huge")
+    with pytest.raises(ValueError):
+        ModelRouter("unknown").route("chat", 0, 0)
+
+def test_chat_completion_routes_and_records_metrics(monkeypatch, mock_ai):
+    """Test the routed model is sent to the provider and the call is counted under its route"""
+    import json
+    import httpx
+    from aria.core import ai_engine, routing
+    from aria.core.routing import RouteStats
+    
+    monkeypatch.setattr(ai_engine.config, "AI_PROVIDER", "openai")
+    monkeypatch.setattr(ai_engine.config, "OPENAI_BASE_URL", "https://openai.test/v1")
+    monkeypatch.setattr(routing.config, "MODEL_ROUTES", "review=fast")
+    stats = RouteStats()
+    monkeypatch.setattr(routing, "route_stats", stats)
+    monkeypatch.setattr(ai_engine, "route_stats", stats)
+    
+    models = []
+    def handler(request):
+        models.append(json.loads(request.content)["model"])
+        return httpx.Response(200, json={
+            "choices": [{"message": {"content": "ok"}}],
+            "usage": {"prompt_tokens": 12, "completion_tokens": 3}
+        })
+    
+    engine = mock_ai(handler)
+    engine.chat_completion([{"role": "user", "content": "review this"}], kind="review")
+    
+    assert models == ["gpt-4o-mini"]
+    snapshot = stats.snapshot()
+    assert snapshot["review:fast"]["calls"] == 1
+    assert snapshot["review:fast"]["completion_tokens"] == 3
+    assert snapshot["review:fast"]["model"] == "gpt-4o-mini"
@@ -0,0 +1,76 @@
+import pytest
+from aria.core.scheduler import ScheduleSimulator
+
+def make_plan(tasks):
+    return {"goal": "test", "top_modules": [{"id": "module-1", "name": "Module 1", "tasks": tasks}]}
+
+def test_simulate_respects_dependencies():
+    """Test that dependent tasks only start after their dependencies finish"""
+    plan = make_plan([
+        {"id": "a", "estimated_hours": 4, "dependencies": []},
+        {"id": "b", "estimated_hours": 2, "dependencies": []},
+        {"id": "c", "estimated_hours": 3, "dependencies": ["a"]},
+    ])
+    
+    result = ScheduleSimulator(plan).simulate(2)
+    starts = {entry["task_id"]: entry["start"] for entry in result["schedule"]}
+    
+    assert result["makespan"] == 7
+    assert result["critical_path_hours"] == 7
+    assert starts["c"] == 4
+    assert result["total_hours"] == 9
+    # Worker running "b" idles from 2h until the end
+    assert result["idle_hours"] == 5
+
+def test_simulate_single_worker_equals_total_hours():
+    """Test that one worker needs the naive sum of all hours"""
+    plan = make_plan([
+        {"id": f"task-{i}", "estimated_hours": i + 1, "dependencies": []}
+        for i in range(5)
+    ])
+    
+    result = ScheduleSimulator(plan).simulate(1)
+    
+    assert result["makespan"] == 15
+    assert result["utilization"] == 1.0
+    assert result["idle_gaps"] == []
+
+def test_simulate_worker_skills():
+    """Test that skill-tagged tasks only run on matching workers"""
+    plan = make_plan([
+        {"id": "ui", "estimated_hours": 2, "skills": ["frontend"]},
+        {"id": "api", "estimated_hours": 2, "skills": ["backend"]},
+    ])
+    
+    result = ScheduleSimulator(plan).simulate(2, [["frontend"], ["backend"]])
+    workers = {entry["task_id"]: entry["worker"] for entry in result["schedule"]}
+    
+    assert workers == {"ui": 0, "api": 1}
+    assert result["makespan"] == 2
+    
+    with pytest.raises(ValueError, match="No worker has the skills"):
+        ScheduleSimulator(plan).simulate(1, [["frontend"]])
+
+def test_simulate_detects_cycles():
+    """Test that circular dependencies are rejected"""
+    plan = make_plan([
+        {"id": "a", "estimated_hours": 1, "dependencies": ["b"]},
+        {"id": "b", "estimated_hours": 1, "dependencies": ["a"]},
+    ])
+    
+    with pytest.raises(ValueError, match="circular"):
+        ScheduleSimulator(plan)
+
+def test_sweep_makespan_never_increases():
+    """Test worker sweep for capacity planning"""
+    plan = make_plan([
+        {"id": f"task-{i}", "estimated_hours": 3, "dependencies": [f"task-{i - 1}"] if i % 4 else []}
+        for i in range(16)
+    ])
+    
+    results = ScheduleSimulator(plan).sweep(4)
+    makespans = [row["makespan"] for row in results]
+    
+    assert [row["workers"] for row in results] == [1, 2, 3, 4]
+    assert makespans == sorted(makespans, reverse=True)
+    assert makespans[-1] == 12
@@ -0,0 +1,103 @@
+import socket
+import threading
+import pytest
+from aria import __version__
+from aria.server import client
+from aria.server.daemon import AriaDaemon
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets not available")
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    """Running daemon on a temporary socket"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(client.NO_DAEMON_ENV, raising=False)
+    path = str(tmp_path / "aria.sock")
+    monkeypatch.setenv(client.SOCKET_ENV, path)
+    
+    daemon = AriaDaemon(path, cache_size=0)
+    daemon.bind()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield daemon
+    daemon.shutdown()
+    thread.join(timeout=5)
+
+def test_should_forward(monkeypatch):
+    """Test that only non-interactive commands are forwarded"""
+    monkeypatch.delenv(client.NO_DAEMON_ENV, raising=False)
+    assert client.should_forward(["version"])
+    assert client.should_forward(["plan", "simulate", "plan.json"])
+    assert not client.should_forward(["view", "plan.json"])
+    assert not client.should_forward(["--help"])
+    
+    monkeypatch.setenv(client.NO_DAEMON_ENV, "1")
+    assert not client.should_forward(["version"])
+
+def test_forward_without_daemon(tmp_path):
+    """Test that the client falls back when nothing is listening"""
+    assert client.forward(["version"], str(tmp_path / "missing.sock")) is None
+
+def test_forward_runs_command_on_daemon(daemon, capsys):
+    """Test that forwarded commands run on the daemon and print its output"""
+    assert client.request({"op": "ping"})["version"] == __version__
+    
+    exit_code = client.forward(["version"])
+    
+    assert exit_code == 0
+    assert __version__ in capsys.readouterr().out
+
+def test_forward_uses_client_cwd(daemon, tmp_path, capsys):
+    """Test that relative paths resolve against the client's directory"""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "requirements.txt").write_text("flask\n")
+    
+    exit_code = client.forward(["analyze", "project"])
+    
+    assert exit_code == 0
+    assert "flask" in capsys.readouterr().out.lower()
+
+def test_daemon_restores_console_state(daemon):
+    """Test that a forwarded command leaves the shared consoles as it found them"""
+    from aria.cli import console
+    from aria.utils import formatting
+    
+    before = [(c.width, c._force_terminal) for c in (console, formatting.console)]
+    
+    daemon.run(["version"], width=42)
+    
+    assert [(c.width, c._force_terminal) for c in (console, formatting.console)] == before
+
+def test_fallback_socket_dir_must_be_private(tmp_path, monkeypatch):
+    """Test the /tmp fallback socket lives in a 0700 directory the client checks before connecting"""
+    import os
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(client, "FALLBACK_ROOT", str(tmp_path))
+    path = client.default_socket_path()
+    assert path == str(tmp_path / f"aria-{os.getuid()}" / "aria.sock")
+    
+    daemon = AriaDaemon(path, cache_size=0)
+    daemon.bind()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert os.stat(os.path.dirname(path)).st_mode & 0o777 == 0o700
+        assert client.request({"op": "ping"}, path)["version"] == __version__
+        
+        # A directory others can write to may hold a planted socket
+        os.chmod(os.path.dirname(path), 0o755)
+        assert client.request({"op": "ping"}, path) is None
+    finally:
+        daemon.shutdown()
+        thread.join(timeout=5)
+
+def test_daemon_rejects_mismatched_version(daemon):
+    """Test that clients from another version run locally instead"""
+    response = client.request({"op": "run", "version": "0.0.0", "argv": ["version"]})
+    assert "error" in response
+
+def test_daemon_refuses_second_instance(daemon):
+    """Test that a live socket is not replaced"""
+    with pytest.raises(RuntimeError):
+        AriaDaemon(daemon.path).bind()
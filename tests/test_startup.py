@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+import pytest
+
+# Total import time allowed for `aria --help` / `aria version`, measured with -X importtime.
+# Generous enough for slow CI machines, while eager imports of the TUI and AI stack cost ~400ms on their own.
+IMPORT_BUDGET_MS = int(os.getenv("ARIA_IMPORT_BUDGET_MS", "300"))
+
+# Modules only specific commands need; importing them at startup is a regression
+HEAVY_MODULES = [
+    "textual",
+    "httpx",
+    "dotenv",
+    "aria.config",
+    "aria.core.ai_engine",
+    "aria.core.decomposer",
+    "aria.tui.dashboard",
+    "aria.utils.logger",
+]
+
+def import_profile(*args):
+    """Run `python -X importtime -m aria <args>` and return (modules, total_ms)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "aria", *args],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        env={**os.environ, "ARIA_NO_DAEMON": "1"},  # measure local startup even if `aria serve` is running
+    )
+    assert result.returncode == 0, result.stderr
+    
+    modules = set()
+    total_us = 0
+    started = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name[1:]  # nesting is shown as extra indentation after one separator space
+        modules.add(name.strip())
+        # Interpreter startup (site, encodings, ...) happens before runpy loads aria
+        if name == "runpy":
+            started = True
+            continue
+        if started and not name.startswith(" "):
+            total_us += int(cumulative)
+    
+    return modules, total_us / 1000
+
+@pytest.mark.parametrize("args", [["--help"], ["version"]])
+def test_startup_skips_heavy_modules(args):
+    """Test that cheap commands do not import the full dependency stack"""
+    modules, _ = import_profile(*args)
+    
+    imported = [name for name in HEAVY_MODULES if name in modules]
+    assert imported == []
+
+@pytest.mark.parametrize("args", [["--help"], ["version"]])
+def test_startup_import_budget(args):
+    """Test that startup import time stays within budget"""
+    _, total_ms = import_profile(*args)
+    
+    assert total_ms < IMPORT_BUDGET_MS, f"aria {' '.join(args)} imports took {total_ms:.0f}ms"
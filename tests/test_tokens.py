@@ -0,0 +1,18 @@
+def test_token_budget_estimates():
+    """Test token estimates, plan budgets and context-window clamping"""
+    from aria.config import config
+    from aria.core.tokens import estimate_message_tokens, estimate_tokens, fit_max_tokens, plan_output_tokens, MIN_OUTPUT_TOKENS
+    
+    assert estimate_tokens("") == 0
+    assert 8 <= estimate_tokens("Build a todo list API in Flask.") <= 12
+    
+    small = plan_output_tokens("Todo list")
+    large = plan_output_tokens("Shop with auth, payments, search, reviews, admin and analytics")
+    seeded = plan_output_tokens("Todo list", seed="Goal: x\n" + "\n".join(f"- M{i}: a; b; c" for i in range(8)))
+    assert small < large <= config.MAX_OUTPUT_TOKENS
+    assert small < seeded
+    
+    huge_prompt = estimate_message_tokens([{"role": "user", "content": "word " * 7000}])
+    assert fit_max_tokens(huge_prompt, 4000, "gpt-4") < 4000
+    assert fit_max_tokens(huge_prompt * 3, 4000, "gpt-4") == MIN_OUTPUT_TOKENS
+    assert fit_max_tokens(huge_prompt, 4000, "deepseek-chat") == 4000
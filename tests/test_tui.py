@@ -0,0 +1,240 @@
+import asyncio
+from textual.app import App
+from benchmarks.plans import make_plan
+from aria.tui.components.task_tree import PlanTree, TaskTree
+
+def test_plan_tree_small_plan_expanded():
+    """Test small plans open with every module expanded"""
+    plan = make_plan(20, seed=1)
+    
+    tree = PlanTree("Project Plan", plan)
+    modules = tree.root.children
+    
+    assert len(modules) == len(plan["top_modules"])
+    assert all(node.is_expanded for node in modules)
+    assert sum(len(node.children) for node in modules) == 20
+    assert str(modules[0].children[0].label).endswith(f"{plan['top_modules'][0]['tasks'][0]['title']} ({plan['top_modules'][0]['tasks'][0]['estimated_hours']}h)")
+
+def test_plan_tree_large_plan_is_lazy_and_paged():
+    """Test large plans build only the first page of modules and load tasks on expand"""
+    plan = make_plan(5000, seed=1, module_size=500)
+    
+    tree = PlanTree("Project Plan", plan, page_size=100)
+    modules = tree.root.children
+    
+    tasks = plan["top_modules"][0]["tasks"]
+    
+    assert len(modules) == len(plan["top_modules"])
+    assert all(not node.children and not node.is_expanded and node.allow_expand for node in modules)
+    
+    async def expand_and_page():
+        class TreeApp(App):
+            def compose(self):
+                yield PlanTree("Project Plan", plan, page_size=100)
+        
+        async with TreeApp().run_test(size=(120, 40)) as pilot:
+            tree = pilot.app.query_one(PlanTree)
+            module = tree.root.children[0]
+            module.expand()
+            await pilot.pause()
+            
+            assert len(module.children) == 101
+            more = module.children[-1]
+            assert more.data == {"type": "more", "of": "tasks", "index": 0, "start": 100}
+            assert str(more.label) == f"… {len(tasks) - 100} more"
+            
+            tree.select_node(more)
+            await pilot.pause()
+            
+            assert len(module.children) == 201
+            assert [node.data["id"] for node in module.children[:200]] == [task["id"] for task in tasks[:200]]
+            assert tree.find_node("task", tasks[150]["id"]) is module.children[150]
+    
+    asyncio.run(expand_and_page())
+
+def test_plan_tree_labels_are_not_markup():
+    """Test task titles containing brackets are shown verbatim"""
+    plan = {"top_modules": [{"id": "m1", "name": "[bold]Core", "tasks": [
+        {"id": "t1", "title": "Parse [red]input", "status": "pending", "priority": "high", "estimated_hours": 2}
+    ]}]}
+    
+    tree = PlanTree("Project Plan", plan)
+    
+    assert str(tree.root.children[0].label) == "📦 [bold]Core"
+    assert str(tree.root.children[0].children[0].label) == "◯ 🔴 Parse [red]input (2h)"
+
+def test_task_tree_compose_cost_is_flat():
+    """Test composing the dashboard tree does not build nodes per task"""
+    plan = make_plan(100000, seed=1, module_size=100)
+    tree = list(TaskTree(plan).compose())[0]
+    
+    # One page of modules plus the "more" node, and no task nodes
+    assert len(tree.root.children) == 201
+    assert tree.root.children[-1].data["start"] == 200
+    assert not any(node.children for node in tree.root.children)
+
+def test_dashboard_toggle_updates_node_and_saves_once(tmp_path, monkeypatch):
+    """Test toggles relabel only the task node, update the counter and debounce saves"""
+    from aria.core.plans_manager import PlansManager
+    from aria.tui.components.header import DashboardHeader
+    from aria.tui.dashboard import AriaDashboard
+    
+    plan = make_plan(30, seed=2, completed_ratio=0)
+    plan_file = tmp_path / "plan.json"
+    saves = []
+    original_save = PlansManager.save_plan
+    monkeypatch.setattr(PlansManager, "save_plan", lambda self, p, path=None: saves.append(path) or original_save(self, p, path))
+    
+    async def toggle():
+        app = AriaDashboard(plan, plan_file)
+        app.SAVE_DELAY = 1.0
+        async with app.run_test(size=(120, 40)) as pilot:
+            tree = app.query_one(PlanTree)
+            header = app.query_one(DashboardHeader)
+            assert (header.completed, header.total) == (0, 30)
+            
+            task_node = tree.root.children[0].children[0]
+            tree.move_cursor(task_node)
+            module_nodes = list(tree.root.children)
+            
+            for _ in range(5):
+                await pilot.press("space")
+            await pilot.pause()
+            
+            assert plan["top_modules"][0]["tasks"][0]["status"] == "completed"
+            assert str(task_node.label).startswith("✅")
+            assert header.completed == 1
+            assert "1/30" in str(app.query_one("#progress").render())
+            assert list(tree.root.children) == module_nodes
+            assert saves == []
+            
+            await pilot.pause(1.5)
+            await app.workers.wait_for_complete()
+            assert saves == [plan_file]
+    
+    asyncio.run(toggle())
+    
+    saved = PlansManager().load_plan(plan_file)
+    assert saved["top_modules"][0]["tasks"][0]["status"] == "completed"
+
+def test_reasoning_log_batches_appends(monkeypatch):
+    """Test streamed text reaches the TextArea in one edit per frame"""
+    from textual.widgets import TextArea
+    from aria.tui.components.reasoning_log import ReasoningLog
+    
+    inserts = []
+    original_insert = TextArea.insert
+    monkeypatch.setattr(TextArea, "insert", lambda self, text, *args, **kwargs: inserts.append(text) or original_insert(self, text, *args, **kwargs))
+    
+    class LogApp(App):
+        def compose(self):
+            yield ReasoningLog(frame_rate=10)
+    
+    async def stream():
+        async with LogApp().run_test() as pilot:
+            log = pilot.app.query_one(ReasoningLog)
+            log.clear()
+            for i in range(1000):
+                log.append(f"{i} ")
+            await pilot.pause(0.25)
+            
+            assert pilot.app.query_one(TextArea).text == "".join(f"{i} " for i in range(1000))
+            assert len(inserts) == 1
+    
+    asyncio.run(stream())
+
+def test_dashboard_regenerate_streams_into_log(tmp_path, mock_ai):
+    """Test regenerate streams the AI response into the log and swaps in the new plan"""
+    import json
+    import httpx
+    from textual.widgets import TextArea
+    from aria.tui.components.header import DashboardHeader
+    from aria.tui.dashboard import AriaDashboard
+    
+    new_plan = json.dumps({"goal": "Rebuilt", "top_modules": [{"id": "m1", "name": "Core", "tasks": [
+        {"id": "t1", "title": "One", "estimated_hours": 1},
+        {"id": "t2", "title": "Two", "estimated_hours": 2},
+    ]}]})
+    chunks = [new_plan[i:i + 7] for i in range(0, len(new_plan), 7)]
+    body = "".join(f"data: {json.dumps({'choices': [{'delta': {'content': c}}]})}\n\n" for c in chunks) + "data: [DONE]\n\n"
+    
+    mock_ai(lambda request: httpx.Response(200, text=body))
+    
+    async def regenerate():
+        app = AriaDashboard(make_plan(10, seed=1), tmp_path / "plan.json")
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.press("r")
+            await app.workers.wait_for_complete()
+            await pilot.pause(0.3)
+            
+            assert app.query_one(TextArea).text == new_plan
+            assert [node.data["id"] for node in app.query_one(PlanTree).root.children[0].children] == ["t1", "t2"]
+            assert app.query_one(DashboardHeader).total == 2
+    
+    asyncio.run(regenerate())
+
+def test_task_index_search():
+    """Test the trigram index matches every field, combines terms and tolerates typos"""
+    from aria.tui.search import TaskIndex
+    
+    plan = {"top_modules": [
+        {"id": "m1", "name": "Auth", "tasks": [
+            {"id": "t1", "title": "Login form", "description": "Authentication screen", "priority": "high", "status": "pending", "dependencies": []},
+            {"id": "t2", "title": "Password reset", "description": "Email flow", "priority": "low", "status": "completed", "dependencies": ["t1"]},
+        ]},
+        {"id": "m2", "name": "API", "tasks": [
+            {"id": "t3", "title": "Rate limiting", "description": "Throttle login attempts", "priority": "high", "status": "pending", "dependencies": ["t1", "t2"]},
+        ]},
+    ]}
+    index = TaskIndex(plan)
+    
+    assert index.search("login") == {0: [0], 1: [0]}
+    assert index.search("LOGIN high pending") == {0: [0], 1: [0]}
+    assert index.search("completed") == {0: [1]}
+    assert index.search("t2") == {0: [1], 1: [0]}
+    assert index.search("authetication") == {0: [0]}
+    assert index.search("login email") == {}
+    assert index.search("") == {}
+    
+    # Toggled statuses are searchable once the task is re-indexed
+    plan["top_modules"][0]["tasks"][0]["status"] = "completed"
+    assert index.update(plan["top_modules"][0]["tasks"][0])
+    assert index.search("completed") == {0: [0, 1]}
+    assert index.search("pending") == {1: [0]}
+    assert not index.update({"id": "t9"})
+
+def test_dashboard_search_filters_tree(tmp_path):
+    """Test typing in the search box narrows the tree and clearing it restores the plan"""
+    from textual.widgets import Input
+    from aria.tui.dashboard import AriaDashboard
+    
+    plan = make_plan(2000, seed=4)
+    target = plan["top_modules"][7]["tasks"][3]
+    status = target["status"]
+    
+    async def search():
+        app = AriaDashboard(plan, tmp_path / "plan.json")
+        async with app.run_test(size=(120, 40)) as pilot:
+            await app.workers.wait_for_complete()
+            tree = app.query_one(PlanTree)
+            
+            await pilot.press("slash")
+            await pilot.press(*["minus" if char == "-" else char for char in target["id"]])
+            await pilot.pause()
+            
+            # The task itself plus any tasks depending on it
+            shown = [task.data["task"] for module in tree.root.children for task in module.children]
+            assert target in shown
+            assert all(task is target or target["id"] in task["dependencies"] for task in shown)
+            
+            await pilot.press("space", "x")
+            await pilot.pause()
+            assert app.query_one("#task-search", Input).value == f"{target['id']} x"
+            assert target["status"] == status
+            
+            app.query_one("#task-search", Input).value = ""
+            await pilot.pause()
+            assert tree.matches is None
+            assert len(tree.root.children) == min(len(plan["top_modules"]), 200 + 1)
+    
+    asyncio.run(search())
@@ -93,4 +93,237 @@ def test_create_project_tree():
     tree = create_project_tree(plan)
     
     # The tree should be created without errors
-    assert tree is not None
\ No newline at end of file
+    assert tree is not None
+
+def test_compiled_template_render():
+    """Test single-pass template rendering"""
+    from aria.utils.templates import compile_template
+    
+    template = compile_template("Hello {{ name }}, welcome to {{project}}! {{ missing }} {not_a_var}")
+    
+    assert template.render({"name": "Ada", "project": "aria"}) == "Hello Ada, welcome to aria! {{ missing }} {not_a_var}"
+    assert compile_template("Hello {{ name }}, welcome to {{project}}! {{ missing }} {not_a_var}") is template
+
+def test_copy_template(tmp_path):
+    """Test copy_template variable substitution"""
+    from aria.utils.file_ops import copy_template
+    
+    template = tmp_path / "template.txt"
+    template.write_text("name={{ project_name }} version={{ version }}")
+    destination = tmp_path / "out" / "result.txt"
+    
+    assert copy_template(template, destination, {"project_name": "demo", "version": "1.0"}) == True
+    assert destination.read_text() == "name=demo version=1.0"
+
+def test_template_pack_from_archive(tmp_path):
+    """Test loading a template pack from a zip archive"""
+    import zipfile
+    from aria.utils.templates import get_template_pack
+    
+    archive = tmp_path / "pack.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("{{ project_name }}/main.py", "print('{{ project_name }}')\n")
+        zf.writestr("dot_gitignore", "*.pyc\n")
+    
+    written = get_template_pack(str(archive)).write(tmp_path / "out", {"project_name": "demo"})
+    
+    assert len(written) == 2
+    assert (tmp_path / "out" / "demo" / "main.py").read_text() == "print('demo')\n"
+    assert (tmp_path / "out" / ".gitignore").exists()
+
+def test_json_log_formatter():
+    """Test JSON-lines log records include extra fields"""
+    import json
+    import logging
+    from aria.utils.logger import JsonFormatter
+    
+    record = logging.makeLogRecord({
+        "name": "aria.core.generator",
+        "levelname": "INFO",
+        "msg": "generated %d files",
+        "args": (3,),
+        "plan_id": "abc",
+    })
+    entry = json.loads(JsonFormatter().format(record))
+    
+    assert entry["logger"] == "aria.core.generator"
+    assert entry["message"] == "generated 3 files"
+    assert entry["plan_id"] == "abc"
+
+def test_queued_json_log_keeps_exception():
+    """Test that exceptions survive the queue handler into the JSON exception field"""
+    import json
+    import logging
+    import queue
+    from aria.utils.logger import DroppingQueueHandler, JsonFormatter
+    
+    log_queue = queue.Queue()
+    logger = logging.getLogger("aria.test.queued")
+    logger.propagate = False
+    handler = DroppingQueueHandler(log_queue)
+    logger.addHandler(handler)
+    try:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed %s", "badly")
+    finally:
+        logger.removeHandler(handler)
+    
+    entry = json.loads(JsonFormatter().format(log_queue.get_nowait()))
+    
+    assert entry["message"] == "failed badly"
+    assert "ValueError: boom" in entry["exception"]
+
+def test_dropped_log_records_are_reported(monkeypatch):
+    """Test drops from a full log queue are reported once there is room, or at shutdown"""
+    import logging
+    import logging.handlers
+    import queue
+    from aria.utils import logger as logger_module
+    from aria.utils.logger import DroppingQueueHandler
+    
+    log_queue = queue.Queue(2)
+    handler = DroppingQueueHandler(log_queue)
+    for i in range(5):
+        handler.handle(logging.makeLogRecord({"msg": f"record {i}"}))
+    assert (handler.dropped, handler.unreported) == (3, 3)
+    
+    while not log_queue.empty():
+        log_queue.get_nowait()
+    handler.handle(logging.makeLogRecord({"msg": "after"}))
+    
+    warning = log_queue.get_nowait()
+    assert warning.levelno == logging.WARNING
+    assert "dropped 3 record(s)" in warning.getMessage()
+    assert log_queue.get_nowait().getMessage() == "after"
+    assert handler.unreported == 0
+    
+    # Still unreported at shutdown: written straight to the listener's handlers
+    handler.handle(logging.makeLogRecord({"msg": "fills"}))
+    handler.handle(logging.makeLogRecord({"msg": "fills"}))
+    handler.handle(logging.makeLogRecord({"msg": "lost"}))
+    written = []
+    capture = logging.Handler()
+    capture.emit = written.append
+    listener = logging.handlers.QueueListener(queue.Queue(), capture)
+    listener.start()
+    monkeypatch.setattr(logger_module, "_listener", listener)
+    monkeypatch.setattr(logger_module, "_queue_handler", handler)
+    
+    logger_module.shutdown_logging()
+    
+    assert ["dropped 1 record(s), 4 in total" in record.getMessage() for record in written] == [True]
+
+def test_parse_log_levels():
+    """Test per-module log level configuration parsing"""
+    import logging
+    from aria.utils.logger import parse_levels
+    
+    assert parse_levels("aria.core.ai_engine=debug, aria.server=WARNING") == {
+        "aria.core.ai_engine": logging.DEBUG,
+        "aria.server": logging.WARNING,
+    }
+    assert parse_levels("") == {}
+    with pytest.raises(ValueError):
+        parse_levels("aria=LOUD")
+
+def test_logger_writes_through_queue():
+    """Test that aria loggers hand records to a queue instead of doing I/O"""
+    import logging.handlers
+    from aria.utils.logger import setup_logger
+    
+    logger = setup_logger("aria.tests")
+    root = logging.getLogger("aria")
+    
+    assert logger.propagate
+    assert root.handlers and all(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers)
+
+def test_profiler_splits_network_wait(tmp_path):
+    """Test profiler output files and network vs CPU time split"""
+    import socket
+    import threading
+    import time
+    from aria.utils.profiling import Profiler, format_report
+    
+    reader, writer = socket.socketpair()
+    threading.Timer(0.2, writer.sendall, args=(b"done",)).start()
+    
+    profiler = Profiler(tmp_path / "profile", top=5)
+    profiler.start()
+    reader.recv(4)
+    report = profiler.stop()
+    reader.close()
+    writer.close()
+    
+    assert report["network_wait_seconds"] >= 0.1
+    assert report["cpu_seconds"] < report["wall_seconds"]
+    assert (tmp_path / "profile.pstats").exists()
+    assert (tmp_path / "profile.collapsed").exists()
+    assert "network wait" in format_report(report)
+
+def test_tracing_spans_and_otlp_export(tmp_path):
+    """Test span nesting, error status and OTLP/JSON export"""
+    import json
+    from aria.utils.tracing import enable_tracing, export_otlp, format_waterfall, span, stop_tracing
+    
+    with span("disabled"):
+        pass
+    
+    enable_tracing()
+    try:
+        with span("outer", plan="demo") as outer:
+            with span("inner"):
+                pass
+            outer.set(tasks=3)
+        with pytest.raises(RuntimeError):
+            with span("failing"):
+                raise RuntimeError("boom")
+    finally:
+        spans = stop_tracing()
+    
+    by_name = {s.name: s for s in spans}
+    assert set(by_name) == {"outer", "inner", "failing"}
+    assert by_name["inner"].parent_id == by_name["outer"].span_id
+    assert by_name["inner"].trace_id == by_name["outer"].trace_id
+    assert by_name["outer"].attributes == {"plan": "demo", "tasks": 3}
+    
+    exported = json.loads(export_otlp(spans, tmp_path / "trace.json").read_text())
+    otlp_spans = exported["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    failing = next(s for s in otlp_spans if s["name"] == "failing")
+    assert failing["status"] == {"code": 2, "message": "boom"}
+    assert {"key": "tasks", "value": {"intValue": "3"}} in next(s for s in otlp_spans if s["name"] == "outer")["attributes"]
+    
+    waterfall = format_waterfall(spans).splitlines()
+    assert waterfall[0].startswith("outer")
+    assert waterfall[1].startswith("  inner")
+
+def test_paged_rendering_and_render_cache():
+    """Test paging across module boundaries and that cached renders follow task changes"""
+    import io
+    from aria.utils.formatting import iter_plan_tasks, page_bounds, stream_task_rows, create_project_tree
+    
+    plan = {"goal": "Test", "top_modules": [
+        {"name": "M1", "tasks": [{"id": f"p{i}", "title": f"Task {i}", "status": "pending"} for i in range(3)]},
+        {"name": "M2", "tasks": []},
+        {"name": "M3", "tasks": [{"id": f"p{i}", "title": f"Task {i}", "status": "pending"} for i in range(3, 7)]},
+    ]}
+    
+    assert page_bounds(7, 2, 3) == (3, 6, 3)
+    assert page_bounds(7) == (0, 7, 1)
+    with pytest.raises(ValueError, match="out of range"):
+        page_bounds(7, 4, 3)
+    assert [(module["name"], task["id"]) for module, task in iter_plan_tasks(plan, 2, 5)] == [
+        ("M1", "p2"), ("M3", "p3"), ("M3", "p4")
+    ]
+    
+    out = io.StringIO()
+    assert stream_task_rows(plan, out, page=3, limit=3) == 1
+    assert out.getvalue().splitlines()[1] == "M3\tp6\tTask 6\t0\tmedium\tpending\t"
+    
+    first = create_project_tree(plan, 1, 3).children[0].children[0]
+    assert create_project_tree(plan, 1, 3).children[0].children[0] is first
+    
+    plan["top_modules"][0]["tasks"][0]["status"] = "completed"
+    changed = create_project_tree(plan, 1, 3).children[0].children
+    assert changed[0] is not first and str(changed[0].label).startswith("✅")